@@ -226,20 +226,26 @@
 
 
 import streamlit as st
-import tensorflow as tf
 import numpy as np
 import pandas as pd
 import json
+import os
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-from predictor import UnifiedRealEstatePredictor
+from predictor import UnifiedRealEstatePredictor, MANIFEST_FILE
 from project_types import ProjectType
 from formulas import UnifiedCalculator  # Add this import
 
+# Trained models are saved here and reused on the next start
+MODEL_DIR = os.environ.get("PREDICTOR_MODEL_DIR", "artifacts")
+
 def init_systems():
     try:
-        predictor = UnifiedRealEstatePredictor()
+        if os.path.exists(os.path.join(MODEL_DIR, MANIFEST_FILE)):
+            predictor = UnifiedRealEstatePredictor.load(MODEL_DIR)
+        else:
+            predictor = UnifiedRealEstatePredictor()
         calculator = UnifiedCalculator()  # Add calculator initialization
         return predictor, calculator
     except Exception as e:
@@ -279,12 +285,17 @@ def create_streamlit_app():
         if analysis_type == "Predictive Analysis":
             epochs = st.slider("Training Epochs", 2, 10, 5)
             batch_size = st.slider("Batch Size", 64, 512, 128)
+            # Each process runs its own TensorFlow runtime, so keep the pool small on a shared server
+            processes = st.number_input("Training Processes", min_value=1,
+                                        max_value=min(4, os.cpu_count() or 1), value=1)
             if st.button("Train Model"):
                 with st.spinner("Training in progress..."):
                     try:
-                        for project_type in ProjectType:
-                            predictor.train_project_type(project_type, epochs=epochs)
-                        st.success("Model trained successfully!")
+                        histories = predictor.train_all(epochs=epochs, batch_size=batch_size,
+                                                        parallel=int(processes))
+                        predictor.save(MODEL_DIR)
+                        throughput = np.mean([np.mean(history['samples_per_sec']) for history in histories.values()])
+                        st.success(f"Model trained successfully! ({throughput:,.0f} samples/sec)")
                     except Exception as e:
                         st.error(f"Training error: {str(e)}")
 
@@ -351,7 +362,8 @@ def create_streamlit_app():
                         location=location,
                         land_area=land_area,
                         floors=floors,
-                        market_conditions=market_conditions
+                        market_conditions=market_conditions,
+                        report=False
                     )
                     display_prediction_results(result)
                 else:
@@ -396,8 +408,9 @@ def calculate_detailed_analysis(calculator, project_type, land_area, location, f
     elif project_type == ProjectType.ADMIN_BUILDING:
         return calculator.calculate_admin_building_analysis(**params)
 
-def display_prediction_results(result):
+def display_prediction_results(prediction):
     """Display AI prediction results"""
+    result = prediction.report()
     st.header("نتائج التحليل")
     
     # Project Details
@@ -0,0 +1,591 @@
+"""Performance benchmarks for the predictor and calculator.
+
+Run from the repository root, e.g.:
+
+    python benchmarks.py training-data --samples 100000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from project_types import ProjectType, BuildingRatios
+
+
+def _timed(fn, *args, repeat=1, **kwargs):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _legacy_generate_training_data(predictor, project_type, n_samples=1000):
+    """Per-sample reference generator kept for distribution and speed comparison"""
+    X = np.zeros((n_samples, 6))
+    y = np.zeros((n_samples, 4))
+
+    base_cost = predictor.base_costs[project_type]
+
+    for i in range(n_samples):
+        location_price = np.random.choice(list(predictor.location_prices.values()))
+        land_area = np.random.uniform(100, 50000)
+        floors = np.random.randint(1, 11)
+        ratios = BuildingRatios.create(floors)
+        effective_ratio = (ratios.ground_floor +
+                         (ratios.upper_floors * (floors - 2)) +
+                         ratios.top_floor) / floors
+        demand = np.random.uniform(0.8, 1.2)
+        competition = np.random.uniform(0.8, 1.2)
+
+        X[i] = [location_price, land_area, floors, effective_ratio, demand, competition]
+
+        buildable_area = land_area * effective_ratio * floors
+        land_cost = location_price * land_area * (1 + np.random.normal(0, 0.1))
+        construction_cost = base_cost * buildable_area * (1 + np.random.normal(0, 0.1))
+
+        total_cost = land_cost + construction_cost
+        sales_multiplier = 1.4 if project_type == ProjectType.SHOPPING_MALL else 1.3
+        rental_multiplier = 0.15 if project_type == ProjectType.SHOPPING_MALL else 0.08
+
+        sales_revenue = total_cost * sales_multiplier * demand * (2 - competition) * (1 + np.random.normal(0, 0.1))
+        rental_revenue = total_cost * rental_multiplier * demand * (1 + np.random.normal(0, 0.1))
+
+        y[i] = [land_cost, construction_cost, sales_revenue, rental_revenue]
+
+    return X, y
+
+
+def bench_training_data(args):
+    from predictor import UnifiedRealEstatePredictor
+
+    predictor = UnifiedRealEstatePredictor(seed=args.seed)
+    project_type = ProjectType.SHOPPING_MALL
+    legacy_samples = min(args.samples, args.legacy_samples)
+
+    np.random.seed(args.seed)
+    legacy_time, (X_old, y_old) = _timed(_legacy_generate_training_data, predictor, project_type, legacy_samples)
+    fast_time, (X_new, y_new) = _timed(predictor._generate_training_data, project_type, args.samples,
+                                       seed=args.seed, repeat=3)
+
+    legacy_rate = legacy_samples / legacy_time
+    fast_rate = args.samples / fast_time
+    print(f"legacy loop : {legacy_samples:>10,d} rows in {legacy_time:8.3f}s ({legacy_rate:,.0f} rows/s)")
+    print(f"vectorized  : {args.samples:>10,d} rows in {fast_time:8.3f}s ({fast_rate:,.0f} rows/s)")
+    print(f"speedup     : {fast_rate / legacy_rate:,.0f}x")
+
+    print("\ncolumn relative mean / std difference (vectorized vs legacy)")
+    names = ["location_price", "land_area", "floors", "effective_ratio", "demand", "competition",
+             "land_cost", "construction_cost", "sales_revenue", "rental_revenue"]
+    old = np.hstack([X_old, y_old])
+    new = np.hstack([X_new, y_new])
+    for i, name in enumerate(names):
+        mean_diff = abs(new[:, i].mean() / old[:, i].mean() - 1) * 100
+        std_diff = abs(new[:, i].std() / old[:, i].std() - 1) * 100
+        print(f"  {name:<18} mean {mean_diff:5.2f}%  std {std_diff:5.2f}%")
+
+
+def _random_portfolio(predictor, n_rows, seed, project_types=None):
+    rng = np.random.default_rng(seed)
+    return {
+        'project_type': rng.choice(list(project_types or ProjectType), n_rows),
+        'location': rng.choice(list(predictor.location_prices), n_rows),
+        'land_area': rng.integers(1, 501, n_rows) * 100.0,
+        'floors': rng.integers(1, 11, n_rows),
+        'demand': rng.choice([0.8, 1.0, 1.2], n_rows),
+        'competition': rng.choice([0.8, 1.0, 1.2], n_rows),
+    }
+
+
+def _train_all(predictor, epochs):
+    predictor.train_all(epochs=epochs)
+
+
+def bench_predict_many(args):
+    from predictor import UnifiedRealEstatePredictor
+
+    predictor = UnifiedRealEstatePredictor(seed=args.seed)
+    _train_all(predictor, args.epochs)
+    portfolio = _random_portfolio(predictor, args.rows, args.seed)
+
+    loop_rows = min(args.rows, args.loop_rows)
+    def predict_loop():
+        for i in range(loop_rows):
+            predictor.predict(portfolio['project_type'][i], portfolio['location'][i],
+                              portfolio['land_area'][i], int(portfolio['floors'][i]),
+                              {'demand_level': portfolio['demand'][i],
+                               'competition_level': portfolio['competition'][i]})
+
+    loop_time, _ = _timed(predict_loop)
+    batch_time, _ = _timed(predictor.predict_many, portfolio, repeat=3)
+
+    loop_rate = loop_rows / loop_time
+    batch_rate = args.rows / batch_time
+    print(f"predict loop : {loop_rows:>8,d} rows in {loop_time:8.3f}s ({loop_rate:,.0f} rows/s)")
+    print(f"predict_many : {args.rows:>8,d} rows in {batch_time:8.3f}s ({batch_rate:,.0f} rows/s)")
+    print(f"speedup      : {batch_rate / loop_rate:,.0f}x")
+
+
+def bench_sweep(args):
+    from predictor import UnifiedRealEstatePredictor
+
+    predictor = UnifiedRealEstatePredictor(seed=args.seed, cache_size=0, fast_inference=not args.keras)
+    project_type = ProjectType.VILLA
+    predictor.train_project_type(project_type, epochs=args.epochs)
+    land_areas = np.linspace(500, 25000, args.land_areas)
+    floors = np.arange(1, 11)
+    demands = [0.8, 1.0, 1.2]
+
+    def predict_loop():
+        for land_area in land_areas:
+            for floor in floors:
+                for demand in demands:
+                    predictor.predict(project_type, "الرياض", land_area, int(floor),
+                                      {'demand_level': demand, 'competition_level': 1.0})
+
+    cells = len(land_areas) * len(floors) * len(demands)
+    loop_time, _ = _timed(predict_loop)
+    sweep_time, _ = _timed(predictor.sweep, project_type, "الرياض", land_area=land_areas, floors=floors,
+                           demand=demands, repeat=5)
+    print(f"predict per cell : {cells:,d} cells in {loop_time:8.3f}s")
+    print(f"sweep            : {cells:,d} cells in {sweep_time:8.4f}s ({loop_time / sweep_time:,.0f}x)")
+
+
+def bench_latency(args):
+    from predictor import UnifiedRealEstatePredictor
+
+    # The prediction cache would turn repeated queries into dictionary lookups
+    predictor = UnifiedRealEstatePredictor(seed=args.seed, cache_size=0)
+    project_type = ProjectType.RESIDENTIAL
+    predictor.train_project_type(project_type, epochs=args.epochs)
+    predictor.train_ensemble(project_type, members=args.members, epochs=args.epochs)
+    market_conditions = {'demand_level': 1.0, 'competition_level': 1.0}
+
+    def keras_predict(land_area):
+        predictor.fast_inference = False
+        predictor.predict(project_type, "الرياض", land_area, 3, market_conditions)
+
+    def numpy_predict(land_area):
+        predictor.fast_inference = True
+        predictor.predict(project_type, "الرياض", land_area, 3, market_conditions)
+
+    def interval(land_area):
+        predictor.predict_interval(project_type, "الرياض", land_area, 3, market_conditions)
+
+    print(f"{'path':<26}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+    paths = (("keras predict", keras_predict), ("numpy forward", numpy_predict),
+             (f"ensemble interval ({args.members})", interval))
+    for name, call in paths:
+        samples = []
+        for i in range(args.warmup + args.calls):
+            start = time.perf_counter()
+            call(1000 + i % 50 * 100)
+            samples.append(time.perf_counter() - start)
+        p50, p99 = np.percentile(np.array(samples[args.warmup:]) * 1000, [50, 99])
+        print(f"{name:<26}{p50:>10.3f}{p99:>10.3f}")
+
+
+_STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from predictor import UnifiedRealEstatePredictor
+from numpy_predictor import NumpyPredictor
+from formulas import UnifiedCalculator
+from project_types import ProjectType
+imported = time.perf_counter()
+if sys.argv[1] == "detailed":
+    UnifiedCalculator().calculate_mall_context(land_area=1000, location="حي النرجس", floors=3)
+else:
+    if sys.argv[1] == "numpy":
+        predictor = NumpyPredictor.load(sys.argv[3])
+    else:
+        predictor = UnifiedRealEstatePredictor.load(sys.argv[2])
+    predictor.predict(ProjectType.RESIDENTIAL, "الرياض", 1000, 3,
+                      {"demand_level": 1.0, "competition_level": 1.0})
+done = time.perf_counter()
+with open("/proc/self/status") as status:
+    peak_kb = next(int(line.split()[1]) for line in status if line.startswith("VmHWM"))
+print(json.dumps({
+    "import": imported - start,
+    "first_request": done - imported,
+    "max_rss_mb": peak_kb / 1024,
+    "tensorflow_loaded": "tensorflow" in sys.modules
+}))
+"""
+
+
+def bench_startup(args):
+    """Cold-start cost of each analysis mode, measured in fresh interpreters (Linux only)"""
+    from predictor import UnifiedRealEstatePredictor
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as model_dir:
+        predictor = UnifiedRealEstatePredictor(seed=args.seed)
+        _train_all(predictor, 1)
+        predictor.save(model_dir)
+        export_file = os.path.join(model_dir, "model.npz")
+        predictor.export_numpy(export_file)
+
+        print(f"{'mode':<12}{'import (s)':>12}{'first request (s)':>20}{'max RSS (MB)':>15}{'TensorFlow':>12}")
+        for mode in ("detailed", "predictive", "numpy"):
+            runs = []
+            for _ in range(args.runs):
+                output = subprocess.run([sys.executable, "-c", _STARTUP_SCRIPT, mode, model_dir, export_file],
+                                        cwd=root, capture_output=True, text=True, check=True).stdout
+                runs.append(json.loads(output.strip().splitlines()[-1]))
+            median = {key: float(np.median([run[key] for run in runs]))
+                      for key in ("import", "first_request", "max_rss_mb")}
+            loaded = "yes" if runs[-1]["tensorflow_loaded"] else "no"
+            print(f"{mode:<12}{median['import']:>12.3f}{median['first_request']:>20.3f}"
+                  f"{median['max_rss_mb']:>15.0f}{loaded:>12}")
+
+
+def bench_train_all(args):
+    from predictor import UnifiedRealEstatePredictor
+
+    parallel = args.parallel or os.cpu_count() or 1
+    sequential_time, _ = _timed(UnifiedRealEstatePredictor(seed=args.seed).train_all, epochs=args.epochs)
+    parallel_time, _ = _timed(UnifiedRealEstatePredictor(seed=args.seed).train_all, epochs=args.epochs,
+                              parallel=parallel)
+    print(f"sequential     : {sequential_time:8.2f}s")
+    print(f"parallel ({parallel:>2d}) : {parallel_time:8.2f}s")
+    print(f"speedup        : {sequential_time / parallel_time:.1f}x")
+
+
+def _validation_portfolio(predictor, n_per_type, seed):
+    """Fresh synthetic rows of every project type with their noisy targets"""
+    frames = []
+    for offset, project_type in enumerate(ProjectType):
+        X, y = predictor._generate_training_data(project_type, n_per_type, seed=seed + offset)
+        frames.append({
+            'project_type': [project_type] * n_per_type,
+            'location_price': X[:, 0], 'land_area': X[:, 1], 'floors': X[:, 2].astype(int),
+            'demand': X[:, 4], 'competition': X[:, 5], 'y': y
+        })
+    price_to_location = {price: location for location, price in predictor.location_prices.items()}
+    portfolio = {
+        'project_type': sum((frame['project_type'] for frame in frames), []),
+        'location': [price_to_location[price] for frame in frames for price in frame['location_price']],
+    }
+    for column in ('land_area', 'floors', 'demand', 'competition'):
+        portfolio[column] = np.concatenate([frame[column] for frame in frames])
+    return portfolio, np.vstack([frame['y'] for frame in frames])
+
+
+def _mape(predictions, y):
+    columns = ['land_cost', 'construction_cost', 'sales_revenue', 'rental_revenue']
+    return np.mean(np.abs(predictions[columns].to_numpy() / y - 1)) * 100
+
+
+def _weights_mb(predictor):
+    return sum(w.nbytes for model in predictor.models.values() for w in model.get_weights()) / 2**20
+
+
+def bench_shared_model(args):
+    from predictor import UnifiedRealEstatePredictor
+
+    per_type = UnifiedRealEstatePredictor(seed=args.seed)
+    shared = UnifiedRealEstatePredictor(seed=args.seed, shared_model=True)
+    portfolio, y = _validation_portfolio(per_type, args.validation_rows, args.seed + 1000)
+
+    print(f"{'model':<10}{'train (s)':>10}{'MAPE (%)':>10}{'weights (MB)':>14}{'rows/s':>14}")
+    for name, predictor in (("per-type", per_type), ("shared", shared)):
+        train_time, _ = _timed(predictor.train_all, epochs=args.epochs)
+        predictions = predictor.predict_many(portfolio)
+        score_time, _ = _timed(predictor.predict_many, portfolio, repeat=5)
+        print(f"{name:<10}{train_time:>10.1f}{_mape(predictions, y):>10.2f}{_weights_mb(predictor):>14.3f}"
+              f"{len(y) / score_time:>14,.0f}")
+
+
+def bench_estimators(args):
+    from predictor import UnifiedRealEstatePredictor
+    from estimators import ESTIMATORS
+
+    market_conditions = {'demand_level': 1.0, 'competition_level': 1.0}
+    print(f"{'estimator':<15}{'train (s)':>10}{'p50 (ms)':>10}{'rows/s':>14}{'MAPE (%)':>10}")
+    for estimator in ESTIMATORS:
+        predictor = UnifiedRealEstatePredictor(seed=args.seed, cache_size=0, estimator=estimator)
+        portfolio, y = _validation_portfolio(predictor, args.validation_rows, args.seed + 1000)
+        train_time, _ = _timed(predictor.train_all, epochs=args.epochs)
+        samples = []
+        for i in range(args.calls):
+            start = time.perf_counter()
+            predictor.predict(ProjectType.RESIDENTIAL, "الرياض", 1000 + i % 50 * 100, 3, market_conditions)
+            samples.append(time.perf_counter() - start)
+        predictions = predictor.predict_many(portfolio)
+        score_time, _ = _timed(predictor.predict_many, portfolio, repeat=5)
+        print(f"{estimator:<15}{train_time:>10.2f}{np.median(samples) * 1000:>10.3f}"
+              f"{len(y) / score_time:>14,.0f}{_mape(predictions, y):>10.2f}")
+
+
+def bench_quantization(args):
+    from predictor import UnifiedRealEstatePredictor
+    from numpy_predictor import NumpyPredictor, PRECISIONS
+
+    reference = UnifiedRealEstatePredictor(seed=args.seed)
+    _train_all(reference, args.epochs)
+    portfolio, _ = _validation_portfolio(reference, args.validation_rows, args.seed + 1000)
+    columns = ['land_cost', 'construction_cost', 'sales_revenue', 'rental_revenue']
+    expected = reference.predict_many(portfolio)
+
+    print(f"{'precision':<10}{'weights (KB)':>13}{'rows/s':>12}{'mean err':>12}{'max err':>12}"
+          f"{'risk changed':>14}")
+    with tempfile.TemporaryDirectory() as export_dir:
+        export_file = os.path.join(export_dir, "model.npz")
+        reference.export_numpy(export_file)
+        for precision in PRECISIONS:
+            predictor = NumpyPredictor.load(export_file, precision)
+            score_time, actual = _timed(predictor.predict_many, portfolio, repeat=5)
+            # Relative to each output's mean magnitude, so near-zero predictions don't dominate
+            scale = np.abs(expected[columns].to_numpy()).mean(axis=0)
+            error = np.abs(actual[columns].to_numpy() - expected[columns].to_numpy()) / scale
+            risk_changed = np.mean(actual['risk_level'] != expected['risk_level']) * 100
+            print(f"{precision:<10}{predictor.weight_bytes() / 1024:>13.1f}{len(actual) / score_time:>12,.0f}"
+                  f"{error.mean():>12.2e}{error.max():>12.2e}{risk_changed:>13.2f}%")
+
+
+def bench_dataset_cache(args):
+    from predictor import UnifiedRealEstatePredictor
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        predictor = UnifiedRealEstatePredictor(seed=args.seed, dataset_cache_dir=cache_dir)
+
+        def load_all():
+            for project_type in ProjectType:
+                X, y = predictor._training_data(project_type, args.samples)
+                # Touch every row so the comparison includes reading the data
+                X.sum(), y.sum()
+
+        first_time, _ = _timed(load_all)
+        reuse_time, _ = _timed(load_all, repeat=3)
+    print(f"generate + write : {first_time:8.3f}s for 8 x {args.samples:,d} rows")
+    print(f"memory-mapped    : {reuse_time:8.3f}s")
+
+
+def bench_portfolio(args):
+    from formulas import UnifiedCalculator
+
+    calculator = UnifiedCalculator()
+    rng = np.random.default_rng(args.seed)
+    land_areas = rng.uniform(500, 25000, args.rows).round()
+    locations = rng.choice(list(calculator.location_prices), args.rows)
+    floors = rng.integers(2, 11, args.rows)
+
+    def calculate_loop():
+        for i in range(min(args.loop_rows, args.rows)):
+            calculator.calculate_residential_context(land_areas[i], locations[i], int(floors[i]))
+
+    loop_rows = min(args.loop_rows, args.rows)
+    loop_time, _ = _timed(calculate_loop)
+    single_time, _ = _timed(calculator.calculate_portfolio, ProjectType.RESIDENTIAL, land_areas, locations,
+                            floors, repeat=3)
+    types = rng.choice([project_type.name for project_type in ProjectType], args.rows)
+    mixed_time, _ = _timed(calculator.calculate_portfolio, types, land_areas, locations, floors, repeat=3)
+    print(f"calculate_residential_context : {loop_rows / loop_time:12,.0f} rows/s")
+    print(f"calculate_portfolio, one type : {args.rows / single_time:12,.0f} rows/s "
+          f"({args.rows:,d} rows in {single_time:.3f}s)")
+    print(f"calculate_portfolio, mixed    : {args.rows / mixed_time:12,.0f} rows/s "
+          f"({args.rows:,d} rows in {mixed_time:.3f}s)")
+
+
+def bench_calculator(args):
+    from formulas import UnifiedCalculator, ProjectType as CalculatorType
+
+    calculator = UnifiedCalculator()
+    location = next(iter(calculator.location_prices))
+    calls = {
+        CalculatorType.SHOPPING_MALL: lambda report: calculator.calculate_mall_context(
+            args.land_area, location, args.floors, report=report),
+        CalculatorType.RESIDENTIAL: lambda report: calculator.calculate_residential_context(
+            args.land_area, location, args.floors, report=report),
+        CalculatorType.COMMERCIAL: lambda report: calculator.calculate_commercial_context(
+            args.land_area, location, args.floors, report=report),
+        CalculatorType.MIXED_USE: lambda report: calculator.calculate_mixed_use_context(
+            args.land_area, location, args.floors, report=report),
+        CalculatorType.VILLA: lambda report: calculator.calculate_villa_context(
+            args.land_area, location, report=report),
+        CalculatorType.SINGLE_VILLA: lambda report: calculator.calculate_villa_analysis(
+            args.land_area, location, report=report),
+        CalculatorType.RESIDENTIAL_COMPOUND: lambda report: calculator.calculate_compound_analysis(
+            args.land_area, location, report=report),
+        CalculatorType.ADMIN_BUILDING: lambda report: calculator.calculate_admin_building_analysis(
+            args.land_area, location, report=report),
+    }
+
+    def call_loop(fn, report):
+        for _ in range(args.calls):
+            fn(report)
+
+    print(f"{'project type':22s} {'report':>10s} {'numbers':>10s}")
+    for project_type, fn in calls.items():
+        report_time, _ = _timed(call_loop, fn, True, repeat=3)
+        numbers_time, _ = _timed(call_loop, fn, False, repeat=3)
+        print(f"{project_type.name:22s} {report_time / args.calls * 1e6:8.1f}us "
+              f"{numbers_time / args.calls * 1e6:8.1f}us  ({report_time / numbers_time:.1f}x)")
+
+
+def bench_reports(args):
+    from formulas import UnifiedCalculator
+
+    calculator = UnifiedCalculator()
+    rng = np.random.default_rng(args.seed)
+    land_areas = rng.uniform(500, 25000, args.reports).round()
+    locations = rng.choice(list(calculator.location_prices), args.reports)
+    floors = rng.integers(2, 11, args.reports)
+    methods = {
+        'mall': lambda i: calculator.calculate_mall_context(land_areas[i], locations[i], int(floors[i]), report=False),
+        'residential': lambda i: calculator.calculate_residential_context(land_areas[i], locations[i], int(floors[i]),
+                                                                          report=False),
+        'commercial': lambda i: calculator.calculate_commercial_context(land_areas[i], locations[i], int(floors[i]),
+                                                                        report=False),
+        'mixed use': lambda i: calculator.calculate_mixed_use_context(land_areas[i], locations[i], int(floors[i]),
+                                                                      report=False),
+        'villa compound': lambda i: calculator.calculate_villa_context(land_areas[i], locations[i], report=False),
+        'single villa': lambda i: calculator.calculate_villa_analysis(land_areas[i], locations[i], report=False),
+        'compound': lambda i: calculator.calculate_compound_analysis(land_areas[i], locations[i], report=False),
+        'admin building': lambda i: calculator.calculate_admin_building_analysis(land_areas[i], locations[i],
+                                                                                 report=False),
+    }
+
+    def render(results):
+        for result in results:
+            result.report()
+
+    total_time = 0
+    for name, method in methods.items():
+        results = [method(i) for i in range(args.reports)]
+        render_time, _ = _timed(render, results, repeat=3)
+        total_time += render_time
+        print(f"{name:15s} {args.reports / render_time:10,.0f} reports/s")
+    print(f"{'all types':15s} {len(methods) * args.reports / total_time:10,.0f} reports/s")
+
+
+def bench_optimize(args):
+    from formulas import UnifiedCalculator
+
+    calculator = UnifiedCalculator()
+    rng = np.random.default_rng(args.seed)
+    land_areas = rng.uniform(500, 25000, args.parcels).round()
+    locations = rng.choice(list(calculator.location_prices), args.parcels)
+
+    samples = []
+    for i in range(args.calls):
+        start = time.perf_counter()
+        calculator.optimize_parcel(land_areas[i % args.parcels], locations[i % args.parcels], objective=args.objective)
+        samples.append(time.perf_counter() - start)
+    p50, p99 = np.percentile(np.array(samples) * 1000, [50, 99])
+    portfolio_time, ranked = _timed(calculator.optimize_parcel, land_areas, locations, objective=args.objective,
+                                    top=1, repeat=3)
+    print(f"one parcel per call : p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+    print(f"whole portfolio     : {args.parcels / portfolio_time:10,.0f} parcels/s "
+          f"({args.parcels:,d} parcels in {portfolio_time:.3f}s)")
+    print("best use            :", ranked['project_type'].value_counts().to_dict())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    training_data = subparsers.add_parser("training-data", help="synthetic training data generation")
+    training_data.add_argument("--samples", type=int, default=1_000_000)
+    training_data.add_argument("--legacy-samples", type=int, default=20_000,
+                               help="cap on rows generated by the per-sample loop")
+    training_data.add_argument("--seed", type=int, default=0)
+    training_data.set_defaults(func=bench_training_data)
+
+    predict_many = subparsers.add_parser("predict-many", help="batch scoring vs. per-row predict")
+    predict_many.add_argument("--rows", type=int, default=50_000)
+    predict_many.add_argument("--loop-rows", type=int, default=200,
+                              help="cap on rows scored one at a time with predict")
+    predict_many.add_argument("--epochs", type=int, default=2)
+    predict_many.add_argument("--seed", type=int, default=0)
+    predict_many.set_defaults(func=bench_predict_many)
+
+    sweep = subparsers.add_parser("sweep", help="scenario grid via sweep vs. predict per cell")
+    sweep.add_argument("--land-areas", type=int, default=50, help="land area steps (x 10 floors x 3 demand)")
+    sweep.add_argument("--epochs", type=int, default=2)
+    sweep.add_argument("--keras", action="store_true", help="run predict through Keras Model.predict")
+    sweep.add_argument("--seed", type=int, default=0)
+    sweep.set_defaults(func=bench_sweep)
+
+    latency = subparsers.add_parser("latency", help="single-row predict latency, Keras vs. NumPy")
+    latency.add_argument("--calls", type=int, default=500)
+    latency.add_argument("--warmup", type=int, default=20)
+    latency.add_argument("--epochs", type=int, default=2)
+    latency.add_argument("--members", type=int, default=5, help="ensemble size for predict_interval")
+    latency.add_argument("--seed", type=int, default=0)
+    latency.set_defaults(func=bench_latency)
+
+    startup = subparsers.add_parser("startup", help="import time and first-request latency per analysis mode")
+    startup.add_argument("--runs", type=int, default=3)
+    startup.add_argument("--seed", type=int, default=0)
+    startup.set_defaults(func=bench_startup)
+
+    train_all = subparsers.add_parser("train-all", help="sequential vs. process-pool training of all types")
+    train_all.add_argument("--epochs", type=int, default=50)
+    train_all.add_argument("--parallel", type=int, default=None, help="worker processes (default: CPU count)")
+    train_all.add_argument("--seed", type=int, default=0)
+    train_all.set_defaults(func=bench_train_all)
+
+    shared_model = subparsers.add_parser("shared-model", help="per-type models vs. one shared multi-task model")
+    shared_model.add_argument("--epochs", type=int, default=50)
+    shared_model.add_argument("--validation-rows", type=int, default=2_000, help="rows per project type")
+    shared_model.add_argument("--seed", type=int, default=0)
+    shared_model.set_defaults(func=bench_shared_model)
+
+    estimators = subparsers.add_parser("estimators", help="Keras networks vs. closed-form least squares")
+    estimators.add_argument("--epochs", type=int, default=50)
+    estimators.add_argument("--calls", type=int, default=1_000, help="single-row predict calls")
+    estimators.add_argument("--validation-rows", type=int, default=2_000, help="rows per project type")
+    estimators.add_argument("--seed", type=int, default=0)
+    estimators.set_defaults(func=bench_estimators)
+
+    quantization = subparsers.add_parser("quantization", help="float16/int8 NumpyPredictor accuracy and speed")
+    quantization.add_argument("--epochs", type=int, default=10)
+    quantization.add_argument("--validation-rows", type=int, default=25_000, help="rows per project type")
+    quantization.add_argument("--seed", type=int, default=0)
+    quantization.set_defaults(func=bench_quantization)
+
+    dataset_cache = subparsers.add_parser("dataset-cache", help="generated vs. memory-mapped training sets")
+    dataset_cache.add_argument("--samples", type=int, default=1_000_000, help="rows per project type")
+    dataset_cache.add_argument("--seed", type=int, default=0)
+    dataset_cache.set_defaults(func=bench_dataset_cache)
+
+    portfolio = subparsers.add_parser("portfolio", help="calculate_* per parcel vs. the columnar portfolio engine")
+    portfolio.add_argument("--rows", type=int, default=1_000_000)
+    portfolio.add_argument("--loop-rows", type=int, default=5_000,
+                           help="cap on parcels run through calculate_residential_context")
+    portfolio.add_argument("--seed", type=int, default=0)
+    portfolio.set_defaults(func=bench_portfolio)
+
+    calculator = subparsers.add_parser("calculator", help="calculate_* with the Arabic report vs. numbers only")
+    calculator.add_argument("--calls", type=int, default=5_000, help="calls per project type and mode")
+    calculator.add_argument("--land-area", type=float, default=1_500)
+    calculator.add_argument("--floors", type=int, default=5)
+    calculator.set_defaults(func=bench_calculator)
+
+    reports = subparsers.add_parser("reports", help="Arabic report rendering from numeric calculator results")
+    reports.add_argument("--reports", type=int, default=5_000, help="reports per project type")
+    reports.add_argument("--seed", type=int, default=0)
+    reports.set_defaults(func=bench_reports)
+
+    optimize = subparsers.add_parser("optimize", help="best-use search over project types and floor counts")
+    optimize.add_argument("--parcels", type=int, default=100_000)
+    optimize.add_argument("--calls", type=int, default=500, help="single-parcel optimize_parcel calls")
+    optimize.add_argument("--objective", default="gross_margin")
+    optimize.add_argument("--seed", type=int, default=0)
+    optimize.set_defaults(func=bench_optimize)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import time
+from collections import namedtuple
+from itertools import combinations_with_replacement
+
+import numpy as np
+
+# Model backends UnifiedRealEstatePredictor can train per project type
+ESTIMATORS = ('keras', 'least_squares')
+
+# Attributes that hold a LeastSquaresEstimator's accumulated normal equations
+NORMAL_EQUATIONS = ('gram', 'moment', 'n_fit')
+
+# Mirrors the History object Keras' Model.fit returns
+FitHistory = namedtuple('FitHistory', ['history'])
+
+
+class LeastSquaresEstimator:
+    """Polynomial regression of log targets on log features, solved in closed form.
+
+    The synthetic targets are products of the features (land cost = price x area,
+    construction = base cost x area x ratio x floors, ...), so they are close to
+    linear in log space. The first `n_numeric` input columns must be positive and
+    are log-transformed. Any further columns, such as a one-hot project type, enter
+    linearly and act as multiplicative factors.
+
+    Like the Keras models, it carries the predictor's normalization stats
+    (X_mean, X_std, y_mean, y_std) and is evaluated on normalized rows through
+    `forward`. The normal equations of the fitted rows are kept, so `partial_fit`
+    can add rows without revisiting the old ones.
+    """
+
+    def __init__(self, degree: int = 2, n_numeric: int = 6):
+        self.degree = degree
+        self.n_numeric = n_numeric
+        # Every monomial up to `degree` as column indices into [1, log x_1, ..., log x_n]
+        self._terms = np.array(list(combinations_with_replacement(range(n_numeric + 1), degree)))
+        self.coef = None
+        # Duan smearing factors: exp of the log-space fit estimates the median, this corrects to the mean
+        self.smearing = None
+        # Normal equations A'A and A'log(y) of the n_fit rows fitted so far
+        self.gram = None
+        self.moment = None
+        self.n_fit = 0
+
+    def _design(self, X: np.ndarray) -> np.ndarray:
+        logs = np.column_stack([np.ones(len(X)), np.log(X[:, :self.n_numeric])])
+        return np.hstack([logs[:, self._terms].prod(axis=2), X[:, self.n_numeric:]])
+
+    def _check_inputs(self, X: np.ndarray, y: np.ndarray) -> None:
+        """Reject rows the log-space fit cannot take: non-positive or non-finite features or targets"""
+        numeric = X[:, :self.n_numeric]
+        if not (np.isfinite(numeric).all() and np.isfinite(y).all() and (numeric > 0).all() and (y > 0).all()):
+            raise ValueError("The least-squares estimator needs positive, finite features and targets")
+
+    def fit(self, X, y, validation_split: float = 0.2) -> FitHistory:
+        """Fit on the leading rows and report Keras-style metrics on the held-out tail.
+
+        Loss and MAE are measured on targets scaled by y_std, so they compare
+        with the Keras models' normalized loss.
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self._check_inputs(X, y)
+        split = int(len(X) * (1 - validation_split))
+        start = time.perf_counter()
+        A = self._design(X[:split])
+        log_y = np.log(y[:split])
+        self.coef = np.linalg.lstsq(A, log_y, rcond=None)[0]
+        self.smearing = np.exp(log_y - A @ self.coef).mean(axis=0)
+        self.gram, self.moment, self.n_fit = A.T @ A, A.T @ log_y, split
+        elapsed = time.perf_counter() - start
+
+        history = {}
+        for prefix, rows in (('', slice(None, split)), ('val_', slice(split, None))):
+            self._record_errors(history, prefix, X[rows], y[rows])
+        history['epoch_time'] = [elapsed]
+        history['samples_per_sec'] = [split / elapsed]
+        return FitHistory(history)
+
+    def fit_stream(self, train, validation) -> FitHistory:
+        """Like fit, but over chunked rows that are never held in memory at once.
+
+        train and validation return a fresh iterator of (X, y) chunks per call.
+        One pass over the training rows accumulates the normal equations, a
+        second sets the smearing factors, then both sets are read once more for
+        the metrics.
+        """
+        start = time.perf_counter()
+        self.gram = self.moment = 0
+        self.n_fit = 0
+        for X, y in train():
+            self._check_inputs(X, y)
+            A = self._design(X)
+            self.gram = self.gram + A.T @ A
+            self.moment = self.moment + A.T @ np.log(y)
+            self.n_fit += len(X)
+        self.coef = np.linalg.lstsq(self.gram, self.moment, rcond=None)[0]
+        self.smearing = sum(np.exp(np.log(y) - self._design(X) @ self.coef).sum(axis=0)
+                            for X, y in train()) / self.n_fit
+        elapsed = time.perf_counter() - start
+
+        history = {}
+        for prefix, chunks in (('', train), ('val_', validation)):
+            squared = absolute = count = 0
+            for X, y in chunks():
+                error = (self.predict(X) - y) / self.y_std
+                squared += np.sum(error ** 2)
+                absolute += np.sum(np.abs(error))
+                count += error.size
+            history[f'{prefix}loss'] = [float(squared / count) if count else float('nan')]
+            history[f'{prefix}mae'] = [float(absolute / count) if count else float('nan')]
+        history['epoch_time'] = [elapsed]
+        history['samples_per_sec'] = [self.n_fit / elapsed]
+        return FitHistory(history)
+
+    def partial_fit(self, X, y) -> FitHistory:
+        """Add rows to the normal equations and re-solve the coefficients.
+
+        Earlier rows are not revisited, so the smearing factors become the
+        row-weighted mean of the previous factors and those of the new rows.
+        Loss and MAE are measured on the new rows. The model is left unchanged
+        if the rows are invalid or the solve fails.
+        """
+        if self.gram is None:
+            raise ValueError("This model was saved without its normal equations; retrain it to update it")
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self._check_inputs(X, y)
+        start = time.perf_counter()
+        A = self._design(X)
+        log_y = np.log(y)
+        gram = self.gram + A.T @ A
+        moment = self.moment + A.T @ log_y
+        coef = np.linalg.lstsq(gram, moment, rcond=None)[0]
+        n_fit = self.n_fit + len(X)
+        smearing = (self.smearing * self.n_fit + np.exp(log_y - A @ coef).sum(axis=0)) / n_fit
+        if not (np.isfinite(coef).all() and np.isfinite(smearing).all()):
+            raise ValueError("The updated least-squares solution is not finite; the model was left unchanged")
+        self.gram, self.moment, self.coef, self.smearing, self.n_fit = gram, moment, coef, smearing, n_fit
+        elapsed = time.perf_counter() - start
+
+        history = {}
+        self._record_errors(history, '', X, y)
+        history['epoch_time'] = [elapsed]
+        history['samples_per_sec'] = [len(X) / elapsed]
+        return FitHistory(history)
+
+    def _record_errors(self, history: dict, prefix: str, X: np.ndarray, y: np.ndarray) -> None:
+        error = (self.predict(X) - y) / self.y_std
+        history[f'{prefix}loss'] = [float(np.mean(error ** 2))]
+        history[f'{prefix}mae'] = [float(np.mean(np.abs(error)))]
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Targets for raw feature rows"""
+        return np.exp(self._design(X) @ self.coef) * self.smearing
+
+    def forward(self, X_norm: np.ndarray) -> np.ndarray:
+        """Normalized targets for normalized feature rows, like a Keras model's output"""
+        X = X_norm.astype(float)
+        X[:, :self.n_numeric] = X[:, :self.n_numeric] * self.X_std + self.X_mean
+        return (self.predict(X) - self.y_mean) / self.y_std
+
+    def get_weights(self) -> list:
+        return [self.coef, self.smearing]
+
+    def set_weights(self, weights: list) -> None:
+        self.coef, self.smearing = weights
+
+    def save(self, path: str) -> None:
+        np.savez(path, coef=self.coef, smearing=self.smearing, degree=self.degree, n_numeric=self.n_numeric,
+                 gram=self.gram, moment=self.moment, n_fit=self.n_fit)
+
+    @classmethod
+    def load(cls, path: str) -> 'LeastSquaresEstimator':
+        with np.load(path) as data:
+            estimator = cls(int(data['degree']), int(data['n_numeric']))
+            estimator.set_weights([data['coef'], data['smearing']])
+            # Artifacts written before partial_fit support lack the normal equations
+            if 'gram' in data.files:
+                estimator.gram, estimator.moment = data['gram'], data['moment']
+                estimator.n_fit = int(data['n_fit'])
+        return estimator
@@ -4,6 +4,12 @@ from typing import Dict, Any
 import json
 import locale
 
+import numpy as np
+import pandas as pd
+
+from project_types import BUILDING_RATIOS
+from templates import Slot, compile_template
+
 class ProjectType(Enum):
     SHOPPING_MALL = "مول تجاري"
     RESIDENTIAL = "سكني"
@@ -14,104 +20,177 @@ class ProjectType(Enum):
     RESIDENTIAL_COMPOUND = "مجمع سكني"
     ADMIN_BUILDING = "مبنى إداري"  # Add this line
 
-@dataclass
-class BuildingRatios:
-    ground_floor: float
-    upper_floors: float
-    top_floor: float
-
-    @classmethod
-    def create(cls, floors: int):
-        if floors > 4:
-            return cls(
-                ground_floor=0.35,
-                upper_floors=0.45,
-                top_floor=0.70
-            )
-        else:
-            return cls(
-                ground_floor=0.65,
-                upper_floors=0.75,
-                top_floor=0.70
-            )
-
-class CommercialRatios(BuildingRatios):
-    pass
-
-# Add to the top of the file with other imports and classes
-@dataclass
-class VillaBuildingRatios:
-    ground_floor: float
-    first_floor: float
-    top_floor: float
-
-    @classmethod
-    def create(cls, floors: int) -> 'VillaBuildingRatios':
-        if floors > 4:
-            return cls(ground_floor=0.35, first_floor=0.45, top_floor=0.70)
-        else:
-            return cls(ground_floor=0.65, first_floor=0.75, top_floor=0.70)
-@dataclass
-class AdminBuildingRatios:
-    def __init__(self, floors: int):
-        if floors > 4:
-            self.ground_floor = 0.35
-            self.first_floor = 0.45
-            self.top_floor = 0.70
-        else:
-            self.ground_floor = 0.65
-            self.first_floor = 0.75
-            self.top_floor = 0.70
-
-
-@dataclass
-class SingleVillaBuildingRatios:
-    def __init__(self, floors: int):
-        if floors > 4:
-            self.ground_floor = 0.35
-            self.first_floor = 0.45
-            self.top_floor = 0.70
-        else:
-            self.ground_floor = 0.65
-            self.first_floor = 0.75
-            self.top_floor = 0.70
-
-@dataclass
-class CompoundBuildingRatios:
-    def __init__(self, floors: int):
-        if floors > 4:
-            self.ground_floor = 0.35
-            self.first_floor = 0.45
-            self.top_floor = 0.70
-        else:
-            self.ground_floor = 0.65
-            self.first_floor = 0.75
-            self.top_floor = 0.70
-
-
-@dataclass
-class MixedUseRatios:
-    ground_floor: float
-    first_floor: float
-    repeated_floors: float
-    top_floor: float
-
-    @classmethod
-    def create(cls, floors: int):
-        if floors > 4:
-            return cls(
-                ground_floor=0.35,
-                first_floor=0.45,
-                repeated_floors=0.45,
-                top_floor=0.70
-            )
-        else:
-            return cls(
-                ground_floor=0.65,
-                first_floor=0.75,
-                repeated_floors=0.75,
-                top_floor=0.70
-            )
+# Inputs of each calculate_* method, for UnifiedCalculator.calculate_portfolio.
+# layout: how floor areas are derived from the land area ("tower": ground + upper floors + top annex,
+#   "residential": like tower with one more repeated floor, "mixed_use", "compound" and "villas").
+# floors: fixed floor count, or None when the caller picks it.
+# land_price: fixed price per sqm, or None for the location's price; default_price is used for
+#   unknown locations, types without one raise KeyError like self.location_prices[location].
+# segments: (construction cost per sqm, sale price, annual rent as a multiple of the land price) per use.
+#   The sale price is per sqm for types with a fixed land price and a multiple of the location's price
+#   otherwise. Mixed use has a commercial and a residential segment.
+# unit_sizes: average unit size per segment, 0 for a single unit. Villa compounds count villas.
+# additional: design, legal and landscaping costs, added to construction one by one (mall) or as a sum.
+# inline: the method multiplies area * land price * rate left to right and takes net rent as 80% of rent,
+#   instead of pricing per sqm first. Kept so results match to the last bit, not only to the cent.
+PORTFOLIO_TYPES = {
+    'SHOPPING_MALL': dict(layout='tower', floors=None, land_price=5000, additional=[500000, 300000, 200000],
+                          segments=[(2500, 8000, 0.18)], unit_sizes=[115]),
+    'RESIDENTIAL': dict(layout='residential', floors=None, land_price=None, default_price=5700,
+                        additional=[450000], segments=[(1400, 1.2, 0.09)], unit_sizes=[135]),
+    'COMMERCIAL': dict(layout='tower', floors=None, land_price=3500, additional=[450000],
+                       segments=[(1400, 2500, 0.18)], unit_sizes=[75]),
+    'MIXED_USE': dict(layout='mixed_use', floors=None, land_price=None, default_price=5700,
+                      additional=[650000], segments=[(1800, 1.4, 0.12), (1400, 1.2, 0.08)],
+                      unit_sizes=[80, 100]),
+    'VILLA': dict(layout='villas', floors=3, land_price=None, inline=True, additional=[450000],
+                  segments=[(2000, 1.4, 0.08)], unit_sizes=[0]),
+    'SINGLE_VILLA': dict(layout='tower', floors=3, land_price=None, inline=True, additional=[450000],
+                         segments=[(1400, 1.2, 0.09)], unit_sizes=[0]),
+    'RESIDENTIAL_COMPOUND': dict(layout='compound', floors=4, land_price=None, inline=True, additional=[450000],
+                                 segments=[(1400, 1.3, 0.09)], unit_sizes=[120]),
+    'ADMIN_BUILDING': dict(layout='tower', floors=4, land_price=None, inline=True, additional=[450000],
+                           segments=[(1400, 1.4, 0.18)], unit_sizes=[150]),
+}
+
+# Layouts of PORTFOLIO_TYPES, and how many floors below the top annex are not repeated floors
+_LAYOUTS = ('tower', 'residential', 'mixed_use', 'villas', 'compound')
+_FLOOR_OFFSETS = {'residential': 1, 'mixed_use': 3}
+
+
+def _portfolio_arrays(types: dict) -> dict:
+    """PORTFOLIO_TYPES as arrays indexed by type code (position in types), for one pass over mixed types.
+
+    Absent prices are NaN. Absent floors, second segments, unit sizes and additional costs are 0,
+    which leaves every sum they enter bit-identical.
+    """
+    def padded(values, width):
+        return np.array([list(row) + [0] * (width - len(row)) for row in values], dtype=float)
+
+    specs = list(types.values())
+    return {
+        'layout': np.array([_LAYOUTS.index(spec['layout']) for spec in specs]),
+        'floors': np.array([spec['floors'] or 0 for spec in specs]),
+        'floor_offset': np.array([_FLOOR_OFFSETS.get(spec['layout'], 2) for spec in specs]),
+        'land_price': np.array([spec['land_price'] or np.nan for spec in specs], dtype=float),
+        'default_price': np.array([spec.get('default_price', np.nan) for spec in specs], dtype=float),
+        'inline': np.array([spec.get('inline', False) for spec in specs]),
+        'additional': padded([spec['additional'] for spec in specs], 3),
+        'cost': padded([[segment[0] for segment in spec['segments']] for spec in specs], 2),
+        'sale': padded([[segment[1] for segment in spec['segments']] for spec in specs], 2),
+        'rent': padded([[segment[2] for segment in spec['segments']] for spec in specs], 2),
+        'unit_size': padded([spec['unit_sizes'] for spec in specs], 2),
+    }
+
+
+_PORTFOLIO_ARRAYS = _portfolio_arrays(PORTFOLIO_TYPES)
+
+# Columns of calculate_portfolio, in order
+PORTFOLIO_COLUMNS = (
+    'project_type', 'location', 'land_area', 'floors', 'land_price_per_sqm',
+    'ground_floor_area', 'upper_floor_area', 'repeated_floors_area', 'top_floor_area', 'total_area',
+    'build_factor', 'units', 'land_cost', 'construction_cost', 'additional_cost',
+    'total_construction_cost', 'total_investment', 'sales_revenue', 'gross_margin',
+    'margin_percentage', 'annual_rent', 'operating_expenses', 'net_annual_rent', 'rental_roi'
+)
+
+# Objectives of optimize_parcel: the column candidates are ranked by and whether higher is better
+OPTIMIZE_OBJECTIVES = {
+    'gross_margin': ('gross_margin', True),
+    'margin_percentage': ('margin_percentage', True),
+    'rental_roi': ('rental_roi', True),
+    'payback': ('payback_years', False),
+}
+
+
+# Not frozen: a frozen dataclass sets each of its ~30 fields through object.__setattr__,
+# which alone would cost more than the arithmetic of a calculate_* call.
+@dataclass(slots=True)
+class ParcelAnalysis:
+    """Numeric outcome of one UnifiedCalculator.calculate_* call.
+
+    Areas are in square meters, amounts in riyals and margin_percentage and
+    rental_roi in percent. The Arabic report is only built when report() is
+    called.
+    """
+    project_type: ProjectType
+    location: str
+    land_area: float
+    floors: int
+    ground_floor_ratio: float
+    upper_floor_ratio: float
+    top_floor_ratio: float
+    ground_floor_area: float
+    upper_floor_area: float
+    repeated_floors_area: float
+    top_floor_area: float
+    total_area: float
+    units: int
+    land_price_per_sqm: float
+    land_cost: float
+    construction_cost_per_sqm: float
+    construction_cost: float
+    additional_cost: float
+    total_construction_cost: float
+    total_investment: float
+    sale_price_per_sqm: float
+    sales_revenue: float
+    gross_margin: float
+    margin_percentage: float
+    annual_rent_per_sqm: float
+    annual_rent: float
+    operating_expenses: float
+    net_annual_rent: float
+    rental_roi: float
+
+    @property
+    def build_factor(self) -> float:
+        return self.total_area / self.land_area
+
+    def report(self) -> dict:
+        """The Arabic report the calculate_* method returns by default"""
+        return _REPORTS[self.project_type](self)
+
+
+@dataclass(slots=True)
+class MixedUseAnalysis(ParcelAnalysis):
+    """Mixed use splits area and revenue into commercial (ground and first floor) and residential floors.
+
+    units counts both kinds, and sale_price_per_sqm and annual_rent_per_sqm
+    are averages over the total area.
+    """
+    commercial_area: float
+    residential_area: float
+    commercial_sale_price_per_sqm: float
+    commercial_sales_revenue: float
+    commercial_rent_per_sqm: float
+    commercial_annual_rent: float
+    residential_sale_price_per_sqm: float
+    residential_sales_revenue: float
+    residential_rent_per_sqm: float
+    residential_annual_rent: float
+
+
+@dataclass(slots=True)
+class CompoundAnalysis(ParcelAnalysis):
+    """Floor areas are per building; total_area and units cover all buildings"""
+    effective_land_ratio: float
+    effective_land_area: float
+    buildings: int
+    building_area: float
+    total_building_area: float
+    units_per_building: int
+
+
+@dataclass(slots=True)
+class VillaCompoundAnalysis(ParcelAnalysis):
+    """Floor areas are per villa; total_area covers all villas and units counts them"""
+    effective_land_ratio: float
+    effective_land_area: float
+    villa_area: float
+    total_villa_area: float
+    villas: int
+
 
 class UnifiedCalculator:
     def __init__(self):
@@ -125,17 +204,258 @@ class UnifiedCalculator:
             "حي الملقا": 8334,
             "حي الياسمين": 6995
         }
+        # Ground, upper and top floor ratios per (project type, floors)
+        self.building_ratios = BUILDING_RATIOS
 
     def format_number(self, number: float) -> str:
         return f"{number:,.0f}"
-    def calculate_mall_context(self, land_area: float, location: str, floors: int) -> dict:
+
+    def _location_codes(self, location, n: int) -> np.ndarray:
+        """Index of each row's location in self.location_prices, -1 if unknown"""
+        known = list(self.location_prices)
+        if isinstance(location, str):
+            return np.full(n, known.index(location) if location in known else -1)
+        codes = np.full(n, -1)
+        for i, name in enumerate(known):
+            codes[location == name] = i
+        return codes
+
+    def calculate_portfolio(self, project_type, land_area, location, floors=None,
+                            effective_land_ratio: float = 0.40) -> pd.DataFrame:
+        """Every numeric quantity of the calculate_* methods for many parcels at once.
+
+        land_area, location and floors are arrays with one entry per parcel, or
+        single values shared by all. project_type is a ProjectType (from this
+        module or project_types) or its name, or an array of them for a mixed
+        portfolio. floors is ignored by the fixed-height types (villas, compound,
+        admin building); effective_land_ratio only applies to the compound.
+        Floor areas are per building for the compound and per villa for villa
+        compounds, as in their reports.
+
+        Returns one row per parcel, in input order, with PORTFOLIO_COLUMNS;
+        project_type and location are categoricals.
+        """
+        n = max((len(x) for x in (project_type, land_area, location, floors) if np.ndim(x) == 1), default=1)
+        # Copies, as the returned frame shares memory with these arrays
+        land_area = np.broadcast_to(np.asarray(land_area, dtype=float), (n,)).copy()
+        if floors is not None:
+            floors = np.broadcast_to(np.asarray(floors, dtype=np.int64), (n,)).copy()
+        if not isinstance(location, str):
+            location = np.asarray(location)
+        codes = self._location_codes(location, n)
+
+        names = list(PORTFOLIO_TYPES)
+        if isinstance(project_type, (str, Enum)):
+            name = getattr(project_type, 'name', project_type)
+            if name not in PORTFOLIO_TYPES:
+                raise KeyError(name)
+            type_codes = np.full(n, names.index(name), dtype=np.int8)
+        else:
+            project_type = np.asarray(project_type)
+            if project_type.dtype == object:
+                project_type = np.array([getattr(pt, 'name', pt) for pt in project_type])
+            type_codes = np.full(n, -1, dtype=np.int8)
+            for i, name in enumerate(names):
+                type_codes[project_type == name] = i
+            if (type_codes < 0).any():
+                raise KeyError(str(project_type[np.argmax(type_codes < 0)]))
+
+        columns = self._portfolio_columns(type_codes, land_area, location, codes, floors, effective_land_ratio)
+
+        if (codes >= 0).all():
+            locations = pd.Categorical.from_codes(codes, list(self.location_prices))
+        else:
+            locations = pd.Categorical(np.broadcast_to(np.asarray(location, dtype=object), (n,)))
+        return pd.DataFrame({
+            'project_type': pd.Categorical.from_codes(type_codes, names),
+            'location': locations,
+            'land_area': land_area,
+            **columns
+        }, columns=list(PORTFOLIO_COLUMNS), copy=False)
+
+    def optimize_parcel(self, land_area, location, objective: str = 'gross_margin', floors=range(1, 11),
+                        max_investment: float = None, top: int = None,
+                        effective_land_ratio: float = 0.40) -> pd.DataFrame:
+        """Rank every project type and floor count for a parcel, or for many parcels at once.
+
+        Each parcel is evaluated as every ProjectType at every count in `floors`
+        (once at their own height for the villas, compound and admin building)
+        with the formulas of calculate_portfolio, in one vectorized pass.
+        Candidates are ranked per parcel by `objective`, one of
+        OPTIMIZE_OBJECTIVES; payback is total investment over net annual rent,
+        in years. Candidates over max_investment, layouts with fewer floors than
+        they need (negative repeated floor area) and, outside the listed
+        districts, types that need a district's land price are left out.
+
+        land_area and location are single values or arrays with one entry per
+        parcel. Returns PORTFOLIO_COLUMNS plus payback_years, preceded by
+        parcel (the position in the inputs) and rank (1 is best), sorted by
+        parcel and rank. top keeps only the best `top` candidates per parcel.
+        """
+        if objective not in OPTIMIZE_OBJECTIVES:
+            raise ValueError(f"Unknown objective {objective!r}, expected one of {', '.join(OPTIMIZE_OBJECTIVES)}")
+        n = max((len(x) for x in (land_area, location) if np.ndim(x) == 1), default=1)
+        land_area = np.broadcast_to(np.asarray(land_area, dtype=float), (n,))
+        codes = self._location_codes(location if isinstance(location, str) else np.asarray(location), n)
+        locations = np.broadcast_to(np.asarray(location, dtype=object), (n,))
+        floor_values = np.unique(np.asarray(floors, dtype=float))
+        if len(floor_values) == 0 or floor_values[0] < 1 or (floor_values != np.round(floor_values)).any():
+            raise ValueError("floors must be whole numbers of at least 1")
+        floor_values = floor_values.astype(np.int64)
+
+        # Candidates of one parcel: every project type at every floor count, fixed-height types once
+        candidate_types, candidate_floors = [], []
+        for code, spec in enumerate(PORTFOLIO_TYPES.values()):
+            type_floors = floor_values if spec['floors'] is None else [spec['floors']]
+            candidate_types += [code] * len(type_floors)
+            candidate_floors += list(type_floors)
+        parcel = np.repeat(np.arange(n), len(candidate_types))
+        type_codes = np.tile(np.array(candidate_types, dtype=np.int8), n)
+        floors = np.tile(np.array(candidate_floors, dtype=np.int64), n)
+        if (codes < 0).any():
+            priced = ~(np.isnan(_PORTFOLIO_ARRAYS['land_price']) & np.isnan(_PORTFOLIO_ARRAYS['default_price']))
+            listed = priced[type_codes] | (codes[parcel] >= 0)
+            parcel, type_codes, floors = parcel[listed], type_codes[listed], floors[listed]
+
+        columns = self._portfolio_columns(type_codes, land_area[parcel], locations[parcel], codes[parcel],
+                                          floors, effective_land_ratio)
+        with np.errstate(divide='ignore'):
+            columns['payback_years'] = np.where(columns['net_annual_rent'] > 0,
+                                                columns['total_investment'] / columns['net_annual_rent'], np.inf)
+
+        keep = columns['repeated_floors_area'] >= 0
+        if max_investment is not None:
+            keep &= columns['total_investment'] <= max_investment
+        column, maximize = OPTIMIZE_OBJECTIVES[objective]
+        score = columns[column]
+        order = np.flatnonzero(keep)
+        order = order[np.lexsort((-score[order] if maximize else score[order], parcel[order]))]
+        parcel = parcel[order]
+        rank = np.arange(len(order)) - np.searchsorted(parcel, parcel) + 1
+        if top is not None:
+            best = rank <= top
+            order, parcel, rank = order[best], parcel[best], rank[best]
+
+        if (codes[parcel] >= 0).all():
+            location_column = pd.Categorical.from_codes(codes[parcel], list(self.location_prices))
+        else:
+            location_column = pd.Categorical(locations[parcel])
+        return pd.DataFrame({
+            'parcel': parcel,
+            'rank': rank,
+            'project_type': pd.Categorical.from_codes(type_codes[order], list(PORTFOLIO_TYPES)),
+            'location': location_column,
+            'land_area': land_area[parcel],
+            **{column: values[order] for column, values in columns.items()}
+        }, columns=['parcel', 'rank', *PORTFOLIO_COLUMNS, 'payback_years'], copy=False)
+
+    def _portfolio_columns(self, type_codes: np.ndarray, land_area: np.ndarray, location, codes: np.ndarray,
+                           floors, effective_land_ratio: float) -> dict:
+        """The PORTFOLIO_COLUMNS after land_area, for rows of any mix of project types.
+
+        Where types differ in their formulas, both variants are computed and
+        picked per row, each in the operation order of its calculate_* method.
+        """
+        spec = {key: values[type_codes] for key, values in _PORTFOLIO_ARRAYS.items()}
+        n = len(type_codes)
+        fixed = spec['floors'] > 0
+        if floors is None:
+            if not fixed.all():
+                raise ValueError(f"{list(PORTFOLIO_TYPES)[type_codes[np.argmin(fixed)]]} needs floors")
+            floors = spec['floors']
+        else:
+            floors = np.where(fixed, spec['floors'], floors)
+
+        ratio_rows = np.array([self.building_ratios.row(name) for name in PORTFOLIO_TYPES])[type_codes]
+        ground_ratio, upper_ratio, top_ratio = self.building_ratios.gather(ratio_rows, floors)
+
+        layout = spec['layout']
+        mixed = layout == _LAYOUTS.index('mixed_use')
+        villas = layout == _LAYOUTS.index('villas')
+        compound = layout == _LAYOUTS.index('compound')
+        base = np.where(villas, 300.0, np.where(compound, land_area * effective_land_ratio / 4, land_area))
+        ground = base * ground_ratio
+        upper = base * upper_ratio
+        # Mixed use takes its top floor from the land area, the others from the upper floor
+        top = np.where(mixed, land_area * top_ratio, upper * top_ratio)
+        repeated = upper * (floors - spec['floor_offset'])
+        # Mixed use has a commercial (ground and first floor) and a residential segment
+        segments = (np.where(mixed, ground + upper, 0.0), np.where(mixed, repeated + top, 0.0))
+        building_total = np.where(mixed, segments[0] + segments[1], ground + repeated + top)
+        villa_count = np.trunc(land_area * 0.40 / 300)
+        total = np.where(compound, building_total * 4, np.where(villas, building_total * villa_count, building_total))
+        segments = (np.where(mixed, segments[0], total), segments[1])
+
+        listed = np.isnan(spec['land_price'])
+        location_prices = np.array(list(self.location_prices.values()), dtype=float)
+        prices = np.where(listed, np.where(codes >= 0, location_prices[codes], spec['default_price']),
+                          spec['land_price'])
+        unknown = np.isnan(prices)
+        if unknown.any():
+            # Types without a default price need a listed district, like self.location_prices[location]
+            raise KeyError(location if isinstance(location, str) else str(location[np.argmax(unknown)]))
+
+        inline = spec['inline']
+        construction = np.zeros(n)
+        sales = np.zeros(n)
+        rent = np.zeros(n)
+        for i, area in enumerate(segments):
+            construction += area * spec['cost'][:, i]
+            sale, rent_rate = spec['sale'][:, i], spec['rent'][:, i]
+            sales += np.where(~listed, area * sale, np.where(inline, area * prices * sale, area * (prices * sale)))
+            rent += np.where(inline, area * prices * rent_rate, area * (prices * rent_rate))
+
+        unit_size = spec['unit_size']
+        sizes = np.where(unit_size > 0, unit_size, 1.0)
+        segment_units = sum((area / sizes[:, i]).astype(np.int64) for i, area in enumerate(segments))
+        units = np.where(compound, (building_total / 120).astype(np.int64) * 4,
+                         np.where(villas, villa_count.astype(np.int64),
+                                  np.where(unit_size[:, 0] > 0, segment_units, 1)))
+
+        land_cost = land_area * prices
+        additional = spec['additional'].sum(axis=1)
+        # Inline methods add the summed additional costs once, the others one by one
+        total_construction = construction
+        for i in range(spec['additional'].shape[1]):
+            total_construction = total_construction + spec['additional'][:, i]
+        total_construction = np.where(inline, construction + additional, total_construction)
+        investment = np.where(inline, land_cost + construction + additional, land_cost + total_construction)
+        gross_margin = sales - investment
+        opex = rent * 0.20
+        net_rent = np.where(inline, rent * 0.80, rent - opex)
+
+        return {
+            'floors': floors,
+            'land_price_per_sqm': prices,
+            'ground_floor_area': ground,
+            'upper_floor_area': upper,
+            'repeated_floors_area': repeated,
+            'top_floor_area': top,
+            'total_area': total,
+            'build_factor': total / land_area,
+            'units': units,
+            'land_cost': land_cost,
+            'construction_cost': construction,
+            'additional_cost': additional,
+            'total_construction_cost': total_construction,
+            'total_investment': investment,
+            'sales_revenue': sales,
+            'gross_margin': gross_margin,
+            'margin_percentage': gross_margin / investment * 100,
+            'annual_rent': rent,
+            'operating_expenses': opex,
+            'net_annual_rent': net_rent,
+            'rental_roi': net_rent / investment * 100,
+        }
+
+    def calculate_mall_context(self, land_area: float, location: str, floors: int, report: bool = True):
         # Initialize building ratios
-        ratios = CommercialRatios.create(floors)
+        ground_ratio, upper_ratio, top_ratio = self.building_ratios.ratios(ProjectType.SHOPPING_MALL, floors)
         
         # Calculate areas
-        ground_floor_area = land_area * ratios.ground_floor
-        upper_floor_area = land_area * ratios.upper_floors
-        top_floor_area = upper_floor_area * ratios.top_floor
+        ground_floor_area = land_area * ground_ratio
+        upper_floor_area = land_area * upper_ratio
+        top_floor_area = upper_floor_area * top_ratio
         repeated_floors_total_area = upper_floor_area * (floors - 2)
         total_area = ground_floor_area + repeated_floors_total_area + top_floor_area
 
@@ -178,127 +498,32 @@ class UnifiedCalculator:
         net_annual_rent = total_annual_rent - operating_expenses
         rental_roi = (net_annual_rent / total_investment) * 100
 
-        return {
-            "مقدمة": "تمثل هذه الدراسة تحليلاً شاملاً لفرصة استثمارية في تطوير مول تجاري حديث. يهدف المشروع إلى تلبية احتياجات السوق المتزايدة للمساحات التجارية العصرية.",
-            "العنوان": f"دراسة جدوى استثمارية لمول تجاري في {location}",
-            "تقرير_تحليل_الاستثمار": {
-                "مقدمة": "هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مول تجاري عصري. يشمل التحليل دراسة السوق المستهدف، وتقديرات التكاليف، وتوقعات العوائد من التأجير والاستثمار.",
-                "تفاصيل_المشروع": {
-                    "الموقع": location,
-                    "مساحة_الأرض_الإجمالية": f"{self.format_number(land_area)} متر مربع",
-                    "نوع_المشروع": "مول تجاري",
-                    "تنظيمات_التخطيط": f"يسمح ببناء {floors} طوابق"
-                },
-                "معايير_التطوير": {
-                    "نسبة_البناء_للدور_الأرضي": f"{ratios.ground_floor * 100}%",
-                    "نسبة_البناء_للأدوار_المتكررة": f"{ratios.upper_floors * 100}%",
-                    "نسبة_البناء_للملحق_العلوي": f"{ratios.top_floor * 100}%",
-                    "الطوابق_المقترحة": f"{floors}",
-                    "مساحة_البناء_الفعالة_للدور_الأرضي": f"مساحة_الأرض_الإجمالية * نسبة_البناء_للدور_الأرضي = {self.format_number(land_area)} * {ratios.ground_floor} = {self.format_number(ground_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للمتكرر": f"مساحة_الأرض_الإجمالية * نسبة_البناء_للأدوار_المتكررة = {self.format_number(land_area)} * {ratios.upper_floors} = {self.format_number(upper_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للملحق_العلوي": f"مساحة_البناء_الفعالة_للمتكرر * نسبة_البناء_للملحق_العلوي = {self.format_number(upper_floor_area)} * {ratios.top_floor} = {self.format_number(top_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للأدوار_المتكررة": f"مساحة_البناء_الفعالة_للمتكرر * (الطوابق_المقترحة - 2) = {self.format_number(upper_floor_area)} * ({floors} - 2) = {self.format_number(repeated_floors_total_area)} متر مربع",
-                    "نتيجة_مساحة_البناء_الفعالة": f"{self.format_number(total_area)} متر مربع",
-                    "معامل_البناء": f"نتيجة_مساحة_البناء_الفعالة / مساحة_الأرض_الإجمالية = {self.format_number(total_area)} / {self.format_number(land_area)} = {total_area/land_area:.2f}",
-                    "نتيجة_معامل_البناء": f"{total_area/land_area:.2f}",
-                    "نطاق_حجم_الوحدات_التجارية": f"من {min_store_size} إلى {max_store_size} متر مربع",
-                    "الوحدات_التجارية_المقترحة": f"نتيجة_مساحة_البناء_الفعالة / متوسط_مساحة_الوحدة = {self.format_number(total_area)} / {avg_store_size:.1f}",
-                    "نتيجة_الوحدات_التجارية_المقترحة": f"{int(store_units)} وحدة تجارية"
-                },
-                "توقعات_التمويل": {
-                    "تكلفة_شراء_الأرض": {
-                        "تكلفة_الشراء_لكل_متر_مربع": f"{self.format_number(land_price_per_sqm)} ريال سعودي",
-                        "التكلفة_الكلية": f"مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {self.format_number(land_area)} * {self.format_number(land_price_per_sqm)} = {self.format_number(total_land_cost)} ريال سعودي",
-                        "نتيجة_التكلفة_الكلية": f"{self.format_number(total_land_cost)} ريال سعودي"
-                    },
-                    "تكاليف_البناء": {
-                        "تكلفة_البناء_لكل_متر_مربع": f"{self.format_number(construction_cost_per_sqm)} ريال سعودي",
-                        "مجموع_تكاليف_البناء": f"نتيجة_مساحة_البناء_الفعالة * تكلفة_البناء_لكل_متر_مربع = {self.format_number(total_area)} * {self.format_number(construction_cost_per_sqm)} = {self.format_number(total_construction_cost)} ريال سعودي",
-                        "نتيجة_مجموع_تكاليف_البناء": f"{self.format_number(total_construction_cost)} ريال سعودي",
-                        "التكاليف_الإضافية": {
-                            "تصميم_معماري": f"{self.format_number(design_cost)} ريال سعودي",
-                            "قانوني_وإداري": f"{self.format_number(legal_cost)} ريال سعودي",
-                            "تنسيق_الموقع": f"{self.format_number(landscaping_cost)} ريال سعودي"
-                        },
-                        "المجموع": f"مجموع_تكاليف_البناء + تصميم_معماري + قانوني_وإداري + تنسيق_الموقع = {self.format_number(total_construction_with_additional)} ريال سعودي",
-                        "نتيجة_المجموع": f"{self.format_number(total_construction_with_additional)} ريال سعودي"
-                    },
-                    "الاستثمار_الكلي": f"تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {self.format_number(total_land_cost)} + {self.format_number(total_construction_with_additional)}",
-                    "نتيجة_الاستثمار_الكلي": f"{self.format_number(total_investment)} ريال سعودي",
-                    "توقعات_الإيرادات_من_البيع": {
-                        "سعر_البيع_لكل_متر_مربع": f"{self.format_number(sale_price_per_sqm)} ريال سعودي",
-                        "إيرادات_محتملة_من_البيع": f"نتيجة_مساحة_البناء_الفعالة * سعر_البيع_لكل_متر_مربع = {self.format_number(total_area)} * {self.format_number(sale_price_per_sqm)} = {self.format_number(total_sales_revenue)} ريال سعودي",
-                        "نتيجة_الإيرادات_المحتملة_من_البيع": f"{self.format_number(total_sales_revenue)} ريال سعودي",
-                        "هامش_الربح_الإجمالي": f"إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {self.format_number(total_sales_revenue)} - {self.format_number(total_investment)}",
-                        "نتيجة_هامش_الربح_الإجمالي": f"{self.format_number(gross_profit)} ريال سعودي",
-                        "نسبة_هامش_الربح_الإجمالي": f"{profit_margin_percentage:.2f}%"
-                    },
-                    "توقعات_الإيرادات_من_الإيجار": {
-                        "الإيجار_السنوي_المتوقع_لكل_متر_مربع": f"{self.format_number(annual_rent_per_sqm)} ريال سعودي",
-                        "الإيجار_السنوي_الكلي": f"نتيجة_مساحة_البناء_الفعالة * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {self.format_number(total_area)} * {self.format_number(annual_rent_per_sqm)} = {self.format_number(total_annual_rent)} ريال سعودي",
-                        "نتيجة_الإيجار_السنوي_الكلي": f"{self.format_number(total_annual_rent)} ريال سعودي",
-                        "النفقات_التشغيلية": f"20% من الإيجار_السنوي_الكلي = {self.format_number(operating_expenses)} ريال سعودي",
-                        "نتيجة_النفقات_التشغيلية": f"{self.format_number(operating_expenses)} ريال سعودي",
-                        "صافي_الإيجار_السنوي": f"{self.format_number(net_annual_rent)} ريال سعودي",
-                        "عائد_الاستثمار_من_الإيجار": f"{rental_roi:.2f}%"
-                    }
-                },
-                "تقييم_المخاطر": {
-                    "تقلبات_السوق": "متوسطة - يتأثر قطاع التجزئة بالتغيرات الاقتصادية وأنماط المستهلكين",
-                    "التغييرات_التنظيمية": "منخفضة - القطاع التجاري يتمتع باستقرار تنظيمي",
-                    "العوامل_الاقتصادية": "متوسطة - تعتمد على القوة الشرائية والنمو الاقتصادي"
-                },
-                "اعتبارات_استراتيجية": {
-                    "اتجاهات_السوق": "نمو متزايد في قطاع التجزئة مع تطور أنماط التسوق",
-                    "توقيت_الاستثمار": "مناسب مع تزايد الطلب على المراكز التجارية الحديثة",
-                    "التوقعات_طويلة_الأمد": "إيجابية مع استمرار نمو قطاع التجزئة"
-                },
-                "ملخص_تنفيذي": "يمثل المشروع فرصة استثمارية واعدة في قطاع المراكز التجارية المتنامي",
-                "توصيات": "يوصى بالمضي قدماً في المشروع مع التركيز على جذب المستأجرين الرئيسيين وتنويع المحلات التجارية"
-            },
-            "ملخص_تنفيذي": "يقدم المشروع فرصة استثمارية جذابة في قطاع المراكز التجارية مع توقعات عوائد مجزية وإمكانات نمو واعدة"
-        }
-
-    def _generate_risk_assessment(self) -> dict:
-            """Generate risk assessment section"""
-            return {
-                "تقلبات_السوق": "متوسطة - يواجه سوق العقارات في الرياض تقلبات دورية.",
-                "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
-                "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
-            }
-
-    def _generate_strategic_considerations(self) -> dict:
-            """Generate strategic considerations section"""
-            return {
-                "اتجاهات_السوق": "يشهد سوق العقارات في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
-                "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
-                "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا لكل من العوائد الفورية والمستقبلية."
-            }
-
-    def _generate_executive_summary(self, location: str) -> str:
-            """Generate executive summary"""
-            return f"""يمثل التطوير المقترح في {location} استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. 
-            تشير التوقعات المالية إلى عائد استثماري صلب مع مخاطر قابلة للإدارة، متماشية مع ديناميكيات السوق الحالية وآفاق النمو المستقبلية. 
-            يُوصى ببدء المشروع على الفور للاستفادة من ظروف السوق المواتية."""
-
-    def _generate_recommendations(self) -> str:
-            """Generate recommendations"""
-            return """المضي قدماً في الاستحواذ والتطوير، مع ضمان إدارة صارمة للتكاليف والالتزام بالجداول الزمنية المتوقعة لتعظيم الربحية. 
-            يُنصح بمراقبة مستمرة لظروف السوق وإعادة تقييم منتظمة للاتجاهات الاستراتيجية."""
-
-    def format_number(self, number: float) -> str:
-            return f"{number:,.0f}"
-
-    def calculate_residential_context(self, land_area: float, location: str, floors: int) -> dict:
+        result = ParcelAnalysis(
+            project_type=ProjectType.SHOPPING_MALL, location=location, land_area=land_area, floors=floors,
+            ground_floor_ratio=ground_ratio, upper_floor_ratio=upper_ratio,
+            top_floor_ratio=top_ratio, ground_floor_area=ground_floor_area,
+            upper_floor_area=upper_floor_area, repeated_floors_area=repeated_floors_total_area,
+            top_floor_area=top_floor_area, total_area=total_area, units=int(store_units),
+            land_price_per_sqm=land_price_per_sqm, land_cost=total_land_cost,
+            construction_cost_per_sqm=construction_cost_per_sqm, construction_cost=total_construction_cost,
+            additional_cost=design_cost + legal_cost + landscaping_cost,
+            total_construction_cost=total_construction_with_additional, total_investment=total_investment,
+            sale_price_per_sqm=sale_price_per_sqm, sales_revenue=total_sales_revenue,
+            gross_margin=gross_profit, margin_percentage=profit_margin_percentage,
+            annual_rent_per_sqm=annual_rent_per_sqm, annual_rent=total_annual_rent,
+            operating_expenses=operating_expenses, net_annual_rent=net_annual_rent, rental_roi=rental_roi)
+        return result.report() if report else result
+
+    def calculate_residential_context(self, land_area: float, location: str, floors: int, report: bool = True):
             """Calculate residential investment analysis with detailed breakdowns"""
             
             # Initialize building ratios
-            ratios = BuildingRatios.create(floors)
+            ground_ratio, upper_ratio, top_ratio = self.building_ratios.ratios(ProjectType.RESIDENTIAL, floors)
             
             # Calculate areas
-            ground_floor_area = land_area * ratios.ground_floor
-            repeated_floor_area = land_area * ratios.upper_floors
-            top_floor_area = repeated_floor_area * ratios.top_floor
+            ground_floor_area = land_area * ground_ratio
+            repeated_floor_area = land_area * upper_ratio
+            top_floor_area = repeated_floor_area * top_ratio
             total_repeated_area = repeated_floor_area * (floors - 1)
             total_area = ground_floor_area + total_repeated_area + top_floor_area
 
@@ -333,157 +558,63 @@ class UnifiedCalculator:
             net_annual_rent = total_annual_rent - operating_expenses
             rental_roi = (net_annual_rent / total_investment) * 100
 
-            return {
-                "مقدمة": f"دراسة جدوى استثمارية لمشروع سكني في {location}",
-                "تفاصيل_المشروع": {
-                    "الموقع": location,
-                    "مساحة_الأرض": f"{self.format_number(land_area)} متر مربع",
-                    "عدد_الطوابق": floors,
-                    "إجمالي_مساحة_البناء": f"{self.format_number(total_area)} متر مربع",
-                    "معامل_البناء": f"{total_area/land_area:.2f}",
-                    "الوحدات_السكنية_المقترحة": f"{int(total_area/135)}"
-                },
-                "معايير_التطوير": {
-                    "نسبة_البناء_للدور_الأرضي": f"{ratios.ground_floor:.2f}",
-                    "نسبة_البناء_للأدوار_المتكررة": f"{ratios.upper_floors:.2f}",
-                    "نسبة_البناء_للملحق_العلوي": f"{ratios.top_floor:.2f}",
-                    "مساحة_البناء_الفعالة": f"{self.format_number(total_area)} متر مربع",
-                    "تفاصيل_المساحات": {
-                        "الدور_الأرضي": f"{self.format_number(ground_floor_area)} متر مربع",
-                        "الأدوار_المتكررة": f"{self.format_number(total_repeated_area)} متر مربع",
-                        "الملحق_العلوي": f"{self.format_number(top_floor_area)} متر مربع"
-                    }
-                },
-                "التكاليف": {
-                    "تكلفة_الأرض": {
-                        "سعر_المتر": f"{self.format_number(land_price_per_sqm)} ريال",
-                        "الإجمالي": f"{self.format_number(total_land_cost)} ريال"
-                    },
-                    "تكلفة_البناء": {
-                        "تكلفة_المتر": f"{self.format_number(construction_cost_per_sqm)} ريال",
-                        "التكلفة_الأساسية": f"{self.format_number(base_construction_cost)} ريال",
-                        "التكاليف_الإضافية": {k: f"{self.format_number(v)} ريال" for k, v in additional_costs.items()},
-                        "الإجمالي": f"{self.format_number(total_construction)} ريال"
-                    },
-                    "إجمالي_الاستثمار": f"{self.format_number(total_investment)} ريال"
-                },
-                "العوائد": {
-                    "البيع": {
-                        "سعر_المتر": f"{self.format_number(selling_price_per_sqm)} ريال",
-                        "إجمالي_المبيعات": f"{self.format_number(total_sales)} ريال",
-                        "هامش_الربح": f"{self.format_number(gross_margin)} ريال",
-                        "نسبة_الربحية": f"{margin_percentage:.2f}%"
-                    },
-                    "التأجير": {
-                        "الإيجار_السنوي_للمتر": f"{self.format_number(annual_rent_per_sqm)} ريال",
-                        "إجمالي_الإيجار_السنوي": f"{self.format_number(total_annual_rent)} ريال",
-                        "النفقات_التشغيلية": f"{self.format_number(operating_expenses)} ريال",
-                        "صافي_الإيجار_السنوي": f"{self.format_number(net_annual_rent)} ريال",
-                        "عائد_الاستثمار": f"{rental_roi:.2f}%"
-                    }
-                },
-                "تقييم_المخاطر": self._generate_risk_assessment(),
-                "اعتبارات_استراتيجية": self._generate_strategic_considerations(),
-                "ملخص_تنفيذي": self._generate_executive_summary(location),
-                "توصيات": self._generate_recommendations()
-            }
-
-    def calculate_villa_analysis(self, land_area: float, location: str) -> dict:
+            result = ParcelAnalysis(
+                project_type=ProjectType.RESIDENTIAL, location=location, land_area=land_area, floors=floors,
+                ground_floor_ratio=ground_ratio, upper_floor_ratio=upper_ratio,
+                top_floor_ratio=top_ratio, ground_floor_area=ground_floor_area,
+                upper_floor_area=repeated_floor_area, repeated_floors_area=total_repeated_area,
+                top_floor_area=top_floor_area, total_area=total_area, units=int(total_area/135),
+                land_price_per_sqm=land_price_per_sqm, land_cost=total_land_cost,
+                construction_cost_per_sqm=construction_cost_per_sqm, construction_cost=base_construction_cost,
+                additional_cost=total_additional, total_construction_cost=total_construction,
+                total_investment=total_investment, sale_price_per_sqm=selling_price_per_sqm,
+                sales_revenue=total_sales, gross_margin=gross_margin, margin_percentage=margin_percentage,
+                annual_rent_per_sqm=annual_rent_per_sqm, annual_rent=total_annual_rent,
+                operating_expenses=operating_expenses, net_annual_rent=net_annual_rent, rental_roi=rental_roi)
+            return result.report() if report else result
+
+    def calculate_villa_analysis(self, land_area: float, location: str, report: bool = True):
          
         floors = 3  # عدد الطوابق المقترح
-        ratios = SingleVillaBuildingRatios(floors)
+        ground_ratio, upper_ratio, top_ratio = self.building_ratios.ratios(ProjectType.SINGLE_VILLA, floors)
         
         # Calculate building areas
-        ground_floor_area = land_area * ratios.ground_floor
-        first_floor_area = land_area * ratios.first_floor
-        top_floor_area = first_floor_area * ratios.top_floor
+        ground_floor_area = land_area * ground_ratio
+        first_floor_area = land_area * upper_ratio
+        top_floor_area = first_floor_area * top_ratio
         total_area = ground_floor_area + first_floor_area + top_floor_area
 
-        return {
-            "مقدمة": f"دراسة جدوى استثمارية لمشروع فيلا سكنية في {location}",
-            "العنوان": f"مشروع تطوير فيلا سكنية في {location}",
-            "تقرير_تحليل_الاستثمار": {
-                "مقدمة": f"هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع فيلا فاخرة في {location} بالرياض. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
-                "تفاصيل_المشروع": {
-                    "الموقع": f"{location}، الرياض",
-                    "مساحة_الأرض_الإجمالية": f"{self.format_number(land_area)} متر مربع",
-                    "نوع_المشروع": "تطوير سكني فردي",
-                    "تنظيمات_التخطيط": f"يسمح ببناء حتى {floors} طوابق"
-                },
-                "معايير_التطوير": {
-                    "نسبة_البناء_للدور_الأرضي": f"{ratios.ground_floor:.2f}",
-                    "نسبة_البناء_للأدوار_المتكررة": f"{ratios.first_floor:.2f}",
-                    "نسبة_البناء_للملحق_العلوي": f"{ratios.top_floor:.2f}",
-                    "الطوابق_المقترحة": f"{floors}",
-                    "مساحة_البناء_الفعالة_للدور_الأرضي": f"مساحة_الأرض_الإجمالية * نسبة_البناء_للدور_الأرضي: {self.format_number(land_area)} * {ratios.ground_floor:.2f} = {self.format_number(ground_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للمتكرر": f"مساحة_الأرض_الإجمالية * نسبة_البناء_للأدوار_المتكررة: {self.format_number(land_area)} * {ratios.first_floor:.2f} = {self.format_number(first_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للملحق_العلوي": f"مساحة_البناء_الفعالة_للمتكرر * نسبة_البناء_للملحق_العلوي: {self.format_number(first_floor_area)} * {ratios.top_floor:.2f} = {self.format_number(top_floor_area)} متر مربع",
-                    "نتيجة_مساحة_البناء_الفعالة": f"{self.format_number(ground_floor_area)} + {self.format_number(first_floor_area)} + {self.format_number(top_floor_area)} = {self.format_number(total_area)} متر مربع",
-                    "معامل_البناء": f"نتيجة_مساحة_البناء_الفعالة / مساحة_الأرض_الإجمالية: {self.format_number(total_area)} / {self.format_number(land_area)} = {total_area/land_area:.2f}",
-                    "نتيجة_معامل_البناء": f"{total_area/land_area:.2f}"
-                },
-                                "توقعات_التمويل": {
-                    "تكلفة_شراء_الأرض": {
-                        "تكلفة_الشراء_لكل_متر_مربع": f"{self.format_number(self.location_prices[location])} ريال سعودي",
-                        "التكلفة_الكلية": f"مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {self.format_number(land_area)} * {self.format_number(self.location_prices[location])}",
-                        "نتيجة_التكلفة_الكلية": f"{self.format_number(land_area * self.location_prices[location])} ريال سعودي"
-                    },
-                    "تكاليف_البناء": {
-                        "تكلفة_البناء_لكل_متر_مربع": "1,400 ريال سعودي",
-                        "مجموع_تكاليف_البناء": f"نتيجة_مساحة_البناء_الفعالة * تكلفة_البناء_لكل_متر_مربع = {self.format_number(total_area)} * 1,400",
-                        "نتيجة_مجموع_تكاليف_البناء": f"{self.format_number(total_area * 1400)} ريال سعودي",
-                        "التكاليف_الإضافية": {
-                            "تصميم_معماري": "200,000 ريال سعودي",
-                            "قانوني_وإداري": "150,000 ريال سعودي",
-                            "تنسيق_الموقع": "100,000 ريال سعودي"
-                        },
-                        "مجموع_التكاليف_الإضافية": "450,000 ريال سعودي",
-                        "المجموع": f"مجموع_تكاليف_البناء + مجموع_التكاليف_الإضافية = {self.format_number(total_area * 1400)} + 450,000",
-                        "نتيجة_المجموع": f"{self.format_number(total_area * 1400 + 450000)} ريال سعودي"
-                    },
-                    "الاستثمار_الكلي": f"تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {self.format_number(land_area * self.location_prices[location])} + {self.format_number(total_area * 1400 + 450000)}",
-                    "نتيجة_الاستثمار_الكلي": f"{self.format_number(land_area * self.location_prices[location] + total_area * 1400 + 450000)} ريال سعودي",
-                    "توقعات_الإيرادات_من_البيع": {
-                        "سعر_البيع_لكل_متر_مربع": f"{self.format_number(self.location_prices[location] * 1.2)} ريال سعودي",
-                        "إيرادات_محتملة_من_البيع": f"نتيجة_مساحة_البناء_الفعالة * سعر_البيع_لكل_متر_مربع = {self.format_number(total_area)} * {self.format_number(self.location_prices[location] * 1.2)}",
-                        "نتيجة_الإيرادات_المحتملة_من_البيع": f"{self.format_number(total_area * self.location_prices[location] * 1.2)} ريال سعودي",
-                        "هامش_الربح_الإجمالي": f"إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {self.format_number(total_area * self.location_prices[location] * 1.2)} - {self.format_number(land_area * self.location_prices[location] + total_area * 1400 + 450000)}",
-                        "نتيجة_هامش_الربح_الإجمالي": f"{self.format_number(total_area * self.location_prices[location] * 1.2 - (land_area * self.location_prices[location] + total_area * 1400 + 450000))} ريال سعودي",
-                        "نسبة_هامش_الربح_الإجمالي": f"{((total_area * self.location_prices[location] * 1.2 - (land_area * self.location_prices[location] + total_area * 1400 + 450000)) / (land_area * self.location_prices[location] + total_area * 1400 + 450000)) * 100:.2f}%"
-                    },
-                    "توقعات_الإيرادات_من_الإيجار": {
-                        "الإيجار_السنوي_المتوقع_لكل_متر_مربع": f"{self.format_number(self.location_prices[location] * 0.09)} ريال سعودي",
-                        "الإيجار_السنوي_الكلي": f"نتيجة_مساحة_البناء_الفعالة * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {self.format_number(total_area)} * {self.format_number(self.location_prices[location] * 0.09)}",
-                        "نتيجة_الإيجار_السنوي_الكلي": f"{self.format_number(total_area * self.location_prices[location] * 0.09)} ريال سعودي",
-                        "النفقات_التشغيلية": f"20% من الإيجار_السنوي_الكلي = 0.20 * {self.format_number(total_area * self.location_prices[location] * 0.09)}",
-                        "نتيجة_النفقات_التشغيلية": f"{self.format_number(total_area * self.location_prices[location] * 0.09 * 0.20)} ريال سعودي",
-                        "صافي_الإيجار_السنوي": f"الإيجار_السنوي_الكلي - النفقات_التشغيلية = {self.format_number(total_area * self.location_prices[location] * 0.09)} - {self.format_number(total_area * self.location_prices[location] * 0.09 * 0.20)}",
-                        "نتيجة_صافي_الإيجار_السنوي": f"{self.format_number(total_area * self.location_prices[location] * 0.09 * 0.80)} ريال سعودي",
-                        "عائد_الاستثمار_من_الإيجار": f"صافي_الإيجار_السنوي / الاستثمار_الكلي * 100 = {self.format_number(total_area * self.location_prices[location] * 0.09 * 0.80)} / {self.format_number(land_area * self.location_prices[location] + total_area * 1400 + 450000)} * 100",
-                        "نتيجة_عائد_الاستثمار_من_الإيجار": f"{(total_area * self.location_prices[location] * 0.09 * 0.80 / (land_area * self.location_prices[location] + total_area * 1400 + 450000)) * 100:.2f}%"
-                    }
-                },
-                "تقييم_المخاطر": {
-                    "تقلبات_السوق": "متوسطة - يواجه سوق العقارات في الرياض تقلبات دورية.",
-                    "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
-                    "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
-                },
-                "اعتبارات_استراتيجية": {
-                    "اتجاهات_السوق": "يشهد سوق العقارات في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
-                    "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
-                    "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا لكل من العوائد الفورية والمستقبلية."
-                },
-                "ملخص_تنفيذي": f"يمثل التطوير المقترح في {location} استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. تشير التوقعات المالية إلى عائد استثماري صلب مع مخاطر قابلة للإدارة.",
-                "توصيات": "المضي قدماً في الاستحواذ والتطوير، مع ضمان إدارة صارمة للتكاليف والالتزام بالجداول الزمنية المتوقعة لتعظيم الربحية."
-            },
-            "ملخص_تنفيذي": f"مشروع تطوير فيلا سكنية في {location} يمثل فرصة استثمارية واعدة مع توقعات عوائد جيدة"
-        }
-
-
-    def calculate_compound_analysis(self, land_area: float, location: str, effective_land_ratio: float = 0.40) -> dict:
+        # Financial calculations
+        land_price_per_sqm = self.location_prices[location]
+        total_land_cost = land_area * land_price_per_sqm
+        total_construction_cost = total_area * 1400
+        total_investment = total_land_cost + total_construction_cost + 450000
+        total_sales_revenue = total_area * land_price_per_sqm * 1.2
+        gross_margin = total_sales_revenue - total_investment
+        total_annual_rent = total_area * land_price_per_sqm * 0.09
+        net_annual_rent = total_annual_rent * 0.80
+
+        result = ParcelAnalysis(
+            project_type=ProjectType.SINGLE_VILLA, location=location, land_area=land_area, floors=floors,
+            ground_floor_ratio=ground_ratio, upper_floor_ratio=upper_ratio,
+            top_floor_ratio=top_ratio, ground_floor_area=ground_floor_area,
+            upper_floor_area=first_floor_area, repeated_floors_area=first_floor_area * (floors - 2),
+            top_floor_area=top_floor_area, total_area=total_area, units=1,
+            land_price_per_sqm=land_price_per_sqm, land_cost=total_land_cost, construction_cost_per_sqm=1400,
+            construction_cost=total_construction_cost, additional_cost=450000,
+            total_construction_cost=total_construction_cost + 450000, total_investment=total_investment,
+            sale_price_per_sqm=land_price_per_sqm * 1.2, sales_revenue=total_sales_revenue,
+            gross_margin=gross_margin, margin_percentage=(gross_margin / total_investment) * 100,
+            annual_rent_per_sqm=land_price_per_sqm * 0.09, annual_rent=total_annual_rent,
+            operating_expenses=total_annual_rent * 0.20, net_annual_rent=net_annual_rent,
+            rental_roi=(net_annual_rent / total_investment) * 100)
+        return result.report() if report else result
+
+
+    def calculate_compound_analysis(self, land_area: float, location: str, effective_land_ratio: float = 0.40, report: bool = True):
     # Initialize variables
         floors = 4  # عدد الطوابق المقترح
-        ratios = CompoundBuildingRatios(floors)
+        ground_ratio, upper_ratio, top_ratio = self.building_ratios.ratios(ProjectType.RESIDENTIAL_COMPOUND, floors)
         
         # Calculate effective building areas
         effective_land_area = land_area * effective_land_ratio
@@ -491,10 +622,10 @@ class UnifiedCalculator:
         building_area = effective_land_area / proposed_buildings
         
         # Calculate building areas per floor
-        ground_floor_area = building_area * ratios.ground_floor
-        first_floor_area = building_area * ratios.first_floor
+        ground_floor_area = building_area * ground_ratio
+        first_floor_area = building_area * upper_ratio
         repeated_floors_area = first_floor_area * (floors - 2)  # للطوابق المتكررة
-        top_floor_area = first_floor_area * ratios.top_floor
+        top_floor_area = first_floor_area * top_ratio
         
         # Calculate total areas
         total_building_area = ground_floor_area + repeated_floors_area + top_floor_area
@@ -505,215 +636,94 @@ class UnifiedCalculator:
         units_per_building = int(total_building_area / avg_unit_size)
         total_units = units_per_building * proposed_buildings
 
-        return {
-            "مقدمة": f"دراسة جدوى استثمارية لمشروع مجمع سكني في {location}",
-            "العنوان": f"مشروع تطوير مجمع سكني في {location}",
-            "تقرير_تحليل_الاستثمار": {
-                "مقدمة": f"هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع مجمع سكني في {location} بالرياض. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
-                "تفاصيل_المشروع": {
-                    "الموقع": f"{location}، الرياض",
-                    "مساحة_الأرض_الإجمالية": f"{self.format_number(land_area)} متر مربع",
-                    "نوع_المشروع": "تطوير مجمع سكني",
-                    "عدد_العمارات_المقترحة": f"{proposed_buildings} عمارات",
-                    "تنظيمات_التخطيط": f"يسمح ببناء حتى {floors} طوابق"
-                },
-                "معايير_التطوير": {
-                    "نسبة_البناء_الفعالة_على_الأرض": f"{effective_land_ratio * 100}%",
-                    "مساحة_الأرض_الفعالة_للبناء": f"{self.format_number(effective_land_area)} متر مربع",
-                    "مساحة_العمارة": f"{self.format_number(building_area)} متر مربع",
-                    "معامل_البناء_للأرض": f"{effective_land_ratio:.2f}",
-                    "نسبة_البناء_للدور_الأرضي": f"{ratios.ground_floor:.2f}",
-                    "نسبة_البناء_للأدوار_المتكررة": f"{ratios.first_floor:.2f}",
-                    "نسبة_البناء_للملحق_العلوي": f"{ratios.top_floor:.2f}",
-                    "الطوابق_المقترحة": f"{floors}",
-                    "مساحة_البناء_الفعالة_للدور_الأرضي": f"{self.format_number(ground_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للمتكرر": f"{self.format_number(first_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للملحق_العلوي": f"{self.format_number(top_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للأدوار_المتكررة": f"{self.format_number(repeated_floors_area)} متر مربع",
-                    "نتيجة_مساحة_البناء_الفعالة_للعمارة": f"{self.format_number(total_building_area)} متر مربع",
-                    "معامل_البناء": f"{total_compound_area/land_area:.2f}",
-                    "مجموع_مساحة_البناء_الفعالة_للكومباوند": f"{self.format_number(total_compound_area)} متر مربع",
-                    "نطاق_حجم_الوحدات_السكنية": "90 إلى 150 متر مربع",
-                    "الوحدات_السكنية_المقترحة_لكل_عمارة": f"{units_per_building}",
-                    "عدد_الوحدات_السكنية_في_المشروع": f"{total_units}"
-                },
-                "توقعات_التمويل": {
-                    "تكلفة_شراء_الأرض": {
-                            "تكلفة_الشراء_لكل_متر_مربع": f"{self.format_number(self.location_prices[location])} ريال سعودي",
-                            "التكلفة_الكلية": f"مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {self.format_number(land_area)} * {self.format_number(self.location_prices[location])}",
-                            "نتيجة_التكلفة_الكلية": f"{self.format_number(land_area * self.location_prices[location])} ريال سعودي"
-                        },
-                    "تكاليف_البناء": {
-                        "تكلفة_البناء_لكل_متر_مربع": "1,400 ريال سعودي",
-                        "مجموع_تكاليف_البناء": f"مجموع_مساحة_البناء_الفعالة_للكومباوند * تكلفة_البناء_لكل_متر_مربع = {self.format_number(total_compound_area)} * 1,400",
-                        "نتيجة_مجموع_تكاليف_البناء": f"{self.format_number(total_compound_area * 1400)} ريال سعودي",
-                        "التكاليف_الإضافية": {
-                            "تصميم_معماري": "200,000 ريال سعودي",
-                            "قانوني_وإداري": "150,000 ريال سعودي",
-                            "تنسيق_الموقع": "100,000 ريال سعودي"
-                        },
-                        "مجموع_التكاليف_الإضافية": "450,000 ريال سعودي",
-                        "المجموع": f"مجموع_تكاليف_البناء + مجموع_التكاليف_الإضافية = {self.format_number(total_compound_area * 1400)} + 450,000",
-                        "نتيجة_المجموع": f"{self.format_number(total_compound_area * 1400 + 450000)} ريال سعودي"
-                    },
-                                        "الاستثمار_الكلي": f"تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {self.format_number(land_area * self.location_prices[location])} + {self.format_number(total_compound_area * 1400 + 450000)}",
-                    "نتيجة_الاستثمار_الكلي": f"{self.format_number(land_area * self.location_prices[location] + total_compound_area * 1400 + 450000)} ريال سعودي",
-                    "توقعات_الإيرادات_من_البيع": {
-                        "سعر_البيع_لكل_متر_مربع": f"{self.format_number(self.location_prices[location] * 1.3)} ريال سعودي",
-                        "إيرادات_محتملة_من_البيع": f"مجموع_مساحة_البناء_الفعالة_للكومباوند * سعر_البيع_لكل_متر_مربع = {self.format_number(total_compound_area)} * {self.format_number(self.location_prices[location] * 1.3)}",
-                        "نتيجة_الإيرادات_المحتملة_من_البيع": f"{self.format_number(total_compound_area * self.location_prices[location] * 1.3)} ريال سعودي",
-                        "هامش_الربح_الإجمالي": f"إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {self.format_number(total_compound_area * self.location_prices[location] * 1.3)} - {self.format_number(land_area * self.location_prices[location] + total_compound_area * 1400 + 450000)}",
-                        "نتيجة_هامش_الربح_الإجمالي": f"{self.format_number(total_compound_area * self.location_prices[location] * 1.3 - (land_area * self.location_prices[location] + total_compound_area * 1400 + 450000))} ريال سعودي",
-                        "نسبة_هامش_الربح_الإجمالي": f"{((total_compound_area * self.location_prices[location] * 1.3 - (land_area * self.location_prices[location] + total_compound_area * 1400 + 450000)) / (land_area * self.location_prices[location] + total_compound_area * 1400 + 450000)) * 100:.2f}%"
-                    },
-                    "توقعات_الإيرادات_من_الإيجار": {
-                        "الإيجار_السنوي_المتوقع_لكل_متر_مربع": f"{self.format_number(self.location_prices[location] * 0.09)} ريال سعودي",
-                        "الإيجار_السنوي_الكلي": f"مجموع_مساحة_البناء_الفعالة_للكومباوند * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {self.format_number(total_compound_area)} * {self.format_number(self.location_prices[location] * 0.09)}",
-                        "نتيجة_الإيجار_السنوي_الكلي": f"{self.format_number(total_compound_area * self.location_prices[location] * 0.09)} ريال سعودي",
-                        "النفقات_التشغيلية": f"20% من الإيجار_السنوي_الكلي = 0.20 * {self.format_number(total_compound_area * self.location_prices[location] * 0.09)}",
-                        "نتيجة_النفقات_التشغيلية": f"{self.format_number(total_compound_area * self.location_prices[location] * 0.09 * 0.20)} ريال سعودي",
-                        "صافي_الإيجار_السنوي": f"الإيجار_السنوي_الكلي - النفقات_التشغيلية = {self.format_number(total_compound_area * self.location_prices[location] * 0.09)} - {self.format_number(total_compound_area * self.location_prices[location] * 0.09 * 0.20)}",
-                        "نتيجة_صافي_الإيجار_السنوي": f"{self.format_number(total_compound_area * self.location_prices[location] * 0.09 * 0.80)} ريال سعودي",
-                        "عائد_الاستثمار_من_الإيجار": f"صافي_الإيجار_السنوي / الاستثمار_الكلي * 100 = {self.format_number(total_compound_area * self.location_prices[location] * 0.09 * 0.80)} / {self.format_number(land_area * self.location_prices[location] + total_compound_area * 1400 + 450000)} * 100",
-                        "نتيجة_عائد_الاستثمار_من_الإيجار": f"{(total_compound_area * self.location_prices[location] * 0.09 * 0.80 / (land_area * self.location_prices[location] + total_compound_area * 1400 + 450000)) * 100:.2f}%"
-                    }
-                },
-                "تقييم_المخاطر": {
-                    "تقلبات_السوق": "متوسطة - يواجه سوق العقارات في الرياض تقلبات دورية.",
-                    "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
-                    "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
-                },
-                "اعتبارات_استراتيجية": {
-                    "اتجاهات_السوق": "يشهد سوق العقارات في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
-                    "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
-                    "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا لكل من العوائد الفورية والمستقبلية."
-                },
-                "ملخص_تنفيذي": f"يمثل التطوير المقترح في {location} استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. يتضمن المشروع {proposed_buildings} عمارات بإجمالي {total_units} وحدة سكنية.",
-                "توصيات": "المضي قدماً في الاستحواذ والتطوير، مع ضمان إدارة صارمة للتكاليف والالتزام بالجداول الزمنية المتوقعة لتعظيم الربحية."
-            },
-            "ملخص_تنفيذي": f"مشروع تطوير مجمع سكني في {location} يمثل فرصة استثمارية واعدة مع {total_units} وحدة سكنية وتوقعات عوائد جيدة"
-        }
-
-
-    def calculate_villa_context(self, land_area: float, location: str) -> dict:
+        # Financial calculations
+        land_price_per_sqm = self.location_prices[location]
+        total_land_cost = land_area * land_price_per_sqm
+        total_construction_cost = total_compound_area * 1400
+        total_investment = total_land_cost + total_construction_cost + 450000
+        total_sales_revenue = total_compound_area * land_price_per_sqm * 1.3
+        gross_margin = total_sales_revenue - total_investment
+        total_annual_rent = total_compound_area * land_price_per_sqm * 0.09
+        net_annual_rent = total_annual_rent * 0.80
+
+        result = CompoundAnalysis(
+            project_type=ProjectType.RESIDENTIAL_COMPOUND, location=location, land_area=land_area,
+            floors=floors, ground_floor_ratio=ground_ratio, upper_floor_ratio=upper_ratio,
+            top_floor_ratio=top_ratio, ground_floor_area=ground_floor_area,
+            upper_floor_area=first_floor_area, repeated_floors_area=repeated_floors_area,
+            top_floor_area=top_floor_area, total_area=total_compound_area, units=total_units,
+            land_price_per_sqm=land_price_per_sqm, land_cost=total_land_cost, construction_cost_per_sqm=1400,
+            construction_cost=total_construction_cost, additional_cost=450000,
+            total_construction_cost=total_construction_cost + 450000, total_investment=total_investment,
+            sale_price_per_sqm=land_price_per_sqm * 1.3, sales_revenue=total_sales_revenue,
+            gross_margin=gross_margin, margin_percentage=(gross_margin / total_investment) * 100,
+            annual_rent_per_sqm=land_price_per_sqm * 0.09, annual_rent=total_annual_rent,
+            operating_expenses=total_annual_rent * 0.20, net_annual_rent=net_annual_rent,
+            rental_roi=(net_annual_rent / total_investment) * 100, effective_land_ratio=effective_land_ratio,
+            effective_land_area=effective_land_area, buildings=proposed_buildings, building_area=building_area,
+            total_building_area=total_building_area, units_per_building=units_per_building)
+        return result.report() if report else result
+
+
+    def calculate_villa_context(self, land_area: float, location: str, report: bool = True):
         """Calculate villa investment analysis with detailed breakdowns"""
         # Initialize variables
         villa_area = 300  # مساحة الفيلا النموذجية
         floors = 3  # عدد الطوابق المقترح
-        ratios = VillaBuildingRatios.create(floors)
+        ground_ratio, upper_ratio, top_ratio = self.building_ratios.ratios(ProjectType.VILLA, floors)
         
         # Calculate areas
         effective_land_ratio = 0.40
         effective_land_area = land_area * effective_land_ratio
         
         # Calculate building areas
-        ground_floor_area = villa_area * ratios.ground_floor
-        first_floor_area = villa_area * ratios.first_floor
-        top_floor_area = first_floor_area * ratios.top_floor
+        ground_floor_area = villa_area * ground_ratio
+        first_floor_area = villa_area * upper_ratio
+        top_floor_area = first_floor_area * top_ratio
         
         # Calculate total areas
         total_villa_area = ground_floor_area + first_floor_area + top_floor_area
         proposed_villas = int(effective_land_area / villa_area)
         total_compound_area = total_villa_area * proposed_villas
-        
-        return {
-            "مقدمة": f"دراسة جدوى استثمارية لمشروع مجمع فلل سكنية في {location}",
-            "العنوان": f"مشروع تطوير مجمع فلل سكنية في {location}",
-            "تقرير_تحليل_الاستثمار": {
-                "مقدمة": f"هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع فلل فاخر في {location} بالرياض. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
-                "تفاصيل_المشروع": {
-                    "الموقع": f"{location}، الرياض",
-                    "مساحة_الأرض_الإجمالية": f"{self.format_number(land_area)} متر مربع",
-                    "نوع_المشروع": "تطوير سكني فردي",
-                    "تنظيمات_التخطيط": f"يسمح ببناء حتى {floors} طوابق"
-                },
-                "معايير_التطوير": {
-                    "نسبة_البناء_الفعالة_على_الأرض": f"{effective_land_ratio * 100}%",
-                    "مساحة_الأرض_الفعالة_للبناء": f"مساحة_الأرض_الإجمالية * نسبة_البناء_الفعالة_على_الأرض: {self.format_number(land_area)} * {effective_land_ratio} = {self.format_number(effective_land_area)} متر مربع",
-                    "مساحة_الفيلا": f"{self.format_number(villa_area)} متر مربع",
-                    "معامل_البناء_للأرض": f"مساحة_الأرض_الفعالة_للبناء / مساحة_الأرض_الإجمالية: {self.format_number(effective_land_area)} / {self.format_number(land_area)}",
-                    "نتيجة_معامل_البناء_للأرض": f"{effective_land_ratio:.2f}",
-                    "نسبة_البناء_للدور_الأرضي": f"{ratios.ground_floor:.2f}",
-                    "نسبة_البناء_للأدوار_المتكررة": f"{ratios.first_floor:.2f}",
-                    "نسبة_البناء_للملحق_العلوي": f"{ratios.top_floor:.2f}",
-                    "الطوابق_المقترحة": f"{floors}",
-                    "مساحة_البناء_الفعالة_للدور_الأرضي": f"مساحة_الفيلا * نسبة_البناء_للدور_الأرضي: {self.format_number(villa_area)} * {ratios.ground_floor:.2f} = {self.format_number(ground_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للمتكرر": f"مساحة_الفيلا * نسبة_البناء_للأدوار_المتكررة: {self.format_number(villa_area)} * {ratios.first_floor:.2f} = {self.format_number(first_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للملحق_العلوي": f"مساحة_البناء_الفعالة_للمتكرر * نسبة_البناء_للملحق_العلوي: {self.format_number(first_floor_area)} * {ratios.top_floor:.2f} = {self.format_number(top_floor_area)} متر مربع",
-                    "نتيجة_مساحة_البناء_الفعالة": f"{self.format_number(total_villa_area)} متر مربع",
-                    "عدد_الفلل_المقترح": f"مساحة_الأرض_الفعالة_للبناء / مساحة_الفيلا: {self.format_number(effective_land_area)} / {self.format_number(villa_area)} = {proposed_villas}",
-                    "مجموع_مساحة_البناء_الفعالة_للكومباوند": f"نتيجة_مساحة_البناء_الفعالة * عدد_الفلل_المقترح: {self.format_number(total_villa_area)} * {proposed_villas} = {self.format_number(total_compound_area)} متر مربع",
-                    "معامل_البناء": f"مجموع_مساحة_البناء_الفعالة_للكومباوند / مساحة_الأرض_الإجمالية: {self.format_number(total_compound_area)} / {self.format_number(land_area)} = {total_compound_area/land_area:.2f}",
-                    "نتيجة_معامل_البناء": f"{total_compound_area/land_area:.2f}",
-                    "نتيجة_عدد_الفلل_المقترح": f"{proposed_villas}"
-                },
-                                "توقعات_التمويل": {
-                    "تكلفة_شراء_الأرض": {
-                        "تكلفة_الشراء_لكل_متر_مربع": f"{self.format_number(self.location_prices[location])} ريال سعودي",
-                        "التكلفة_الكلية": f"مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {self.format_number(land_area)} * {self.format_number(self.location_prices[location])}",
-                        "نتيجة_التكلفة_الكلية": f"{self.format_number(land_area * self.location_prices[location])} ريال سعودي"
-                    },
-                    "تكاليف_البناء": {
-                        "تكلفة_البناء_لكل_متر_مربع": "2,000 ريال سعودي",
-                        "مجموع_تكاليف_البناء": f"مجموع_مساحة_البناء_الفعالة_للكومباوند * تكلفة_البناء_لكل_متر_مربع = {self.format_number(total_compound_area)} * 2,000",
-                        "نتيجة_مجموع_تكاليف_البناء": f"{self.format_number(total_compound_area * 2000)} ريال سعودي",
-                        "التكاليف_الإضافية": {
-                            "تصميم_معماري": "200,000 ريال سعودي",
-                            "قانوني_وإداري": "150,000 ريال سعودي",
-                            "تنسيق_الموقع": "100,000 ريال سعودي"
-                        },
-                        "مجموع_التكاليف_الإضافية": "450,000 ريال سعودي",
-                        "المجموع": f"مجموع_تكاليف_البناء + مجموع_التكاليف_الإضافية = {self.format_number(total_compound_area * 2000)} + 450,000",
-                        "نتيجة_المجموع": f"{self.format_number(total_compound_area * 2000 + 450000)} ريال سعودي"
-                    },
-                    "الاستثمار_الكلي": f"تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {self.format_number(land_area * self.location_prices[location])} + {self.format_number(total_compound_area * 2000 + 450000)}",
-                    "نتيجة_الاستثمار_الكلي": f"{self.format_number(land_area * self.location_prices[location] + total_compound_area * 2000 + 450000)} ريال سعودي",
-                    "توقعات_الإيرادات_من_البيع": {
-                        "سعر_البيع_لكل_متر_مربع": f"{self.format_number(self.location_prices[location] * 1.4)} ريال سعودي",
-                        "إيرادات_محتملة_من_البيع": f"مجموع_مساحة_البناء_الفعالة_للكومباوند * سعر_البيع_لكل_متر_مربع = {self.format_number(total_compound_area)} * {self.format_number(self.location_prices[location] * 1.4)}",
-                        "نتيجة_الإيرادات_المحتملة_من_البيع": f"{self.format_number(total_compound_area * self.location_prices[location] * 1.4)} ريال سعودي",
-                        "هامش_الربح_الإجمالي": f"إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {self.format_number(total_compound_area * self.location_prices[location] * 1.4)} - {self.format_number(land_area * self.location_prices[location] + total_compound_area * 2000 + 450000)}",
-                        "نتيجة_هامش_الربح_الإجمالي": f"{self.format_number(total_compound_area * self.location_prices[location] * 1.4 - (land_area * self.location_prices[location] + total_compound_area * 2000 + 450000))} ريال سعودي",
-                        "نسبة_هامش_الربح_الإجمالي": f"{((total_compound_area * self.location_prices[location] * 1.4 - (land_area * self.location_prices[location] + total_compound_area * 2000 + 450000)) / (land_area * self.location_prices[location] + total_compound_area * 2000 + 450000)) * 100:.2f}%"
-                    },
-                    "توقعات_الإيرادات_من_الإيجار": {
-                        "الإيجار_السنوي_المتوقع_لكل_متر_مربع": f"{self.format_number(self.location_prices[location] * 0.08)} ريال سعودي",
-                        "الإيجار_السنوي_الكلي": f"مجموع_مساحة_البناء_الفعالة_للكومباوند * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {self.format_number(total_compound_area)} * {self.format_number(self.location_prices[location] * 0.08)}",
-                        "نتيجة_الإيجار_السنوي_الكلي": f"{self.format_number(total_compound_area * self.location_prices[location] * 0.08)} ريال سعودي",
-                        "النفقات_التشغيلية": f"20% من الإيجار_السنوي_الكلي = 0.20 * {self.format_number(total_compound_area * self.location_prices[location] * 0.08)}",
-                        "نتيجة_النفقات_التشغيلية": f"{self.format_number(total_compound_area * self.location_prices[location] * 0.08 * 0.20)} ريال سعودي",
-                        "صافي_الإيجار_السنوي": f"الإيجار_السنوي_الكلي - النفقات_التشغيلية = {self.format_number(total_compound_area * self.location_prices[location] * 0.08)} - {self.format_number(total_compound_area * self.location_prices[location] * 0.08 * 0.20)}",
-                        "نتيجة_صافي_الإيجار_السنوي": f"{self.format_number(total_compound_area * self.location_prices[location] * 0.08 * 0.80)} ريال سعودي",
-                        "عائد_الاستثمار_من_الإيجار": f"صافي_الإيجار_السنوي / الاستثمار_الكلي * 100 = {self.format_number(total_compound_area * self.location_prices[location] * 0.08 * 0.80)} / {self.format_number(land_area * self.location_prices[location] + total_compound_area * 2000 + 450000)} * 100",
-                        "نتيجة_عائد_الاستثمار_من_الإيجار": f"{(total_compound_area * self.location_prices[location] * 0.08 * 0.80 / (land_area * self.location_prices[location] + total_compound_area * 2000 + 450000)) * 100:.2f}%"
-                    }
-                },
-                "تقييم_المخاطر": {
-                    "تقلبات_السوق": "متوسطة - يواجه سوق العقارات في الرياض تقلبات دورية.",
-                    "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
-                    "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
-                },
-                "اعتبارات_استراتيجية": {
-                    "اتجاهات_السوق": "يشهد سوق العقارات في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
-                    "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
-                    "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا لكل من العوائد الفورية والمستقبلية."
-                },
-                "ملخص_تنفيذي": f"يمثل التطوير المقترح في {location} استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. تشير التوقعات المالية إلى عائد استثماري صلب مع مخاطر قابلة للإدارة، متماشية مع ديناميكيات السوق الحالية وآفاق النمو المستقبلية.",
-                "توصيات": "المضي قدماً في الاستحواذ والتطوير، مع ضمان إدارة صارمة للتكاليف والالتزام بالجداول الزمنية المتوقعة لتعظيم الربحية. يُنصح بمراقبة مستمرة لظروف السوق وإعادة تقييم منتظمة للاتجاهات الاستراتيجية."
-            },
-            "ملخص_تنفيذي": f"مشروع تطوير مجمع فلل سكنية في {location} يمثل فرصة استثمارية واعدة مع توقعات عوائد جيدة"
-        }
-
-
-
 
-    def calculate_commercial_context(self, land_area: float, location: str, floors: int) -> dict:
-        ratios = CommercialRatios.create(floors)
+        # Financial calculations
+        land_price_per_sqm = self.location_prices[location]
+        total_land_cost = land_area * land_price_per_sqm
+        total_construction_cost = total_compound_area * 2000
+        total_investment = total_land_cost + total_construction_cost + 450000
+        total_sales_revenue = total_compound_area * land_price_per_sqm * 1.4
+        gross_margin = total_sales_revenue - total_investment
+        total_annual_rent = total_compound_area * land_price_per_sqm * 0.08
+        net_annual_rent = total_annual_rent * 0.80
+
+        result = VillaCompoundAnalysis(
+            project_type=ProjectType.VILLA, location=location, land_area=land_area, floors=floors,
+            ground_floor_ratio=ground_ratio, upper_floor_ratio=upper_ratio,
+            top_floor_ratio=top_ratio, ground_floor_area=ground_floor_area,
+            upper_floor_area=first_floor_area, repeated_floors_area=first_floor_area * (floors - 2),
+            top_floor_area=top_floor_area, total_area=total_compound_area, units=proposed_villas,
+            land_price_per_sqm=land_price_per_sqm, land_cost=total_land_cost, construction_cost_per_sqm=2000,
+            construction_cost=total_construction_cost, additional_cost=450000,
+            total_construction_cost=total_construction_cost + 450000, total_investment=total_investment,
+            sale_price_per_sqm=land_price_per_sqm * 1.4, sales_revenue=total_sales_revenue,
+            gross_margin=gross_margin, margin_percentage=(gross_margin / total_investment) * 100,
+            annual_rent_per_sqm=land_price_per_sqm * 0.08, annual_rent=total_annual_rent,
+            operating_expenses=total_annual_rent * 0.20, net_annual_rent=net_annual_rent,
+            rental_roi=(net_annual_rent / total_investment) * 100, effective_land_ratio=effective_land_ratio,
+            effective_land_area=effective_land_area, villa_area=villa_area, total_villa_area=total_villa_area,
+            villas=proposed_villas)
+        return result.report() if report else result
+
+
+
+
+    def calculate_commercial_context(self, land_area: float, location: str, floors: int, report: bool = True):
+        ground_ratio, upper_ratio, top_ratio = self.building_ratios.ratios(ProjectType.COMMERCIAL, floors)
         
         # Area calculations
-        ground_floor_area = land_area * ratios.ground_floor
-        upper_floor_area = land_area * ratios.upper_floors
-        top_floor_area = upper_floor_area * ratios.top_floor
+        ground_floor_area = land_area * ground_ratio
+        upper_floor_area = land_area * upper_ratio
+        top_floor_area = upper_floor_area * top_ratio
         repeated_floors_total_area = upper_floor_area * (floors - 2)
         total_area = ground_floor_area + repeated_floors_total_area + top_floor_area
         
@@ -752,98 +762,30 @@ class UnifiedCalculator:
         net_annual_rent = total_annual_rent - operating_expenses
         rental_roi = (net_annual_rent / total_investment) * 100
 
-        return {
-            "مقدمة": "تمثل هذه الدراسة حالة استثمارية لتطوير مبنى تجاري في موقع استراتيجي. تهدف هذه الدراسة إلى تحليل الجدوى المالية وتقدير العوائد المحتملة من المشروع.",
-            "العنوان": "دراسة حالة استثمارية لتطوير مبنى تجاري",
-            "تقرير_تحليل_الاستثمار": {
-                "مقدمة": "هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع مبنى تجاري في موقع متميز. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
-                "تفاصيل_المشروع": {
-                    "الموقع": "موقع استراتيجي",
-                    "مساحة_الأرض_الإجمالية": f"{self.format_number(land_area)} متر مربع",
-                    "نوع_المشروع": "تطوير مبنى تجاري",
-                    "تنظيمات_التخطيط": f"يسمح ببناء حتى {floors} طوابق"
-                },
-                "معايير_التطوير": {
-                    "نسبة_البناء_للدور_الأرضي": f"{ratios.ground_floor}",
-                    "نسبة_البناء_للأدوار_المتكررة": f"{ratios.upper_floors}",
-                    "نسبة_البناء_للملحق_العلوي": f"{ratios.top_floor}",
-                    "الطوابق_المقترحة": f"{floors}",
-                    "مساحة_البناء_الفعالة_للدور_الأرضي": f"مساحة_الأرض_الإجمالية * نسبة_البناء_للدور_الأرضي = {self.format_number(land_area)} * {ratios.ground_floor} = {self.format_number(ground_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للمتكرر": f"مساحة_الأرض_الإجمالية * نسبة_البناء_للأدوار_المتكررة = {self.format_number(land_area)} * {ratios.upper_floors} = {self.format_number(upper_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للملحق_العلوي": f"مساحة_البناء_الفعالة_للمتكرر * نسبة_البناء_للملحق_العلوي = {self.format_number(upper_floor_area)} * {ratios.top_floor} = {self.format_number(top_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للأدوار_المتكررة": f"مساحة_البناء_الفعالة_للمتكرر * (الطوابق_المقترحة - 2) = {self.format_number(upper_floor_area)} * ({floors} - 2) = {self.format_number(repeated_floors_total_area)} متر مربع",
-                    "نتيجة_مساحة_البناء_الفعالة": f"مساحة_البناء_الفعالة_للدور_الأرضي + مساحة_البناء_الفعالة_للأدوار_المتكررة + مساحة_البناء_الفعالة_للملحق_العلوي = {self.format_number(ground_floor_area)} + {self.format_number(repeated_floors_total_area)} + {self.format_number(top_floor_area)} = {self.format_number(total_area)} متر مربع",
-                    "معامل_البناء": f"نتيجة_مساحة_البناء_الفعالة / مساحة_الأرض_الإجمالية = {self.format_number(total_area)} / {self.format_number(land_area)} = {total_area/land_area:.3f}",
-                    "نتيحة_معامل_البناء": f"{total_area/land_area:.3f}",
-                    "نطاق_حجم_الوحدات-التجارية": f"'من {min_unit_size} إلى {max_unit_size} متر مربع'",
-                    "الوحدات_التجارية_المقترحة": f"نتيجة_مساحة_البناء_الفعالة / متوسط مساحة الوحدة = {self.format_number(total_area)} / {avg_unit_size} = {int(commercial_units)} وحدات تقريبا",
-                    "نتيجة_الوحدات_التجارية_المقترحة": f"{int(commercial_units)} وحدات تجارية"
-                },
-                                "توقعات_التمويل": {
-                    "تكلفة_شراء_الأرض": {
-                        "تكلفة_الشراء_لكل_متر_مربع": f"{self.format_number(land_price_per_sqm)} ريال سعودي",
-                        "التكلفة_الكلية": f"مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {self.format_number(land_area)} * {self.format_number(land_price_per_sqm)} = {self.format_number(total_land_cost)} ريال سعودي",
-                        "نتيجة_التكلفة_الكلية": f"{self.format_number(total_land_cost)} ريال سعودي"
-                    },
-                    "تكاليف_البناء": {
-                        "تكلفة_البناء_لكل_متر_مربع": f"{self.format_number(construction_cost_per_sqm)} ريال سعودي",
-                        "مجموع_تكاليف_البناء": f"نتيجة_مساحة_البناء_الفعالة * تكلفة_البناء_لكل_متر_مربع = {self.format_number(total_area)} * {self.format_number(construction_cost_per_sqm)} = {self.format_number(total_construction_cost)} ريال سعودي",
-                        "نتيجة_مجموع_تكاليف_البناء": f"{self.format_number(total_construction_cost)} ريال سعودي",
-                        "التكاليف_الإضافية": {
-                            "تصميم_معماري": f"{self.format_number(design_cost)} ريال سعودي",
-                            "قانوني_وإداري": f"{self.format_number(legal_cost)} ريال سعودي",
-                            "تنسيق_الموقع": f"{self.format_number(landscaping_cost)} ريال سعودي"
-                        },
-                        "المجموع": f"مجموع_تكاليف_البناء + تصميم_معماري + قانوني_وإداري + تنسيق_الموقع = {self.format_number(total_construction_cost)} + {self.format_number(design_cost)} + {self.format_number(legal_cost)} + {self.format_number(landscaping_cost)} = {self.format_number(total_construction_with_additional)} ريال سعودي",
-                        "نتيجة_المجموع": f"{self.format_number(total_construction_with_additional)} ريال سعودي"
-                    },
-                    "الاستثمار_الكلي": f"تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {self.format_number(total_land_cost)} + {self.format_number(total_construction_with_additional)}",
-                    "نتيجة_الاستثمار_الكلي": f"{self.format_number(total_investment)} ريال سعودي",
-                    "توقعات_الإيرادات_من_البيع": {
-                        "سعر_البيع_لكل_متر_مربع": f"يُقترح {self.format_number(sale_price_per_sqm)} ريال سعودي",
-                        "إيرادات_محتملة_من_البيع": f"نتيجة_مساحة_البناء_الفعالة * سعر_البيع_لكل_متر_مربع = {self.format_number(total_area)} * {self.format_number(sale_price_per_sqm)} = {self.format_number(total_sales_revenue)} ريال سعودي",
-                        "نتيجة_الإيرادات_المحتملة_من_البيع": f"{self.format_number(total_sales_revenue)} ريال سعودي",
-                        "هامش_الربح_الإجمالي": f"إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {self.format_number(total_sales_revenue)} - {self.format_number(total_investment)}",
-                        "نتيجة_هامش_الربح_الإجمالي": f"{self.format_number(gross_profit)} ريال سعودي",
-                        "نسبة_هامش_الربح_الإجمالي": f"هامش_الربح_الإجمالي / الاستثمار_الكلي * 100 = {self.format_number(gross_profit)} / {self.format_number(total_investment)} * 100",
-                        "نتيجة_نسبة_هامش_الربح_الإجمالي": f"{profit_margin_percentage:.2f}%"
-                    },
-                    "توقعات_الإيرادات_من_الإيجار": {
-                        "الإيجار_السنوي_المتوقع_لكل_متر_مربع": f"(18% من تكلفة_الشراء_لكل_متر_مربع) = {self.format_number(annual_rent_per_sqm)} ريال سعودي",
-                        "الإيجار_السنوي_الكلي": f"نتيجة_مساحة_البناء_الفعالة * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {self.format_number(total_area)} * {self.format_number(annual_rent_per_sqm)} = {self.format_number(total_annual_rent)} ريال سعودي",
-                        "نتيجة_الإيجار_السنوي_الكلي": f"{self.format_number(total_annual_rent)} ريال سعودي",
-                        "النفقات_التشغيلية": f"20% من الإيجار_السنوي_الكلي = 0.20 * {self.format_number(total_annual_rent)} = {self.format_number(operating_expenses)} ريال سعودي",
-                        "نتيجة_النفقات_التشغيلية": f"{self.format_number(operating_expenses)} ريال سعودي",
-                        "صافي_الإيجار_السنوي": f"الإيجار_السنوي_الكلي - النفقات_التشغيلية = {self.format_number(total_annual_rent)} - {self.format_number(operating_expenses)}",
-                        "نتيجة_صافي_الإيجار_السنوي": f"{self.format_number(net_annual_rent)} ريال سعودي",
-                        "عائد_الاستثمار_من_الإيجار": f"صافي_الإيجار_السنوي / الاستثمار_الكلي * 100 = {self.format_number(net_annual_rent)} / {self.format_number(total_investment)} * 100",
-                        "نتيجة_عائد_الاستثمار_من_الإيجار": f"{rental_roi:.2f}%"
-                    }
-                },
-                "تقييم_المخاطر": {
-                    "تقلبات_السوق": "متوسطة - يواجه سوق العقارات تقلبات دورية.",
-                    "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
-                    "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
-                },
-                "اعتبارات_استراتيجية": {
-                    "اتجاهات_السوق": "يشهد سوق العقارات حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
-                    "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
-                    "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا."
-                },
-                "ملخص_تنفيذي": "يمثل التطوير المقترح استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. تشير التوقعات المالية إلى عائد استثماري صلب مع مخاطر قابلة للإدارة.",
-                "توصيات": "المضي قدماً في الاستحواذ والتطوير مع ضمان إدارة صارمة للتكاليف."
-            },
-            "ملخص_تنفيذي": "يمثل هذا المشروع فرصة استثمارية جذابة بفضل موقعه الاستراتيجي وتوقعات العوائد الإيجابية. رغم وجود بعض المخاطر ، إلا أن هناك إمكانية كبيرة لتحقيق الأرباح في المستقبل القريب."
-        }
-
-    def calculate_mixed_use_context(self, land_area: float, location: str, floors: int) -> dict:
-        ratios = MixedUseRatios.create(floors)
+        result = ParcelAnalysis(
+            project_type=ProjectType.COMMERCIAL, location=location, land_area=land_area, floors=floors,
+            ground_floor_ratio=ground_ratio, upper_floor_ratio=upper_ratio,
+            top_floor_ratio=top_ratio, ground_floor_area=ground_floor_area,
+            upper_floor_area=upper_floor_area, repeated_floors_area=repeated_floors_total_area,
+            top_floor_area=top_floor_area, total_area=total_area, units=int(commercial_units),
+            land_price_per_sqm=land_price_per_sqm, land_cost=total_land_cost,
+            construction_cost_per_sqm=construction_cost_per_sqm, construction_cost=total_construction_cost,
+            additional_cost=additional_costs, total_construction_cost=total_construction_with_additional,
+            total_investment=total_investment, sale_price_per_sqm=sale_price_per_sqm,
+            sales_revenue=total_sales_revenue, gross_margin=gross_profit,
+            margin_percentage=profit_margin_percentage, annual_rent_per_sqm=annual_rent_per_sqm,
+            annual_rent=total_annual_rent, operating_expenses=operating_expenses,
+            net_annual_rent=net_annual_rent, rental_roi=rental_roi)
+        return result.report() if report else result
+
+    def calculate_mixed_use_context(self, land_area: float, location: str, floors: int, report: bool = True):
+        ground_ratio, upper_ratio, top_ratio = self.building_ratios.ratios(ProjectType.MIXED_USE, floors)
         
         # Area calculations
-        ground_floor_area = land_area * ratios.ground_floor  # Commercial
-        first_floor_area = land_area * ratios.first_floor    # Commercial
-        repeated_floors_area = land_area * ratios.repeated_floors * (floors - 3)  # Residential
-        top_floor_area = land_area * ratios.top_floor        # Residential
+        ground_floor_area = land_area * ground_ratio  # Commercial
+        first_floor_area = land_area * upper_ratio    # Commercial
+        repeated_floors_area = land_area * upper_ratio * (floors - 3)  # Residential
+        top_floor_area = land_area * top_ratio        # Residential
         
         total_commercial_area = ground_floor_area + first_floor_area
         total_residential_area = repeated_floors_area + top_floor_area
@@ -903,112 +845,42 @@ class UnifiedCalculator:
         profit_margin_percentage = (gross_profit / total_investment) * 100
         rental_roi = (net_annual_rent / total_investment) * 100
 
-        return {
-            "مقدمة": "تعتبر المشاريع السكنية والتجارية من المقومات الأساسية لتطوير المناطق الحضرية، حيث تسهم في تلبية احتياجات السكان وفي الوقت ذاته تعزز النشاط الاقتصادي. المشروع المقترح في حي النرجس بالرياض يعد فرصة استثمارية واعدة.",
-            "العنوان": f"مشروع تطوير مبنى سكني تجاري في {location}",
-            "تقرير_تحليل_الاستثمار": {
-                "مقدمة": "هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع مبنى سكني تجاري فاخر في حي النرجس بالرياض. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
-                "تفاصيل_المشروع": {
-                    "الموقع": f"{location}",
-                    "مساحة_الأرض_الإجمالية": f"{self.format_number(land_area)} متر مربع",
-                    "نوع_المشروع": "تطوير سكني وتجاري",
-                    "تنظيمات_التخطيط": f"يسمح ببناء حتى {floors} طوابق"
-                },
-                "معايير_التطوير": {
-                    "نسبة_البناء_للدور_الأرضي": f"{ratios.ground_floor * 100}%",
-                    "نسبة_البناء_للأدوار_المتكررة": f"{ratios.repeated_floors * 100}%",
-                    "نسبة_البناء_للملحق_العلوي": f"{ratios.top_floor * 100}%",
-                    "الطوابق_المقترحة": f"{floors}",
-                    "مساحة_البناء_الفعالة_للدور_الأرضي": f"{land_area} * {ratios.ground_floor} = {self.format_number(ground_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للمتكرر": f"{land_area} * {ratios.repeated_floors} = {self.format_number(repeated_floors_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للملحق_العلوي": f"{self.format_number(repeated_floors_area)} * {ratios.top_floor} = {self.format_number(top_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للأدوار_المتكررة": f"{self.format_number(repeated_floors_area)} * ({floors} - 2) = {self.format_number(repeated_floors_area)} متر مربع",
-                    "نتيجة_مساحة_البناء_الفعالة": f"{self.format_number(ground_floor_area)} + {self.format_number(repeated_floors_area)} + {self.format_number(top_floor_area)} = {self.format_number(total_area)} متر مربع",
-                    "معامل_البناء": f"{self.format_number(total_area)} / {self.format_number(land_area)} = {total_area/land_area:.2f}",
-                    "نتيجة_معامل_البناء": f"{total_area/land_area:.2f}",
-                    "أدوار_الوحدات_التجارية": "دور واحد (الدور الأرضي)",
-                    "أدوار_الوحدات_السكنية": f"{floors} - 1 = {floors-1}",
-                    "مجموع_المساحة_التجارية": f"{self.format_number(total_commercial_area)} متر مربع",
-                    "مجموع_المساحة_السكنية": f"{self.format_number(total_residential_area)} متر مربع",
-                    "نطاق_حجم_الوحدات-السكنية": "'80 متر مربع إلى 120 متر مربع'",
-                    "الوحدات_السكنية_المقترحة": f"{self.format_number(total_residential_area)} / 100 = {total_residential_area/100:.1f} وحدة سكنية",
-                    "نتيجة_الوحدات_السكنية_المقترحة": f"{int(total_residential_area/100)} وحدة سكنية",
-                    "نطاق_حجم_الوحدات-التجارية": "'60 متر مربع إلى 100 متر مربع'",
-                    "الوحدات_التجارية_المقترحة": f"{self.format_number(total_commercial_area)} / 80 = {total_commercial_area/80:.4f} وحدة تجارية",
-                    "نتيجة_الوحدات_التجارية_المقترحة": f"{int(total_commercial_area/80)} وحدة تجارية"
-                },
-                "توقعات_التمويل": {
-                    "تكلفة_شراء_الأرض": {
-                        "تكلفة_الشراء_لكل_متر_مربع": f"{self.format_number(land_price_per_sqm)} ريال سعودي",
-                        "التكلفة_الكلية": f"{self.format_number(land_area)} * {self.format_number(land_price_per_sqm)} = {self.format_number(total_land_cost)} ريال سعودي",
-                        "نتيجة_التكلفة_الكلية": f"{self.format_number(total_land_cost)} ريال سعودي"
-                    },
-                    "تكاليف_البناء": {
-                        "تكلفة_البناء_لكل_متر_مربع": f"{self.format_number(construction_cost_per_sqm)} ريال سعودي",
-                        "مجموع_تكاليف_البناء": f"{self.format_number(total_area)} * {construction_cost_per_sqm} = {self.format_number(total_construction_cost)} ريال سعودي",
-                        "التكاليف_الإضافية": {
-                            "تصميم_معماري": f"{self.format_number(design_cost)} ريال سعودي",
-                            "قانوني_وإداري": f"{self.format_number(legal_cost)} ريال سعودي",
-                            "تنسيق_الموقع": f"{self.format_number(landscaping_cost)} ريال سعودي"
-                        },
-                        "المجموع": f"{self.format_number(total_construction_cost)} + {self.format_number(design_cost)} + {self.format_number(legal_cost)} + {self.format_number(landscaping_cost)} = {self.format_number(total_construction_with_additional)} ريال سعودي",
-                        "نتيجة_المجموع": f"{self.format_number(total_construction_with_additional)} ريال سعودي"
-                    },
-                    "الاستثمار_الكلي": f"{self.format_number(total_land_cost)} + {self.format_number(total_construction_with_additional)} = {self.format_number(total_investment)} ريال سعودي",
-                    "نتيجة_الاستثمار_الكلي": f"{self.format_number(total_investment)} ريال سعودي",
-                    "توقعات_الإيرادات_من_البيع": {
-                        "سعر_البيع_السكني_لكل_متر_مربع": f"{self.format_number(residential_sale_price_per_sqm)} ريال سعودي",
-                        "سعر_البيع_التجاري_لكل_متر_مربع": f"{self.format_number(commercial_sale_price_per_sqm)} ريال سعودي",
-                        "إيرادات_محتملة_من_البيع_السكني": f"{self.format_number(total_residential_area)} * {self.format_number(residential_sale_price_per_sqm)} = {self.format_number(residential_sales_revenue)} ريال سعودي",
-                        "إيرادات_محتملة_من_البيع_التجاري": f"{self.format_number(total_commercial_area)} * {self.format_number(commercial_sale_price_per_sqm)} = {self.format_number(commercial_sales_revenue)} ريال سعودي",
-                        "نتيجة_الإيرادات_المحتملة_من_البيع": f"{self.format_number(residential_sales_revenue)} + {self.format_number(commercial_sales_revenue)} = {self.format_number(total_sales_revenue)} ريال سعودي",
-                        "هامش_الربح_الإجمالي": f"{self.format_number(total_sales_revenue)} - {self.format_number(total_investment)} = {self.format_number(gross_profit)} ريال سعودي",
-                        "نتيجة_هامش_الربح_الإجمالي": f"{self.format_number(gross_profit)} ريال سعودي",
-                        "نسبة_هامش_الربح_الإجمالي": f"({self.format_number(gross_profit)} / {self.format_number(total_investment)}) * 100 = {profit_margin_percentage:.2f}%",
-                        "نتيجة_نسبة_هامش_الربح_الإجمالي": f"{profit_margin_percentage:.2f}%"
-                    },
-                    "توقعات_الإيرادات_من_الإيجار": {
-                        "الإيجار_السنوي_المتوقع_للسكني_لكل_متر_مربع": f"{self.format_number(residential_rent_per_sqm)} ريال سعودي",
-                        "الإيجار_السنوي_المتوقع_للتجاري_لكل_متر_مربع": f"{self.format_number(commercial_rent_per_sqm)} ريال سعودي",
-                        "الإيجار_السنوي_الكلي_للسكني": f"{self.format_number(total_residential_area)} * {self.format_number(residential_rent_per_sqm)} = {self.format_number(residential_annual_rent)} ريال سعودي",
-                        "الإيجار_السنوي_الكلي_للتجاري": f"{self.format_number(total_commercial_area)} * {self.format_number(commercial_rent_per_sqm)} = {self.format_number(commercial_annual_rent)} ريال سعودي",
-                        "نتيجة_الإيجار_السنوي_الكلي": f"{self.format_number(residential_annual_rent)} + {self.format_number(commercial_annual_rent)} = {self.format_number(total_annual_rent)} ريال سعودي",
-                        "النفقات_التشغيلية": f"20% من {self.format_number(total_annual_rent)} = {self.format_number(operating_expenses)} ريال سعودي",
-                        "نتيجة_النفقات_التشغيلية": f"{self.format_number(operating_expenses)} ريال سعودي",
-                        "صافي_الإيجار_السنوي": f"{self.format_number(total_annual_rent)} - {self.format_number(operating_expenses)} = {self.format_number(net_annual_rent)} ريال سعودي",
-                        "نتيجة_صافي_الإيجار_السنوي": f"{self.format_number(net_annual_rent)} ريال سعودي",
-                        "عائد_الاستثمار_من_الإيجار": f"({self.format_number(net_annual_rent)} / {self.format_number(total_investment)}) * 100 = {rental_roi:.2f}%",
-                        "نتيجة_عائد_الاستثمار_من_الإيجار": f"{rental_roi:.2f}%"
-                    }
-                },
-                "تقييم_المخاطر": {
-                    "تقلبات_السوق": "متوسطة - يواجه سوق العقارات في الرياض تقلبات دورية.",
-                    "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
-                    "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
-                },
-                "اعتبارات_استراتيجية": {
-                    "اتجاهات_السوق": "يشهد سوق العقارات في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
-                    "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
-                    "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا لكل من العوائد الفورية والمستقبلية."
-                },
-                "ملخص_تنفيذي": "يمثل التطوير المقترح في حي النرجس استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. تشير التوقعات المالية إلى عائد استثماري صلب مع مخاطر قابلة للإدارة، متماشية مع ديناميكيات السوق الحالية وآفاق النمو المستقبلية. يُوصى ببدء المشروع على الفور للاستفادة من ظروف السوق المواتية.",
-                "توصيات": "المضي قدماً في الاستحواذ والتطوير، مع ضمان إدارة صارمة للتكاليف والالتزام بالجداول الزمنية المتوقعة لتعظيم الربحية. يُنصح بمراقبة مستمرة لظروف السوق وإعادة تقييم منتظمة للاتجاهات الاستراتيجية."
-            },
-            "ملخص_تنفيذي": "يعد المشروع المقترح فرصة استثمارية جذابة تمزج بين العوائد المالية العالية في القطاع السكني والتجاري، مع التحكم في المخاطر من خلال تحليل دقيق للأسواق. تبين الدراسة الجدوى الاقتصادية لهذا المشروع ومدة استرداد رأس المال المتوقعة."
-        }
-
-
-    def calculate_admin_building_analysis(self, land_area: float, location: str) -> dict:
+        result = MixedUseAnalysis(
+            project_type=ProjectType.MIXED_USE, location=location, land_area=land_area, floors=floors,
+            ground_floor_ratio=ground_ratio, upper_floor_ratio=upper_ratio,
+            top_floor_ratio=top_ratio, ground_floor_area=ground_floor_area,
+            upper_floor_area=first_floor_area, repeated_floors_area=repeated_floors_area,
+            top_floor_area=top_floor_area, total_area=total_area,
+            units=int(total_residential_area/100) + int(total_commercial_area/80),
+            land_price_per_sqm=land_price_per_sqm, land_cost=total_land_cost,
+            construction_cost_per_sqm=construction_cost_per_sqm, construction_cost=total_construction_cost,
+            additional_cost=total_additional, total_construction_cost=total_construction_with_additional,
+            total_investment=total_investment, sale_price_per_sqm=total_sales_revenue / total_area,
+            sales_revenue=total_sales_revenue, gross_margin=gross_profit,
+            margin_percentage=profit_margin_percentage, annual_rent_per_sqm=total_annual_rent / total_area,
+            annual_rent=total_annual_rent, operating_expenses=operating_expenses,
+            net_annual_rent=net_annual_rent, rental_roi=rental_roi, commercial_area=total_commercial_area,
+            residential_area=total_residential_area,
+            commercial_sale_price_per_sqm=commercial_sale_price_per_sqm,
+            commercial_sales_revenue=commercial_sales_revenue, commercial_rent_per_sqm=commercial_rent_per_sqm,
+            commercial_annual_rent=commercial_annual_rent,
+            residential_sale_price_per_sqm=residential_sale_price_per_sqm,
+            residential_sales_revenue=residential_sales_revenue,
+            residential_rent_per_sqm=residential_rent_per_sqm, residential_annual_rent=residential_annual_rent)
+        return result.report() if report else result
+
+
+    def calculate_admin_building_analysis(self, land_area: float, location: str, report: bool = True):
         # ... (paste the entire calculate_admin_building_analysis method here)
         # Initialize variables
         floors = 4  # عدد الطوابق المقترح
-        ratios = AdminBuildingRatios(floors)
+        ground_ratio, upper_ratio, top_ratio = self.building_ratios.ratios(ProjectType.ADMIN_BUILDING, floors)
         
         # Calculate building areas
-        ground_floor_area = land_area * ratios.ground_floor
-        first_floor_area = land_area * ratios.first_floor
+        ground_floor_area = land_area * ground_ratio
+        first_floor_area = land_area * upper_ratio
         repeated_floors_area = first_floor_area * (floors - 2)  # للطوابق المتكررة
-        top_floor_area = first_floor_area * ratios.top_floor
+        top_floor_area = first_floor_area * top_ratio
         
         # Calculate total area
         total_building_area = ground_floor_area + repeated_floors_area + top_floor_area
@@ -1017,89 +889,734 @@ class UnifiedCalculator:
         avg_office_size = 150  # متوسط مساحة المكتب
         total_offices = int(total_building_area / avg_office_size)
 
-        return {
-            "مقدمة": f"دراسة جدوى استثمارية لمشروع مبنى إداري في {location}",
-            "العنوان": f"مشروع تطوير مبنى إداري في {location}",
-            "تقرير_تحليل_الاستثمار": {
-                "مقدمة": f"هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع مبنى إداري في {location} بالرياض. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
-                "تفاصيل_المشروع": {
-                    "الموقع": f"{location}، الرياض",
-                    "مساحة_الأرض_الإجمالية": f"{self.format_number(land_area)} متر مربع",
-                    "نوع_المشروع": "تطوير مبنى إداري",
-                    "تنظيمات_التخطيط": f"يسمح ببناء حتى {floors} طوابق"
+        # Financial calculations
+        land_price_per_sqm = self.location_prices[location]
+        total_land_cost = land_area * land_price_per_sqm
+        total_construction_cost = total_building_area * 1400
+        total_investment = total_land_cost + total_construction_cost + 450000
+        total_sales_revenue = total_building_area * land_price_per_sqm * 1.4
+        gross_margin = total_sales_revenue - total_investment
+        total_annual_rent = total_building_area * land_price_per_sqm * 0.18
+        net_annual_rent = total_annual_rent * 0.80
+
+        result = ParcelAnalysis(
+            project_type=ProjectType.ADMIN_BUILDING, location=location, land_area=land_area, floors=floors,
+            ground_floor_ratio=ground_ratio, upper_floor_ratio=upper_ratio,
+            top_floor_ratio=top_ratio, ground_floor_area=ground_floor_area,
+            upper_floor_area=first_floor_area, repeated_floors_area=repeated_floors_area,
+            top_floor_area=top_floor_area, total_area=total_building_area, units=total_offices,
+            land_price_per_sqm=land_price_per_sqm, land_cost=total_land_cost, construction_cost_per_sqm=1400,
+            construction_cost=total_construction_cost, additional_cost=450000,
+            total_construction_cost=total_construction_cost + 450000, total_investment=total_investment,
+            sale_price_per_sqm=land_price_per_sqm * 1.4, sales_revenue=total_sales_revenue,
+            gross_margin=gross_margin, margin_percentage=(gross_margin / total_investment) * 100,
+            annual_rent_per_sqm=land_price_per_sqm * 0.18, annual_rent=total_annual_rent,
+            operating_expenses=total_annual_rent * 0.20, net_annual_rent=net_annual_rent,
+            rental_roi=(net_annual_rent / total_investment) * 100)
+        return result.report() if report else result
+
+
+# Sections shared by the residential-type reports
+_RISK_ASSESSMENT = {
+    "تقلبات_السوق": "متوسطة - يواجه سوق العقارات في الرياض تقلبات دورية.",
+    "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
+    "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
+}
+
+_STRATEGIC_CONSIDERATIONS = {
+    "اتجاهات_السوق": "يشهد سوق العقارات في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
+    "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
+    "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا لكل من العوائد الفورية والمستقبلية."
+}
+
+_EXECUTIVE_SUMMARY = """يمثل التطوير المقترح في {r.location} استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. 
+            تشير التوقعات المالية إلى عائد استثماري صلب مع مخاطر قابلة للإدارة، متماشية مع ديناميكيات السوق الحالية وآفاق النمو المستقبلية. 
+            يُوصى ببدء المشروع على الفور للاستفادة من ظروف السوق المواتية."""
+
+_RECOMMENDATIONS = """المضي قدماً في الاستحواذ والتطوير، مع ضمان إدارة صارمة للتكاليف والالتزام بالجداول الزمنية المتوقعة لتعظيم الربحية. 
+            يُنصح بمراقبة مستمرة لظروف السوق وإعادة تقييم منتظمة للاتجاهات الاستراتيجية."""
+
+
+# Arabic report of each project type, in f-string syntax over a ParcelAnalysis `r`; see templates.compile_template
+_MALL_TEMPLATE = {
+    "مقدمة": "تمثل هذه الدراسة تحليلاً شاملاً لفرصة استثمارية في تطوير مول تجاري حديث. يهدف المشروع إلى تلبية احتياجات السوق المتزايدة للمساحات التجارية العصرية.",
+    "العنوان": "دراسة جدوى استثمارية لمول تجاري في {r.location}",
+    "تقرير_تحليل_الاستثمار": {
+        "مقدمة": "هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مول تجاري عصري. يشمل التحليل دراسة السوق المستهدف، وتقديرات التكاليف، وتوقعات العوائد من التأجير والاستثمار.",
+        "تفاصيل_المشروع": {
+            "الموقع": Slot("r.location"),
+            "مساحة_الأرض_الإجمالية": "{r.land_area:,.0f} متر مربع",
+            "نوع_المشروع": "مول تجاري",
+            "تنظيمات_التخطيط": "يسمح ببناء {r.floors} طوابق"
+        },
+        "معايير_التطوير": {
+            "نسبة_البناء_للدور_الأرضي": "{r.ground_floor_ratio * 100}%",
+            "نسبة_البناء_للأدوار_المتكررة": "{r.upper_floor_ratio * 100}%",
+            "نسبة_البناء_للملحق_العلوي": "{r.top_floor_ratio * 100}%",
+            "الطوابق_المقترحة": "{r.floors}",
+            "مساحة_البناء_الفعالة_للدور_الأرضي": "مساحة_الأرض_الإجمالية * نسبة_البناء_للدور_الأرضي = {r.land_area:,.0f} * {r.ground_floor_ratio} = {r.ground_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للمتكرر": "مساحة_الأرض_الإجمالية * نسبة_البناء_للأدوار_المتكررة = {r.land_area:,.0f} * {r.upper_floor_ratio} = {r.upper_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للملحق_العلوي": "مساحة_البناء_الفعالة_للمتكرر * نسبة_البناء_للملحق_العلوي = {r.upper_floor_area:,.0f} * {r.top_floor_ratio} = {r.top_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للأدوار_المتكررة": "مساحة_البناء_الفعالة_للمتكرر * (الطوابق_المقترحة - 2) = {r.upper_floor_area:,.0f} * ({r.floors} - 2) = {r.repeated_floors_area:,.0f} متر مربع",
+            "نتيجة_مساحة_البناء_الفعالة": "{r.total_area:,.0f} متر مربع",
+            "معامل_البناء": "نتيجة_مساحة_البناء_الفعالة / مساحة_الأرض_الإجمالية = {r.total_area:,.0f} / {r.land_area:,.0f} = {r.build_factor:.2f}",
+            "نتيجة_معامل_البناء": "{r.build_factor:.2f}",
+            "نطاق_حجم_الوحدات_التجارية": "من 30 إلى 200 متر مربع",
+            "الوحدات_التجارية_المقترحة": "نتيجة_مساحة_البناء_الفعالة / متوسط_مساحة_الوحدة = {r.total_area:,.0f} / 115.0",
+            "نتيجة_الوحدات_التجارية_المقترحة": "{r.units} وحدة تجارية"
+        },
+    "توقعات_التمويل": {
+            "تكلفة_شراء_الأرض": {
+                "تكلفة_الشراء_لكل_متر_مربع": "{r.land_price_per_sqm:,.0f} ريال سعودي",
+                "التكلفة_الكلية": "مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {r.land_area:,.0f} * {r.land_price_per_sqm:,.0f} = {r.land_cost:,.0f} ريال سعودي",
+                "نتيجة_التكلفة_الكلية": "{r.land_cost:,.0f} ريال سعودي"
+            },
+            "تكاليف_البناء": {
+                "تكلفة_البناء_لكل_متر_مربع": "{r.construction_cost_per_sqm:,.0f} ريال سعودي",
+                "مجموع_تكاليف_البناء": "نتيجة_مساحة_البناء_الفعالة * تكلفة_البناء_لكل_متر_مربع = {r.total_area:,.0f} * {r.construction_cost_per_sqm:,.0f} = {r.construction_cost:,.0f} ريال سعودي",
+                "نتيجة_مجموع_تكاليف_البناء": "{r.construction_cost:,.0f} ريال سعودي",
+                "التكاليف_الإضافية": {
+                    "تصميم_معماري": "500,000 ريال سعودي",
+                    "قانوني_وإداري": "300,000 ريال سعودي",
+                    "تنسيق_الموقع": "200,000 ريال سعودي"
                 },
-                                "معايير_التطوير": {
-                    "نسبة_البناء_للدور_الأرضي": f"{ratios.ground_floor:.2f}",
-                    "نسبة_البناء_للأدوار_المتكررة": f"{ratios.first_floor:.2f}",
-                    "نسبة_البناء_للملحق_العلوي": f"{ratios.top_floor:.2f}",
-                    "الطوابق_المقترحة": f"{floors}",
-                    "مساحة_البناء_الفعالة_للدور_الأرضي": f"مساحة_الأرض_الإجمالية * نسبة_البناء_للدور_الأرضي: {self.format_number(land_area)} * {ratios.ground_floor:.2f} = {self.format_number(ground_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للمتكرر": f"مساحة_الأرض_الإجمالية * نسبة_البناء_للأدوار_المتكررة: {self.format_number(land_area)} * {ratios.first_floor:.2f} = {self.format_number(first_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للملحق_العلوي": f"مساحة_البناء_الفعالة_للمتكرر * نسبة_البناء_للملحق_العلوي: {self.format_number(first_floor_area)} * {ratios.top_floor:.2f} = {self.format_number(top_floor_area)} متر مربع",
-                    "مساحة_البناء_الفعالة_للأدوار_المتكررة": f"مساحة_البناء_الفعالة_للمتكرر * (الطوابق_المقترحة - 2): {self.format_number(first_floor_area)} * {floors - 2} = {self.format_number(repeated_floors_area)} متر مربع",
-                    "نتيجة_مساحة_البناء_الفعالة": f"مساحة_البناء_الفعالة_للدور_الأرضي + مساحة_البناء_الفعالة_للأدوار_المتكررة + مساحة_البناء_الفعالة_للملحق_العلوي = {self.format_number(ground_floor_area)} + {self.format_number(repeated_floors_area)} + {self.format_number(top_floor_area)} = {self.format_number(total_building_area)} متر مربع",
-                    "معامل_البناء": f"نتيجة_مساحة_البناء_الفعالة / مساحة_الأرض_الإجمالية: {self.format_number(total_building_area)} / {self.format_number(land_area)} = {total_building_area/land_area:.2f}",
-                    "نتيجة_معامل_البناء": f"{total_building_area/land_area:.2f}",
-                    "نطاق_حجم_الوحدات_الإدارية": "100 إلى 200 متر مربع",
-                    "الوحدات_الإدارية_المقترحة": f"نتيجة_مساحة_البناء_الفعالة / متوسط_مساحة_الوحدة: {self.format_number(total_building_area)} / {avg_office_size} = {total_offices}",
-                    "نتيجة_الوحدات_الإدارية_المقترحة": f"{total_offices} وحدة إدارية"
+                "المجموع": "مجموع_تكاليف_البناء + تصميم_معماري + قانوني_وإداري + تنسيق_الموقع = {r.total_construction_cost:,.0f} ريال سعودي",
+                "نتيجة_المجموع": "{r.total_construction_cost:,.0f} ريال سعودي"
+            },
+            "الاستثمار_الكلي": "تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {r.land_cost:,.0f} + {r.total_construction_cost:,.0f}",
+            "نتيجة_الاستثمار_الكلي": "{r.total_investment:,.0f} ريال سعودي",
+            "توقعات_الإيرادات_من_البيع": {
+                "سعر_البيع_لكل_متر_مربع": "{r.sale_price_per_sqm:,.0f} ريال سعودي",
+                "إيرادات_محتملة_من_البيع": "نتيجة_مساحة_البناء_الفعالة * سعر_البيع_لكل_متر_مربع = {r.total_area:,.0f} * {r.sale_price_per_sqm:,.0f} = {r.sales_revenue:,.0f} ريال سعودي",
+                "نتيجة_الإيرادات_المحتملة_من_البيع": "{r.sales_revenue:,.0f} ريال سعودي",
+                "هامش_الربح_الإجمالي": "إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {r.sales_revenue:,.0f} - {r.total_investment:,.0f}",
+                "نتيجة_هامش_الربح_الإجمالي": "{r.gross_margin:,.0f} ريال سعودي",
+                "نسبة_هامش_الربح_الإجمالي": "{r.margin_percentage:.2f}%"
+            },
+            "توقعات_الإيرادات_من_الإيجار": {
+                "الإيجار_السنوي_المتوقع_لكل_متر_مربع": "{r.annual_rent_per_sqm:,.0f} ريال سعودي",
+                "الإيجار_السنوي_الكلي": "نتيجة_مساحة_البناء_الفعالة * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {r.total_area:,.0f} * {r.annual_rent_per_sqm:,.0f} = {r.annual_rent:,.0f} ريال سعودي",
+                "نتيجة_الإيجار_السنوي_الكلي": "{r.annual_rent:,.0f} ريال سعودي",
+                "النفقات_التشغيلية": "20% من الإيجار_السنوي_الكلي = {r.operating_expenses:,.0f} ريال سعودي",
+                "نتيجة_النفقات_التشغيلية": "{r.operating_expenses:,.0f} ريال سعودي",
+                "صافي_الإيجار_السنوي": "{r.net_annual_rent:,.0f} ريال سعودي",
+                "عائد_الاستثمار_من_الإيجار": "{r.rental_roi:.2f}%"
+            }
+        },
+        "تقييم_المخاطر": {
+            "تقلبات_السوق": "متوسطة - يتأثر قطاع التجزئة بالتغيرات الاقتصادية وأنماط المستهلكين",
+            "التغييرات_التنظيمية": "منخفضة - القطاع التجاري يتمتع باستقرار تنظيمي",
+            "العوامل_الاقتصادية": "متوسطة - تعتمد على القوة الشرائية والنمو الاقتصادي"
+        },
+        "اعتبارات_استراتيجية": {
+            "اتجاهات_السوق": "نمو متزايد في قطاع التجزئة مع تطور أنماط التسوق",
+            "توقيت_الاستثمار": "مناسب مع تزايد الطلب على المراكز التجارية الحديثة",
+            "التوقعات_طويلة_الأمد": "إيجابية مع استمرار نمو قطاع التجزئة"
+        },
+        "ملخص_تنفيذي": "يمثل المشروع فرصة استثمارية واعدة في قطاع المراكز التجارية المتنامي",
+        "توصيات": "يوصى بالمضي قدماً في المشروع مع التركيز على جذب المستأجرين الرئيسيين وتنويع المحلات التجارية"
+    },
+    "ملخص_تنفيذي": "يقدم المشروع فرصة استثمارية جذابة في قطاع المراكز التجارية مع توقعات عوائد مجزية وإمكانات نمو واعدة"
+}
+
+
+_RESIDENTIAL_TEMPLATE = {
+    "مقدمة": "دراسة جدوى استثمارية لمشروع سكني في {r.location}",
+    "تفاصيل_المشروع": {
+        "الموقع": Slot("r.location"),
+        "مساحة_الأرض": "{r.land_area:,.0f} متر مربع",
+        "عدد_الطوابق": Slot("r.floors"),
+        "إجمالي_مساحة_البناء": "{r.total_area:,.0f} متر مربع",
+        "معامل_البناء": "{r.build_factor:.2f}",
+        "الوحدات_السكنية_المقترحة": "{r.units}"
+    },
+        "معايير_التطوير": {
+        "نسبة_البناء_للدور_الأرضي": "{r.ground_floor_ratio:.2f}",
+        "نسبة_البناء_للأدوار_المتكررة": "{r.upper_floor_ratio:.2f}",
+        "نسبة_البناء_للملحق_العلوي": "{r.top_floor_ratio:.2f}",
+        "مساحة_البناء_الفعالة": "{r.total_area:,.0f} متر مربع",
+        "تفاصيل_المساحات": {
+            "الدور_الأرضي": "{r.ground_floor_area:,.0f} متر مربع",
+            "الأدوار_المتكررة": "{r.repeated_floors_area:,.0f} متر مربع",
+            "الملحق_العلوي": "{r.top_floor_area:,.0f} متر مربع"
+        }
+    },
+    "التكاليف": {
+        "تكلفة_الأرض": {
+            "سعر_المتر": "{r.land_price_per_sqm:,.0f} ريال",
+            "الإجمالي": "{r.land_cost:,.0f} ريال"
+        },
+        "تكلفة_البناء": {
+            "تكلفة_المتر": "{r.construction_cost_per_sqm:,.0f} ريال",
+            "التكلفة_الأساسية": "{r.construction_cost:,.0f} ريال",
+            "التكاليف_الإضافية": {
+                "تصميم_معماري": "200,000 ريال",
+                "قانوني_وإداري": "150,000 ريال",
+                "تنسيق_الموقع": "100,000 ريال"
+            },
+            "الإجمالي": "{r.total_construction_cost:,.0f} ريال"
+        },
+        "إجمالي_الاستثمار": "{r.total_investment:,.0f} ريال"
+    },
+    "العوائد": {
+        "البيع": {
+            "سعر_المتر": "{r.sale_price_per_sqm:,.0f} ريال",
+            "إجمالي_المبيعات": "{r.sales_revenue:,.0f} ريال",
+            "هامش_الربح": "{r.gross_margin:,.0f} ريال",
+            "نسبة_الربحية": "{r.margin_percentage:.2f}%"
+        },
+        "التأجير": {
+            "الإيجار_السنوي_للمتر": "{r.annual_rent_per_sqm:,.0f} ريال",
+            "إجمالي_الإيجار_السنوي": "{r.annual_rent:,.0f} ريال",
+            "النفقات_التشغيلية": "{r.operating_expenses:,.0f} ريال",
+            "صافي_الإيجار_السنوي": "{r.net_annual_rent:,.0f} ريال",
+            "عائد_الاستثمار": "{r.rental_roi:.2f}%"
+        }
+    },
+    "تقييم_المخاطر": _RISK_ASSESSMENT,
+    "اعتبارات_استراتيجية": _STRATEGIC_CONSIDERATIONS,
+    "ملخص_تنفيذي": _EXECUTIVE_SUMMARY,
+    "توصيات": _RECOMMENDATIONS
+}
+
+
+_SINGLE_VILLA_TEMPLATE = {
+    "مقدمة": "دراسة جدوى استثمارية لمشروع فيلا سكنية في {r.location}",
+    "العنوان": "مشروع تطوير فيلا سكنية في {r.location}",
+    "تقرير_تحليل_الاستثمار": {
+        "مقدمة": "هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع فيلا فاخرة في {r.location} بالرياض. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
+        "تفاصيل_المشروع": {
+            "الموقع": "{r.location}، الرياض",
+            "مساحة_الأرض_الإجمالية": "{r.land_area:,.0f} متر مربع",
+            "نوع_المشروع": "تطوير سكني فردي",
+            "تنظيمات_التخطيط": "يسمح ببناء حتى {r.floors} طوابق"
+        },
+        "معايير_التطوير": {
+            "نسبة_البناء_للدور_الأرضي": "{r.ground_floor_ratio:.2f}",
+            "نسبة_البناء_للأدوار_المتكررة": "{r.upper_floor_ratio:.2f}",
+            "نسبة_البناء_للملحق_العلوي": "{r.top_floor_ratio:.2f}",
+            "الطوابق_المقترحة": "{r.floors}",
+            "مساحة_البناء_الفعالة_للدور_الأرضي": "مساحة_الأرض_الإجمالية * نسبة_البناء_للدور_الأرضي: {r.land_area:,.0f} * {r.ground_floor_ratio:.2f} = {r.ground_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للمتكرر": "مساحة_الأرض_الإجمالية * نسبة_البناء_للأدوار_المتكررة: {r.land_area:,.0f} * {r.upper_floor_ratio:.2f} = {r.upper_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للملحق_العلوي": "مساحة_البناء_الفعالة_للمتكرر * نسبة_البناء_للملحق_العلوي: {r.upper_floor_area:,.0f} * {r.top_floor_ratio:.2f} = {r.top_floor_area:,.0f} متر مربع",
+            "نتيجة_مساحة_البناء_الفعالة": "{r.ground_floor_area:,.0f} + {r.upper_floor_area:,.0f} + {r.top_floor_area:,.0f} = {r.total_area:,.0f} متر مربع",
+            "معامل_البناء": "نتيجة_مساحة_البناء_الفعالة / مساحة_الأرض_الإجمالية: {r.total_area:,.0f} / {r.land_area:,.0f} = {r.build_factor:.2f}",
+            "نتيجة_معامل_البناء": "{r.build_factor:.2f}"
+        },
+    "توقعات_التمويل": {
+            "تكلفة_شراء_الأرض": {
+                "تكلفة_الشراء_لكل_متر_مربع": "{r.land_price_per_sqm:,.0f} ريال سعودي",
+                "التكلفة_الكلية": "مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {r.land_area:,.0f} * {r.land_price_per_sqm:,.0f}",
+                "نتيجة_التكلفة_الكلية": "{r.land_cost:,.0f} ريال سعودي"
+            },
+            "تكاليف_البناء": {
+                "تكلفة_البناء_لكل_متر_مربع": "1,400 ريال سعودي",
+                "مجموع_تكاليف_البناء": "نتيجة_مساحة_البناء_الفعالة * تكلفة_البناء_لكل_متر_مربع = {r.total_area:,.0f} * 1,400",
+                "نتيجة_مجموع_تكاليف_البناء": "{r.construction_cost:,.0f} ريال سعودي",
+                "التكاليف_الإضافية": {
+                    "تصميم_معماري": "200,000 ريال سعودي",
+                    "قانوني_وإداري": "150,000 ريال سعودي",
+                    "تنسيق_الموقع": "100,000 ريال سعودي"
                 },
-                "توقعات_التمويل": {
-                    "تكلفة_شراء_الأرض": {
-                        "تكلفة_الشراء_لكل_متر_مربع": f"{self.format_number(self.location_prices[location])} ريال سعودي",
-                        "التكلفة_الكلية": f"مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {self.format_number(land_area)} * {self.format_number(self.location_prices[location])}",
-                        "نتيجة_التكلفة_الكلية": f"{self.format_number(land_area * self.location_prices[location])} ريال سعودي"
-                    },
-                    "تكاليف_البناء": {
-                        "تكلفة_البناء_لكل_متر_مربع": "1,400 ريال سعودي",
-                        "مجموع_تكاليف_البناء": f"نتيجة_مساحة_البناء_الفعالة * تكلفة_البناء_لكل_متر_مربع = {self.format_number(total_building_area)} * 1,400",
-                        "نتيجة_مجموع_تكاليف_البناء": f"{self.format_number(total_building_area * 1400)} ريال سعودي",
-                        "التكاليف_الإضافية": {
-                            "تصميم_معماري": "200,000 ريال سعودي",
-                            "قانوني_وإداري": "150,000 ريال سعودي",
-                            "تنسيق_الموقع": "100,000 ريال سعودي"
-                        },
-                        "مجموع_التكاليف_الإضافية": "450,000 ريال سعودي",
-                        "المجموع": f"مجموع_تكاليف_البناء + مجموع_التكاليف_الإضافية = {self.format_number(total_building_area * 1400)} + 450,000",
-                        "نتيجة_المجموع": f"{self.format_number(total_building_area * 1400 + 450000)} ريال سعودي"
-                    },
-                                        "الاستثمار_الكلي": f"تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {self.format_number(land_area * self.location_prices[location])} + {self.format_number(total_building_area * 1400 + 450000)}",
-                    "نتيجة_الاستثمار_الكلي": f"{self.format_number(land_area * self.location_prices[location] + total_building_area * 1400 + 450000)} ريال سعودي",
-                    "توقعات_الإيرادات_من_البيع": {
-                        "سعر_البيع_لكل_متر_مربع": f"{self.format_number(self.location_prices[location] * 1.4)} ريال سعودي",
-                        "إيرادات_محتملة_من_البيع": f"نتيجة_مساحة_البناء_الفعالة * سعر_البيع_لكل_متر_مربع = {self.format_number(total_building_area)} * {self.format_number(self.location_prices[location] * 1.4)}",
-                        "نتيجة_الإيرادات_المحتملة_من_البيع": f"{self.format_number(total_building_area * self.location_prices[location] * 1.4)} ريال سعودي",
-                        "هامش_الربح_الإجمالي": f"إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {self.format_number(total_building_area * self.location_prices[location] * 1.4)} - {self.format_number(land_area * self.location_prices[location] + total_building_area * 1400 + 450000)}",
-                        "نتيجة_هامش_الربح_الإجمالي": f"{self.format_number(total_building_area * self.location_prices[location] * 1.4 - (land_area * self.location_prices[location] + total_building_area * 1400 + 450000))} ريال سعودي",
-                        "نسبة_هامش_الربح_الإجمالي": f"{((total_building_area * self.location_prices[location] * 1.4 - (land_area * self.location_prices[location] + total_building_area * 1400 + 450000)) / (land_area * self.location_prices[location] + total_building_area * 1400 + 450000)) * 100:.2f}%"
-                    },
-                    "توقعات_الإيرادات_من_الإيجار": {
-                        "الإيجار_السنوي_المتوقع_لكل_متر_مربع": f"{self.format_number(self.location_prices[location] * 0.18)} ريال سعودي",
-                        "الإيجار_السنوي_الكلي": f"نتيجة_مساحة_البناء_الفعالة * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {self.format_number(total_building_area)} * {self.format_number(self.location_prices[location] * 0.18)}",
-                        "نتيجة_الإيجار_السنوي_الكلي": f"{self.format_number(total_building_area * self.location_prices[location] * 0.18)} ريال سعودي",
-                        "النفقات_التشغيلية": f"20% من الإيجار_السنوي_الكلي = 0.20 * {self.format_number(total_building_area * self.location_prices[location] * 0.18)}",
-                        "نتيجة_النفقات_التشغيلية": f"{self.format_number(total_building_area * self.location_prices[location] * 0.18 * 0.20)} ريال سعودي",
-                        "صافي_الإيجار_السنوي": f"الإيجار_السنوي_الكلي - النفقات_التشغيلية = {self.format_number(total_building_area * self.location_prices[location] * 0.18)} - {self.format_number(total_building_area * self.location_prices[location] * 0.18 * 0.20)}",
-                        "نتيجة_صافي_الإيجار_السنوي": f"{self.format_number(total_building_area * self.location_prices[location] * 0.18 * 0.80)} ريال سعودي",
-                        "عائد_الاستثمار_من_الإيجار": f"صافي_الإيجار_السنوي / الاستثمار_الكلي * 100 = {self.format_number(total_building_area * self.location_prices[location] * 0.18 * 0.80)} / {self.format_number(land_area * self.location_prices[location] + total_building_area * 1400 + 450000)} * 100",
-                        "نتيجة_عائد_الاستثمار_من_الإيجار": f"{(total_building_area * self.location_prices[location] * 0.18 * 0.80 / (land_area * self.location_prices[location] + total_building_area * 1400 + 450000)) * 100:.2f}%"
-                    }
+                "مجموع_التكاليف_الإضافية": "450,000 ريال سعودي",
+                "المجموع": "مجموع_تكاليف_البناء + مجموع_التكاليف_الإضافية = {r.construction_cost:,.0f} + 450,000",
+                "نتيجة_المجموع": "{r.total_construction_cost:,.0f} ريال سعودي"
+            },
+            "الاستثمار_الكلي": "تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {r.land_cost:,.0f} + {r.total_construction_cost:,.0f}",
+            "نتيجة_الاستثمار_الكلي": "{r.total_investment:,.0f} ريال سعودي",
+            "توقعات_الإيرادات_من_البيع": {
+                "سعر_البيع_لكل_متر_مربع": "{r.sale_price_per_sqm:,.0f} ريال سعودي",
+                "إيرادات_محتملة_من_البيع": "نتيجة_مساحة_البناء_الفعالة * سعر_البيع_لكل_متر_مربع = {r.total_area:,.0f} * {r.sale_price_per_sqm:,.0f}",
+                "نتيجة_الإيرادات_المحتملة_من_البيع": "{r.sales_revenue:,.0f} ريال سعودي",
+                "هامش_الربح_الإجمالي": "إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {r.sales_revenue:,.0f} - {r.total_investment:,.0f}",
+                "نتيجة_هامش_الربح_الإجمالي": "{r.gross_margin:,.0f} ريال سعودي",
+                "نسبة_هامش_الربح_الإجمالي": "{r.margin_percentage:.2f}%"
+            },
+            "توقعات_الإيرادات_من_الإيجار": {
+                "الإيجار_السنوي_المتوقع_لكل_متر_مربع": "{r.annual_rent_per_sqm:,.0f} ريال سعودي",
+                "الإيجار_السنوي_الكلي": "نتيجة_مساحة_البناء_الفعالة * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {r.total_area:,.0f} * {r.annual_rent_per_sqm:,.0f}",
+                "نتيجة_الإيجار_السنوي_الكلي": "{r.annual_rent:,.0f} ريال سعودي",
+                "النفقات_التشغيلية": "20% من الإيجار_السنوي_الكلي = 0.20 * {r.annual_rent:,.0f}",
+                "نتيجة_النفقات_التشغيلية": "{r.operating_expenses:,.0f} ريال سعودي",
+                "صافي_الإيجار_السنوي": "الإيجار_السنوي_الكلي - النفقات_التشغيلية = {r.annual_rent:,.0f} - {r.operating_expenses:,.0f}",
+                "نتيجة_صافي_الإيجار_السنوي": "{r.net_annual_rent:,.0f} ريال سعودي",
+                "عائد_الاستثمار_من_الإيجار": "صافي_الإيجار_السنوي / الاستثمار_الكلي * 100 = {r.net_annual_rent:,.0f} / {r.total_investment:,.0f} * 100",
+                "نتيجة_عائد_الاستثمار_من_الإيجار": "{r.rental_roi:.2f}%"
+            }
+        },
+        "تقييم_المخاطر": {
+            "تقلبات_السوق": "متوسطة - يواجه سوق العقارات في الرياض تقلبات دورية.",
+            "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
+            "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
+        },
+        "اعتبارات_استراتيجية": {
+            "اتجاهات_السوق": "يشهد سوق العقارات في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
+            "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
+            "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا لكل من العوائد الفورية والمستقبلية."
+        },
+        "ملخص_تنفيذي": "يمثل التطوير المقترح في {r.location} استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. تشير التوقعات المالية إلى عائد استثماري صلب مع مخاطر قابلة للإدارة.",
+        "توصيات": "المضي قدماً في الاستحواذ والتطوير، مع ضمان إدارة صارمة للتكاليف والالتزام بالجداول الزمنية المتوقعة لتعظيم الربحية."
+    },
+    "ملخص_تنفيذي": "مشروع تطوير فيلا سكنية في {r.location} يمثل فرصة استثمارية واعدة مع توقعات عوائد جيدة"
+}
+
+
+_COMPOUND_TEMPLATE = {
+    "مقدمة": "دراسة جدوى استثمارية لمشروع مجمع سكني في {r.location}",
+    "العنوان": "مشروع تطوير مجمع سكني في {r.location}",
+    "تقرير_تحليل_الاستثمار": {
+        "مقدمة": "هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع مجمع سكني في {r.location} بالرياض. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
+        "تفاصيل_المشروع": {
+            "الموقع": "{r.location}، الرياض",
+            "مساحة_الأرض_الإجمالية": "{r.land_area:,.0f} متر مربع",
+            "نوع_المشروع": "تطوير مجمع سكني",
+            "عدد_العمارات_المقترحة": "{r.buildings} عمارات",
+            "تنظيمات_التخطيط": "يسمح ببناء حتى {r.floors} طوابق"
+        },
+        "معايير_التطوير": {
+            "نسبة_البناء_الفعالة_على_الأرض": "{r.effective_land_ratio * 100}%",
+            "مساحة_الأرض_الفعالة_للبناء": "{r.effective_land_area:,.0f} متر مربع",
+            "مساحة_العمارة": "{r.building_area:,.0f} متر مربع",
+            "معامل_البناء_للأرض": "{r.effective_land_ratio:.2f}",
+            "نسبة_البناء_للدور_الأرضي": "{r.ground_floor_ratio:.2f}",
+            "نسبة_البناء_للأدوار_المتكررة": "{r.upper_floor_ratio:.2f}",
+            "نسبة_البناء_للملحق_العلوي": "{r.top_floor_ratio:.2f}",
+            "الطوابق_المقترحة": "{r.floors}",
+            "مساحة_البناء_الفعالة_للدور_الأرضي": "{r.ground_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للمتكرر": "{r.upper_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للملحق_العلوي": "{r.top_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للأدوار_المتكررة": "{r.repeated_floors_area:,.0f} متر مربع",
+            "نتيجة_مساحة_البناء_الفعالة_للعمارة": "{r.total_building_area:,.0f} متر مربع",
+            "معامل_البناء": "{r.build_factor:.2f}",
+            "مجموع_مساحة_البناء_الفعالة_للكومباوند": "{r.total_area:,.0f} متر مربع",
+            "نطاق_حجم_الوحدات_السكنية": "90 إلى 150 متر مربع",
+            "الوحدات_السكنية_المقترحة_لكل_عمارة": "{r.units_per_building}",
+            "عدد_الوحدات_السكنية_في_المشروع": "{r.units}"
+        },
+    "توقعات_التمويل": {
+            "تكلفة_شراء_الأرض": {
+                    "تكلفة_الشراء_لكل_متر_مربع": "{r.land_price_per_sqm:,.0f} ريال سعودي",
+                    "التكلفة_الكلية": "مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {r.land_area:,.0f} * {r.land_price_per_sqm:,.0f}",
+                    "نتيجة_التكلفة_الكلية": "{r.land_cost:,.0f} ريال سعودي"
                 },
-                "تقييم_المخاطر": {
-                    "تقلبات_السوق": "متوسطة - يواجه سوق العقارات التجارية في الرياض تقلبات دورية.",
-                    "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
-                    "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات التجارية."
+            "تكاليف_البناء": {
+                "تكلفة_البناء_لكل_متر_مربع": "1,400 ريال سعودي",
+                "مجموع_تكاليف_البناء": "مجموع_مساحة_البناء_الفعالة_للكومباوند * تكلفة_البناء_لكل_متر_مربع = {r.total_area:,.0f} * 1,400",
+                "نتيجة_مجموع_تكاليف_البناء": "{r.construction_cost:,.0f} ريال سعودي",
+                "التكاليف_الإضافية": {
+                    "تصميم_معماري": "200,000 ريال سعودي",
+                    "قانوني_وإداري": "150,000 ريال سعودي",
+                    "تنسيق_الموقع": "100,000 ريال سعودي"
                 },
-                "اعتبارات_استراتيجية": {
-                    "اتجاهات_السوق": "يشهد سوق العقارات التجارية في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
-                    "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
-                    "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مع توقعات نمو في الطلب على المساحات المكتبية."
+                "مجموع_التكاليف_الإضافية": "450,000 ريال سعودي",
+                "المجموع": "مجموع_تكاليف_البناء + مجموع_التكاليف_الإضافية = {r.construction_cost:,.0f} + 450,000",
+                "نتيجة_المجموع": "{r.total_construction_cost:,.0f} ريال سعودي"
+            },
+            "الاستثمار_الكلي": "تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {r.land_cost:,.0f} + {r.total_construction_cost:,.0f}",
+            "نتيجة_الاستثمار_الكلي": "{r.total_investment:,.0f} ريال سعودي",
+            "توقعات_الإيرادات_من_البيع": {
+                "سعر_البيع_لكل_متر_مربع": "{r.sale_price_per_sqm:,.0f} ريال سعودي",
+                "إيرادات_محتملة_من_البيع": "مجموع_مساحة_البناء_الفعالة_للكومباوند * سعر_البيع_لكل_متر_مربع = {r.total_area:,.0f} * {r.sale_price_per_sqm:,.0f}",
+                "نتيجة_الإيرادات_المحتملة_من_البيع": "{r.sales_revenue:,.0f} ريال سعودي",
+                "هامش_الربح_الإجمالي": "إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {r.sales_revenue:,.0f} - {r.total_investment:,.0f}",
+                "نتيجة_هامش_الربح_الإجمالي": "{r.gross_margin:,.0f} ريال سعودي",
+                "نسبة_هامش_الربح_الإجمالي": "{r.margin_percentage:.2f}%"
+            },
+            "توقعات_الإيرادات_من_الإيجار": {
+                "الإيجار_السنوي_المتوقع_لكل_متر_مربع": "{r.annual_rent_per_sqm:,.0f} ريال سعودي",
+                "الإيجار_السنوي_الكلي": "مجموع_مساحة_البناء_الفعالة_للكومباوند * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {r.total_area:,.0f} * {r.annual_rent_per_sqm:,.0f}",
+                "نتيجة_الإيجار_السنوي_الكلي": "{r.annual_rent:,.0f} ريال سعودي",
+                "النفقات_التشغيلية": "20% من الإيجار_السنوي_الكلي = 0.20 * {r.annual_rent:,.0f}",
+                "نتيجة_النفقات_التشغيلية": "{r.operating_expenses:,.0f} ريال سعودي",
+                "صافي_الإيجار_السنوي": "الإيجار_السنوي_الكلي - النفقات_التشغيلية = {r.annual_rent:,.0f} - {r.operating_expenses:,.0f}",
+                "نتيجة_صافي_الإيجار_السنوي": "{r.net_annual_rent:,.0f} ريال سعودي",
+                "عائد_الاستثمار_من_الإيجار": "صافي_الإيجار_السنوي / الاستثمار_الكلي * 100 = {r.net_annual_rent:,.0f} / {r.total_investment:,.0f} * 100",
+                "نتيجة_عائد_الاستثمار_من_الإيجار": "{r.rental_roi:.2f}%"
+            }
+        },
+        "تقييم_المخاطر": {
+            "تقلبات_السوق": "متوسطة - يواجه سوق العقارات في الرياض تقلبات دورية.",
+            "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
+            "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
+        },
+        "اعتبارات_استراتيجية": {
+            "اتجاهات_السوق": "يشهد سوق العقارات في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
+            "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
+            "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا لكل من العوائد الفورية والمستقبلية."
+        },
+        "ملخص_تنفيذي": "يمثل التطوير المقترح في {r.location} استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. يتضمن المشروع {r.buildings} عمارات بإجمالي {r.units} وحدة سكنية.",
+        "توصيات": "المضي قدماً في الاستحواذ والتطوير، مع ضمان إدارة صارمة للتكاليف والالتزام بالجداول الزمنية المتوقعة لتعظيم الربحية."
+    },
+    "ملخص_تنفيذي": "مشروع تطوير مجمع سكني في {r.location} يمثل فرصة استثمارية واعدة مع {r.units} وحدة سكنية وتوقعات عوائد جيدة"
+}
+
+
+_VILLA_COMPOUND_TEMPLATE = {
+    "مقدمة": "دراسة جدوى استثمارية لمشروع مجمع فلل سكنية في {r.location}",
+    "العنوان": "مشروع تطوير مجمع فلل سكنية في {r.location}",
+    "تقرير_تحليل_الاستثمار": {
+        "مقدمة": "هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع فلل فاخر في {r.location} بالرياض. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
+        "تفاصيل_المشروع": {
+            "الموقع": "{r.location}، الرياض",
+            "مساحة_الأرض_الإجمالية": "{r.land_area:,.0f} متر مربع",
+            "نوع_المشروع": "تطوير سكني فردي",
+            "تنظيمات_التخطيط": "يسمح ببناء حتى {r.floors} طوابق"
+        },
+        "معايير_التطوير": {
+            "نسبة_البناء_الفعالة_على_الأرض": "{r.effective_land_ratio * 100}%",
+            "مساحة_الأرض_الفعالة_للبناء": "مساحة_الأرض_الإجمالية * نسبة_البناء_الفعالة_على_الأرض: {r.land_area:,.0f} * {r.effective_land_ratio} = {r.effective_land_area:,.0f} متر مربع",
+            "مساحة_الفيلا": "{r.villa_area:,.0f} متر مربع",
+            "معامل_البناء_للأرض": "مساحة_الأرض_الفعالة_للبناء / مساحة_الأرض_الإجمالية: {r.effective_land_area:,.0f} / {r.land_area:,.0f}",
+            "نتيجة_معامل_البناء_للأرض": "{r.effective_land_ratio:.2f}",
+            "نسبة_البناء_للدور_الأرضي": "{r.ground_floor_ratio:.2f}",
+            "نسبة_البناء_للأدوار_المتكررة": "{r.upper_floor_ratio:.2f}",
+            "نسبة_البناء_للملحق_العلوي": "{r.top_floor_ratio:.2f}",
+            "الطوابق_المقترحة": "{r.floors}",
+            "مساحة_البناء_الفعالة_للدور_الأرضي": "مساحة_الفيلا * نسبة_البناء_للدور_الأرضي: {r.villa_area:,.0f} * {r.ground_floor_ratio:.2f} = {r.ground_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للمتكرر": "مساحة_الفيلا * نسبة_البناء_للأدوار_المتكررة: {r.villa_area:,.0f} * {r.upper_floor_ratio:.2f} = {r.upper_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للملحق_العلوي": "مساحة_البناء_الفعالة_للمتكرر * نسبة_البناء_للملحق_العلوي: {r.upper_floor_area:,.0f} * {r.top_floor_ratio:.2f} = {r.top_floor_area:,.0f} متر مربع",
+            "نتيجة_مساحة_البناء_الفعالة": "{r.total_villa_area:,.0f} متر مربع",
+            "عدد_الفلل_المقترح": "مساحة_الأرض_الفعالة_للبناء / مساحة_الفيلا: {r.effective_land_area:,.0f} / {r.villa_area:,.0f} = {r.villas}",
+            "مجموع_مساحة_البناء_الفعالة_للكومباوند": "نتيجة_مساحة_البناء_الفعالة * عدد_الفلل_المقترح: {r.total_villa_area:,.0f} * {r.villas} = {r.total_area:,.0f} متر مربع",
+            "معامل_البناء": "مجموع_مساحة_البناء_الفعالة_للكومباوند / مساحة_الأرض_الإجمالية: {r.total_area:,.0f} / {r.land_area:,.0f} = {r.build_factor:.2f}",
+            "نتيجة_معامل_البناء": "{r.build_factor:.2f}",
+            "نتيجة_عدد_الفلل_المقترح": "{r.villas}"
+        },
+    "توقعات_التمويل": {
+            "تكلفة_شراء_الأرض": {
+                "تكلفة_الشراء_لكل_متر_مربع": "{r.land_price_per_sqm:,.0f} ريال سعودي",
+                "التكلفة_الكلية": "مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {r.land_area:,.0f} * {r.land_price_per_sqm:,.0f}",
+                "نتيجة_التكلفة_الكلية": "{r.land_cost:,.0f} ريال سعودي"
+            },
+            "تكاليف_البناء": {
+                "تكلفة_البناء_لكل_متر_مربع": "2,000 ريال سعودي",
+                "مجموع_تكاليف_البناء": "مجموع_مساحة_البناء_الفعالة_للكومباوند * تكلفة_البناء_لكل_متر_مربع = {r.total_area:,.0f} * 2,000",
+                "نتيجة_مجموع_تكاليف_البناء": "{r.construction_cost:,.0f} ريال سعودي",
+                "التكاليف_الإضافية": {
+                    "تصميم_معماري": "200,000 ريال سعودي",
+                    "قانوني_وإداري": "150,000 ريال سعودي",
+                    "تنسيق_الموقع": "100,000 ريال سعودي"
                 },
-                "ملخص_تنفيذي": f"يمثل التطوير المقترح في {location} استثمارًا استراتيجيًا في سوق المكاتب المتنامي. يوفر المشروع {total_offices} وحدة إدارية بمساحات مرنة تلبي احتياجات السوق.",
-                "توصيات": "المضي قدماً في التطوير مع التركيز على جودة التشطيبات والمرافق لتحقيق أعلى عائد ممكن من الإيجارات."
+                "مجموع_التكاليف_الإضافية": "450,000 ريال سعودي",
+                "المجموع": "مجموع_تكاليف_البناء + مجموع_التكاليف_الإضافية = {r.construction_cost:,.0f} + 450,000",
+                "نتيجة_المجموع": "{r.total_construction_cost:,.0f} ريال سعودي"
             },
-            "ملخص_تنفيذي": f"مشروع تطوير مبنى إداري في {location} يقدم {total_offices} وحدة إدارية عصرية مع توقعات عوائد جذابة من الإيجار والبيع"
-        }
+            "الاستثمار_الكلي": "تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {r.land_cost:,.0f} + {r.total_construction_cost:,.0f}",
+            "نتيجة_الاستثمار_الكلي": "{r.total_investment:,.0f} ريال سعودي",
+            "توقعات_الإيرادات_من_البيع": {
+                "سعر_البيع_لكل_متر_مربع": "{r.sale_price_per_sqm:,.0f} ريال سعودي",
+                "إيرادات_محتملة_من_البيع": "مجموع_مساحة_البناء_الفعالة_للكومباوند * سعر_البيع_لكل_متر_مربع = {r.total_area:,.0f} * {r.sale_price_per_sqm:,.0f}",
+                "نتيجة_الإيرادات_المحتملة_من_البيع": "{r.sales_revenue:,.0f} ريال سعودي",
+                "هامش_الربح_الإجمالي": "إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {r.sales_revenue:,.0f} - {r.total_investment:,.0f}",
+                "نتيجة_هامش_الربح_الإجمالي": "{r.gross_margin:,.0f} ريال سعودي",
+                "نسبة_هامش_الربح_الإجمالي": "{r.margin_percentage:.2f}%"
+            },
+            "توقعات_الإيرادات_من_الإيجار": {
+                "الإيجار_السنوي_المتوقع_لكل_متر_مربع": "{r.annual_rent_per_sqm:,.0f} ريال سعودي",
+                "الإيجار_السنوي_الكلي": "مجموع_مساحة_البناء_الفعالة_للكومباوند * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {r.total_area:,.0f} * {r.annual_rent_per_sqm:,.0f}",
+                "نتيجة_الإيجار_السنوي_الكلي": "{r.annual_rent:,.0f} ريال سعودي",
+                "النفقات_التشغيلية": "20% من الإيجار_السنوي_الكلي = 0.20 * {r.annual_rent:,.0f}",
+                "نتيجة_النفقات_التشغيلية": "{r.operating_expenses:,.0f} ريال سعودي",
+                "صافي_الإيجار_السنوي": "الإيجار_السنوي_الكلي - النفقات_التشغيلية = {r.annual_rent:,.0f} - {r.operating_expenses:,.0f}",
+                "نتيجة_صافي_الإيجار_السنوي": "{r.net_annual_rent:,.0f} ريال سعودي",
+                "عائد_الاستثمار_من_الإيجار": "صافي_الإيجار_السنوي / الاستثمار_الكلي * 100 = {r.net_annual_rent:,.0f} / {r.total_investment:,.0f} * 100",
+                "نتيجة_عائد_الاستثمار_من_الإيجار": "{r.rental_roi:.2f}%"
+            }
+        },
+        "تقييم_المخاطر": {
+            "تقلبات_السوق": "متوسطة - يواجه سوق العقارات في الرياض تقلبات دورية.",
+            "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
+            "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
+        },
+        "اعتبارات_استراتيجية": {
+            "اتجاهات_السوق": "يشهد سوق العقارات في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
+            "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
+            "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا لكل من العوائد الفورية والمستقبلية."
+        },
+        "ملخص_تنفيذي": "يمثل التطوير المقترح في {r.location} استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. تشير التوقعات المالية إلى عائد استثماري صلب مع مخاطر قابلة للإدارة، متماشية مع ديناميكيات السوق الحالية وآفاق النمو المستقبلية.",
+        "توصيات": "المضي قدماً في الاستحواذ والتطوير، مع ضمان إدارة صارمة للتكاليف والالتزام بالجداول الزمنية المتوقعة لتعظيم الربحية. يُنصح بمراقبة مستمرة لظروف السوق وإعادة تقييم منتظمة للاتجاهات الاستراتيجية."
+    },
+    "ملخص_تنفيذي": "مشروع تطوير مجمع فلل سكنية في {r.location} يمثل فرصة استثمارية واعدة مع توقعات عوائد جيدة"
+}
+
+
+_COMMERCIAL_TEMPLATE = {
+    "مقدمة": "تمثل هذه الدراسة حالة استثمارية لتطوير مبنى تجاري في موقع استراتيجي. تهدف هذه الدراسة إلى تحليل الجدوى المالية وتقدير العوائد المحتملة من المشروع.",
+    "العنوان": "دراسة حالة استثمارية لتطوير مبنى تجاري",
+    "تقرير_تحليل_الاستثمار": {
+        "مقدمة": "هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع مبنى تجاري في موقع متميز. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
+        "تفاصيل_المشروع": {
+            "الموقع": "موقع استراتيجي",
+            "مساحة_الأرض_الإجمالية": "{r.land_area:,.0f} متر مربع",
+            "نوع_المشروع": "تطوير مبنى تجاري",
+            "تنظيمات_التخطيط": "يسمح ببناء حتى {r.floors} طوابق"
+        },
+        "معايير_التطوير": {
+            "نسبة_البناء_للدور_الأرضي": "{r.ground_floor_ratio}",
+            "نسبة_البناء_للأدوار_المتكررة": "{r.upper_floor_ratio}",
+            "نسبة_البناء_للملحق_العلوي": "{r.top_floor_ratio}",
+            "الطوابق_المقترحة": "{r.floors}",
+            "مساحة_البناء_الفعالة_للدور_الأرضي": "مساحة_الأرض_الإجمالية * نسبة_البناء_للدور_الأرضي = {r.land_area:,.0f} * {r.ground_floor_ratio} = {r.ground_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للمتكرر": "مساحة_الأرض_الإجمالية * نسبة_البناء_للأدوار_المتكررة = {r.land_area:,.0f} * {r.upper_floor_ratio} = {r.upper_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للملحق_العلوي": "مساحة_البناء_الفعالة_للمتكرر * نسبة_البناء_للملحق_العلوي = {r.upper_floor_area:,.0f} * {r.top_floor_ratio} = {r.top_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للأدوار_المتكررة": "مساحة_البناء_الفعالة_للمتكرر * (الطوابق_المقترحة - 2) = {r.upper_floor_area:,.0f} * ({r.floors} - 2) = {r.repeated_floors_area:,.0f} متر مربع",
+            "نتيجة_مساحة_البناء_الفعالة": "مساحة_البناء_الفعالة_للدور_الأرضي + مساحة_البناء_الفعالة_للأدوار_المتكررة + مساحة_البناء_الفعالة_للملحق_العلوي = {r.ground_floor_area:,.0f} + {r.repeated_floors_area:,.0f} + {r.top_floor_area:,.0f} = {r.total_area:,.0f} متر مربع",
+            "معامل_البناء": "نتيجة_مساحة_البناء_الفعالة / مساحة_الأرض_الإجمالية = {r.total_area:,.0f} / {r.land_area:,.0f} = {r.build_factor:.3f}",
+            "نتيحة_معامل_البناء": "{r.build_factor:.3f}",
+            "نطاق_حجم_الوحدات-التجارية": "'من 50 إلى 100 متر مربع'",
+            "الوحدات_التجارية_المقترحة": "نتيجة_مساحة_البناء_الفعالة / متوسط مساحة الوحدة = {r.total_area:,.0f} / 75 = {r.units} وحدات تقريبا",
+            "نتيجة_الوحدات_التجارية_المقترحة": "{r.units} وحدات تجارية"
+        },
+    "توقعات_التمويل": {
+            "تكلفة_شراء_الأرض": {
+                "تكلفة_الشراء_لكل_متر_مربع": "{r.land_price_per_sqm:,.0f} ريال سعودي",
+                "التكلفة_الكلية": "مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {r.land_area:,.0f} * {r.land_price_per_sqm:,.0f} = {r.land_cost:,.0f} ريال سعودي",
+                "نتيجة_التكلفة_الكلية": "{r.land_cost:,.0f} ريال سعودي"
+            },
+            "تكاليف_البناء": {
+                "تكلفة_البناء_لكل_متر_مربع": "{r.construction_cost_per_sqm:,.0f} ريال سعودي",
+                "مجموع_تكاليف_البناء": "نتيجة_مساحة_البناء_الفعالة * تكلفة_البناء_لكل_متر_مربع = {r.total_area:,.0f} * {r.construction_cost_per_sqm:,.0f} = {r.construction_cost:,.0f} ريال سعودي",
+                "نتيجة_مجموع_تكاليف_البناء": "{r.construction_cost:,.0f} ريال سعودي",
+                "التكاليف_الإضافية": {
+                    "تصميم_معماري": "200,000 ريال سعودي",
+                    "قانوني_وإداري": "150,000 ريال سعودي",
+                    "تنسيق_الموقع": "100,000 ريال سعودي"
+                },
+                "المجموع": "مجموع_تكاليف_البناء + تصميم_معماري + قانوني_وإداري + تنسيق_الموقع = {r.construction_cost:,.0f} + 200,000 + 150,000 + 100,000 = {r.total_construction_cost:,.0f} ريال سعودي",
+                "نتيجة_المجموع": "{r.total_construction_cost:,.0f} ريال سعودي"
+            },
+            "الاستثمار_الكلي": "تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {r.land_cost:,.0f} + {r.total_construction_cost:,.0f}",
+            "نتيجة_الاستثمار_الكلي": "{r.total_investment:,.0f} ريال سعودي",
+            "توقعات_الإيرادات_من_البيع": {
+                "سعر_البيع_لكل_متر_مربع": "يُقترح {r.sale_price_per_sqm:,.0f} ريال سعودي",
+                "إيرادات_محتملة_من_البيع": "نتيجة_مساحة_البناء_الفعالة * سعر_البيع_لكل_متر_مربع = {r.total_area:,.0f} * {r.sale_price_per_sqm:,.0f} = {r.sales_revenue:,.0f} ريال سعودي",
+                "نتيجة_الإيرادات_المحتملة_من_البيع": "{r.sales_revenue:,.0f} ريال سعودي",
+                "هامش_الربح_الإجمالي": "إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {r.sales_revenue:,.0f} - {r.total_investment:,.0f}",
+                "نتيجة_هامش_الربح_الإجمالي": "{r.gross_margin:,.0f} ريال سعودي",
+                "نسبة_هامش_الربح_الإجمالي": "هامش_الربح_الإجمالي / الاستثمار_الكلي * 100 = {r.gross_margin:,.0f} / {r.total_investment:,.0f} * 100",
+                "نتيجة_نسبة_هامش_الربح_الإجمالي": "{r.margin_percentage:.2f}%"
+            },
+            "توقعات_الإيرادات_من_الإيجار": {
+                "الإيجار_السنوي_المتوقع_لكل_متر_مربع": "(18% من تكلفة_الشراء_لكل_متر_مربع) = {r.annual_rent_per_sqm:,.0f} ريال سعودي",
+                "الإيجار_السنوي_الكلي": "نتيجة_مساحة_البناء_الفعالة * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {r.total_area:,.0f} * {r.annual_rent_per_sqm:,.0f} = {r.annual_rent:,.0f} ريال سعودي",
+                "نتيجة_الإيجار_السنوي_الكلي": "{r.annual_rent:,.0f} ريال سعودي",
+                "النفقات_التشغيلية": "20% من الإيجار_السنوي_الكلي = 0.20 * {r.annual_rent:,.0f} = {r.operating_expenses:,.0f} ريال سعودي",
+                "نتيجة_النفقات_التشغيلية": "{r.operating_expenses:,.0f} ريال سعودي",
+                "صافي_الإيجار_السنوي": "الإيجار_السنوي_الكلي - النفقات_التشغيلية = {r.annual_rent:,.0f} - {r.operating_expenses:,.0f}",
+                "نتيجة_صافي_الإيجار_السنوي": "{r.net_annual_rent:,.0f} ريال سعودي",
+                "عائد_الاستثمار_من_الإيجار": "صافي_الإيجار_السنوي / الاستثمار_الكلي * 100 = {r.net_annual_rent:,.0f} / {r.total_investment:,.0f} * 100",
+                "نتيجة_عائد_الاستثمار_من_الإيجار": "{r.rental_roi:.2f}%"
+            }
+        },
+        "تقييم_المخاطر": {
+            "تقلبات_السوق": "متوسطة - يواجه سوق العقارات تقلبات دورية.",
+            "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
+            "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
+        },
+        "اعتبارات_استراتيجية": {
+            "اتجاهات_السوق": "يشهد سوق العقارات حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
+            "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
+            "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا."
+        },
+        "ملخص_تنفيذي": "يمثل التطوير المقترح استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. تشير التوقعات المالية إلى عائد استثماري صلب مع مخاطر قابلة للإدارة.",
+        "توصيات": "المضي قدماً في الاستحواذ والتطوير مع ضمان إدارة صارمة للتكاليف."
+    },
+    "ملخص_تنفيذي": "يمثل هذا المشروع فرصة استثمارية جذابة بفضل موقعه الاستراتيجي وتوقعات العوائد الإيجابية. رغم وجود بعض المخاطر ، إلا أن هناك إمكانية كبيرة لتحقيق الأرباح في المستقبل القريب."
+}
+
+
+_MIXED_USE_TEMPLATE = {
+    "مقدمة": "تعتبر المشاريع السكنية والتجارية من المقومات الأساسية لتطوير المناطق الحضرية، حيث تسهم في تلبية احتياجات السكان وفي الوقت ذاته تعزز النشاط الاقتصادي. المشروع المقترح في حي النرجس بالرياض يعد فرصة استثمارية واعدة.",
+    "العنوان": "مشروع تطوير مبنى سكني تجاري في {r.location}",
+    "تقرير_تحليل_الاستثمار": {
+        "مقدمة": "هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع مبنى سكني تجاري فاخر في حي النرجس بالرياض. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
+        "تفاصيل_المشروع": {
+            "الموقع": "{r.location}",
+            "مساحة_الأرض_الإجمالية": "{r.land_area:,.0f} متر مربع",
+            "نوع_المشروع": "تطوير سكني وتجاري",
+            "تنظيمات_التخطيط": "يسمح ببناء حتى {r.floors} طوابق"
+        },
+        "معايير_التطوير": {
+            "نسبة_البناء_للدور_الأرضي": "{r.ground_floor_ratio * 100}%",
+            "نسبة_البناء_للأدوار_المتكررة": "{r.upper_floor_ratio * 100}%",
+            "نسبة_البناء_للملحق_العلوي": "{r.top_floor_ratio * 100}%",
+            "الطوابق_المقترحة": "{r.floors}",
+            "مساحة_البناء_الفعالة_للدور_الأرضي": "{r.land_area} * {r.ground_floor_ratio} = {r.ground_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للمتكرر": "{r.land_area} * {r.upper_floor_ratio} = {r.repeated_floors_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للملحق_العلوي": "{r.repeated_floors_area:,.0f} * {r.top_floor_ratio} = {r.top_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للأدوار_المتكررة": "{r.repeated_floors_area:,.0f} * ({r.floors} - 2) = {r.repeated_floors_area:,.0f} متر مربع",
+            "نتيجة_مساحة_البناء_الفعالة": "{r.ground_floor_area:,.0f} + {r.repeated_floors_area:,.0f} + {r.top_floor_area:,.0f} = {r.total_area:,.0f} متر مربع",
+            "معامل_البناء": "{r.total_area:,.0f} / {r.land_area:,.0f} = {r.build_factor:.2f}",
+            "نتيجة_معامل_البناء": "{r.build_factor:.2f}",
+            "أدوار_الوحدات_التجارية": "دور واحد (الدور الأرضي)",
+            "أدوار_الوحدات_السكنية": "{r.floors} - 1 = {r.floors-1}",
+            "مجموع_المساحة_التجارية": "{r.commercial_area:,.0f} متر مربع",
+            "مجموع_المساحة_السكنية": "{r.residential_area:,.0f} متر مربع",
+            "نطاق_حجم_الوحدات-السكنية": "'80 متر مربع إلى 120 متر مربع'",
+            "الوحدات_السكنية_المقترحة": "{r.residential_area:,.0f} / 100 = {r.residential_area/100:.1f} وحدة سكنية",
+            "نتيجة_الوحدات_السكنية_المقترحة": "{int(r.residential_area/100)} وحدة سكنية",
+            "نطاق_حجم_الوحدات-التجارية": "'60 متر مربع إلى 100 متر مربع'",
+            "الوحدات_التجارية_المقترحة": "{r.commercial_area:,.0f} / 80 = {r.commercial_area/80:.4f} وحدة تجارية",
+            "نتيجة_الوحدات_التجارية_المقترحة": "{int(r.commercial_area/80)} وحدة تجارية"
+        },
+    "توقعات_التمويل": {
+            "تكلفة_شراء_الأرض": {
+                "تكلفة_الشراء_لكل_متر_مربع": "{r.land_price_per_sqm:,.0f} ريال سعودي",
+                "التكلفة_الكلية": "{r.land_area:,.0f} * {r.land_price_per_sqm:,.0f} = {r.land_cost:,.0f} ريال سعودي",
+                "نتيجة_التكلفة_الكلية": "{r.land_cost:,.0f} ريال سعودي"
+            },
+            "تكاليف_البناء": {
+                "تكلفة_البناء_لكل_متر_مربع": "{r.construction_cost_per_sqm:,.0f} ريال سعودي",
+                "مجموع_تكاليف_البناء": "{r.total_area:,.0f} * {r.construction_cost_per_sqm} = {r.construction_cost:,.0f} ريال سعودي",
+                "التكاليف_الإضافية": {
+                    "تصميم_معماري": "300,000 ريال سعودي",
+                    "قانوني_وإداري": "200,000 ريال سعودي",
+                    "تنسيق_الموقع": "150,000 ريال سعودي"
+                },
+                "المجموع": "{r.construction_cost:,.0f} + 300,000 + 200,000 + 150,000 = {r.total_construction_cost:,.0f} ريال سعودي",
+                "نتيجة_المجموع": "{r.total_construction_cost:,.0f} ريال سعودي"
+            },
+            "الاستثمار_الكلي": "{r.land_cost:,.0f} + {r.total_construction_cost:,.0f} = {r.total_investment:,.0f} ريال سعودي",
+            "نتيجة_الاستثمار_الكلي": "{r.total_investment:,.0f} ريال سعودي",
+            "توقعات_الإيرادات_من_البيع": {
+                "سعر_البيع_السكني_لكل_متر_مربع": "{r.residential_sale_price_per_sqm:,.0f} ريال سعودي",
+                "سعر_البيع_التجاري_لكل_متر_مربع": "{r.commercial_sale_price_per_sqm:,.0f} ريال سعودي",
+                "إيرادات_محتملة_من_البيع_السكني": "{r.residential_area:,.0f} * {r.residential_sale_price_per_sqm:,.0f} = {r.residential_sales_revenue:,.0f} ريال سعودي",
+                "إيرادات_محتملة_من_البيع_التجاري": "{r.commercial_area:,.0f} * {r.commercial_sale_price_per_sqm:,.0f} = {r.commercial_sales_revenue:,.0f} ريال سعودي",
+                "نتيجة_الإيرادات_المحتملة_من_البيع": "{r.residential_sales_revenue:,.0f} + {r.commercial_sales_revenue:,.0f} = {r.sales_revenue:,.0f} ريال سعودي",
+                "هامش_الربح_الإجمالي": "{r.sales_revenue:,.0f} - {r.total_investment:,.0f} = {r.gross_margin:,.0f} ريال سعودي",
+                "نتيجة_هامش_الربح_الإجمالي": "{r.gross_margin:,.0f} ريال سعودي",
+                "نسبة_هامش_الربح_الإجمالي": "({r.gross_margin:,.0f} / {r.total_investment:,.0f}) * 100 = {r.margin_percentage:.2f}%",
+                "نتيجة_نسبة_هامش_الربح_الإجمالي": "{r.margin_percentage:.2f}%"
+            },
+            "توقعات_الإيرادات_من_الإيجار": {
+                "الإيجار_السنوي_المتوقع_للسكني_لكل_متر_مربع": "{r.residential_rent_per_sqm:,.0f} ريال سعودي",
+                "الإيجار_السنوي_المتوقع_للتجاري_لكل_متر_مربع": "{r.commercial_rent_per_sqm:,.0f} ريال سعودي",
+                "الإيجار_السنوي_الكلي_للسكني": "{r.residential_area:,.0f} * {r.residential_rent_per_sqm:,.0f} = {r.residential_annual_rent:,.0f} ريال سعودي",
+                "الإيجار_السنوي_الكلي_للتجاري": "{r.commercial_area:,.0f} * {r.commercial_rent_per_sqm:,.0f} = {r.commercial_annual_rent:,.0f} ريال سعودي",
+                "نتيجة_الإيجار_السنوي_الكلي": "{r.residential_annual_rent:,.0f} + {r.commercial_annual_rent:,.0f} = {r.annual_rent:,.0f} ريال سعودي",
+                "النفقات_التشغيلية": "20% من {r.annual_rent:,.0f} = {r.operating_expenses:,.0f} ريال سعودي",
+                "نتيجة_النفقات_التشغيلية": "{r.operating_expenses:,.0f} ريال سعودي",
+                "صافي_الإيجار_السنوي": "{r.annual_rent:,.0f} - {r.operating_expenses:,.0f} = {r.net_annual_rent:,.0f} ريال سعودي",
+                "نتيجة_صافي_الإيجار_السنوي": "{r.net_annual_rent:,.0f} ريال سعودي",
+                "عائد_الاستثمار_من_الإيجار": "({r.net_annual_rent:,.0f} / {r.total_investment:,.0f}) * 100 = {r.rental_roi:.2f}%",
+                "نتيجة_عائد_الاستثمار_من_الإيجار": "{r.rental_roi:.2f}%"
+            }
+        },
+        "تقييم_المخاطر": {
+            "تقلبات_السوق": "متوسطة - يواجه سوق العقارات في الرياض تقلبات دورية.",
+            "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
+            "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات."
+        },
+        "اعتبارات_استراتيجية": {
+            "اتجاهات_السوق": "يشهد سوق العقارات في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
+            "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
+            "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مما يجعلها استثمارًا جذابًا لكل من العوائد الفورية والمستقبلية."
+        },
+        "ملخص_تنفيذي": "يمثل التطوير المقترح في حي النرجس استثمارًا استراتيجيًا سليمًا مع استراتيجية إيرادية مزدوجة من خلال المبيعات والإيجارات. تشير التوقعات المالية إلى عائد استثماري صلب مع مخاطر قابلة للإدارة، متماشية مع ديناميكيات السوق الحالية وآفاق النمو المستقبلية. يُوصى ببدء المشروع على الفور للاستفادة من ظروف السوق المواتية.",
+        "توصيات": "المضي قدماً في الاستحواذ والتطوير، مع ضمان إدارة صارمة للتكاليف والالتزام بالجداول الزمنية المتوقعة لتعظيم الربحية. يُنصح بمراقبة مستمرة لظروف السوق وإعادة تقييم منتظمة للاتجاهات الاستراتيجية."
+    },
+    "ملخص_تنفيذي": "يعد المشروع المقترح فرصة استثمارية جذابة تمزج بين العوائد المالية العالية في القطاع السكني والتجاري، مع التحكم في المخاطر من خلال تحليل دقيق للأسواق. تبين الدراسة الجدوى الاقتصادية لهذا المشروع ومدة استرداد رأس المال المتوقعة."
+}
+
+
+_ADMIN_BUILDING_TEMPLATE = {
+    "مقدمة": "دراسة جدوى استثمارية لمشروع مبنى إداري في {r.location}",
+    "العنوان": "مشروع تطوير مبنى إداري في {r.location}",
+    "تقرير_تحليل_الاستثمار": {
+        "مقدمة": "هذا التحليل الاستثماري المفصل يقيم جدوى وربحية تطوير مشروع مبنى إداري في {r.location} بالرياض. يشمل التحليل استراتيجيات البيع والإيجار، مع النظر في ديناميكيات السوق الحالية وتقديرات التكاليف والإمكانيات الإيرادية.",
+        "تفاصيل_المشروع": {
+            "الموقع": "{r.location}، الرياض",
+            "مساحة_الأرض_الإجمالية": "{r.land_area:,.0f} متر مربع",
+            "نوع_المشروع": "تطوير مبنى إداري",
+            "تنظيمات_التخطيط": "يسمح ببناء حتى {r.floors} طوابق"
+        },
+        "معايير_التطوير": {
+            "نسبة_البناء_للدور_الأرضي": "{r.ground_floor_ratio:.2f}",
+            "نسبة_البناء_للأدوار_المتكررة": "{r.upper_floor_ratio:.2f}",
+            "نسبة_البناء_للملحق_العلوي": "{r.top_floor_ratio:.2f}",
+            "الطوابق_المقترحة": "{r.floors}",
+            "مساحة_البناء_الفعالة_للدور_الأرضي": "مساحة_الأرض_الإجمالية * نسبة_البناء_للدور_الأرضي: {r.land_area:,.0f} * {r.ground_floor_ratio:.2f} = {r.ground_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للمتكرر": "مساحة_الأرض_الإجمالية * نسبة_البناء_للأدوار_المتكررة: {r.land_area:,.0f} * {r.upper_floor_ratio:.2f} = {r.upper_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للملحق_العلوي": "مساحة_البناء_الفعالة_للمتكرر * نسبة_البناء_للملحق_العلوي: {r.upper_floor_area:,.0f} * {r.top_floor_ratio:.2f} = {r.top_floor_area:,.0f} متر مربع",
+            "مساحة_البناء_الفعالة_للأدوار_المتكررة": "مساحة_البناء_الفعالة_للمتكرر * (الطوابق_المقترحة - 2): {r.upper_floor_area:,.0f} * {r.floors - 2} = {r.repeated_floors_area:,.0f} متر مربع",
+            "نتيجة_مساحة_البناء_الفعالة": "مساحة_البناء_الفعالة_للدور_الأرضي + مساحة_البناء_الفعالة_للأدوار_المتكررة + مساحة_البناء_الفعالة_للملحق_العلوي = {r.ground_floor_area:,.0f} + {r.repeated_floors_area:,.0f} + {r.top_floor_area:,.0f} = {r.total_area:,.0f} متر مربع",
+            "معامل_البناء": "نتيجة_مساحة_البناء_الفعالة / مساحة_الأرض_الإجمالية: {r.total_area:,.0f} / {r.land_area:,.0f} = {r.build_factor:.2f}",
+            "نتيجة_معامل_البناء": "{r.build_factor:.2f}",
+            "نطاق_حجم_الوحدات_الإدارية": "100 إلى 200 متر مربع",
+            "الوحدات_الإدارية_المقترحة": "نتيجة_مساحة_البناء_الفعالة / متوسط_مساحة_الوحدة: {r.total_area:,.0f} / 150 = {r.units}",
+            "نتيجة_الوحدات_الإدارية_المقترحة": "{r.units} وحدة إدارية"
+        },
+    "توقعات_التمويل": {
+            "تكلفة_شراء_الأرض": {
+                "تكلفة_الشراء_لكل_متر_مربع": "{r.land_price_per_sqm:,.0f} ريال سعودي",
+                "التكلفة_الكلية": "مساحة_الأرض_الإجمالية * تكلفة_الشراء_لكل_متر_مربع = {r.land_area:,.0f} * {r.land_price_per_sqm:,.0f}",
+                "نتيجة_التكلفة_الكلية": "{r.land_cost:,.0f} ريال سعودي"
+            },
+            "تكاليف_البناء": {
+                "تكلفة_البناء_لكل_متر_مربع": "1,400 ريال سعودي",
+                "مجموع_تكاليف_البناء": "نتيجة_مساحة_البناء_الفعالة * تكلفة_البناء_لكل_متر_مربع = {r.total_area:,.0f} * 1,400",
+                "نتيجة_مجموع_تكاليف_البناء": "{r.construction_cost:,.0f} ريال سعودي",
+                "التكاليف_الإضافية": {
+                    "تصميم_معماري": "200,000 ريال سعودي",
+                    "قانوني_وإداري": "150,000 ريال سعودي",
+                    "تنسيق_الموقع": "100,000 ريال سعودي"
+                },
+                "مجموع_التكاليف_الإضافية": "450,000 ريال سعودي",
+                "المجموع": "مجموع_تكاليف_البناء + مجموع_التكاليف_الإضافية = {r.construction_cost:,.0f} + 450,000",
+                "نتيجة_المجموع": "{r.total_construction_cost:,.0f} ريال سعودي"
+            },
+            "الاستثمار_الكلي": "تكلفة_شراء_الأرض + مجموع_تكاليف_البناء = {r.land_cost:,.0f} + {r.total_construction_cost:,.0f}",
+            "نتيجة_الاستثمار_الكلي": "{r.total_investment:,.0f} ريال سعودي",
+            "توقعات_الإيرادات_من_البيع": {
+                "سعر_البيع_لكل_متر_مربع": "{r.sale_price_per_sqm:,.0f} ريال سعودي",
+                "إيرادات_محتملة_من_البيع": "نتيجة_مساحة_البناء_الفعالة * سعر_البيع_لكل_متر_مربع = {r.total_area:,.0f} * {r.sale_price_per_sqm:,.0f}",
+                "نتيجة_الإيرادات_المحتملة_من_البيع": "{r.sales_revenue:,.0f} ريال سعودي",
+                "هامش_الربح_الإجمالي": "إيرادات_محتملة_من_البيع - الاستثمار_الكلي = {r.sales_revenue:,.0f} - {r.total_investment:,.0f}",
+                "نتيجة_هامش_الربح_الإجمالي": "{r.gross_margin:,.0f} ريال سعودي",
+                "نسبة_هامش_الربح_الإجمالي": "{r.margin_percentage:.2f}%"
+            },
+            "توقعات_الإيرادات_من_الإيجار": {
+                "الإيجار_السنوي_المتوقع_لكل_متر_مربع": "{r.annual_rent_per_sqm:,.0f} ريال سعودي",
+                "الإيجار_السنوي_الكلي": "نتيجة_مساحة_البناء_الفعالة * الإيجار_السنوي_المتوقع_لكل_متر_مربع = {r.total_area:,.0f} * {r.annual_rent_per_sqm:,.0f}",
+                "نتيجة_الإيجار_السنوي_الكلي": "{r.annual_rent:,.0f} ريال سعودي",
+                "النفقات_التشغيلية": "20% من الإيجار_السنوي_الكلي = 0.20 * {r.annual_rent:,.0f}",
+                "نتيجة_النفقات_التشغيلية": "{r.operating_expenses:,.0f} ريال سعودي",
+                "صافي_الإيجار_السنوي": "الإيجار_السنوي_الكلي - النفقات_التشغيلية = {r.annual_rent:,.0f} - {r.operating_expenses:,.0f}",
+                "نتيجة_صافي_الإيجار_السنوي": "{r.net_annual_rent:,.0f} ريال سعودي",
+                "عائد_الاستثمار_من_الإيجار": "صافي_الإيجار_السنوي / الاستثمار_الكلي * 100 = {r.net_annual_rent:,.0f} / {r.total_investment:,.0f} * 100",
+                "نتيجة_عائد_الاستثمار_من_الإيجار": "{r.rental_roi:.2f}%"
+            }
+        },
+        "تقييم_المخاطر": {
+            "تقلبات_السوق": "متوسطة - يواجه سوق العقارات التجارية في الرياض تقلبات دورية.",
+            "التغييرات_التنظيمية": "مخاطر منخفضة - بيئة تنظيمية مستقرة مع توقعات بتغييرات طفيفة.",
+            "العوامل_الاقتصادية": "عالية - قد تؤثر التنويع الاقتصادي والاستثمار العام بشكل كبير على قيم العقارات التجارية."
+        },
+        "اعتبارات_استراتيجية": {
+            "اتجاهات_السوق": "يشهد سوق العقارات التجارية في الرياض حالياً اتجاهاً تصاعدياً، مدعوماً بالإصلاحات الاقتصادية وزيادة الاستثمار الأجنبي.",
+            "توقيت_الاستثمار": "مثالي - تقدم ظروف السوق الحالية والنمو الاقتصادي المتوقع بيئة مواتية لبدء التطوير.",
+            "التوقعات_طويلة_الأمد": "إمكانية تقدير القيمة طويلة الأمد قوية، مع توقعات نمو في الطلب على المساحات المكتبية."
+        },
+        "ملخص_تنفيذي": "يمثل التطوير المقترح في {r.location} استثمارًا استراتيجيًا في سوق المكاتب المتنامي. يوفر المشروع {r.units} وحدة إدارية بمساحات مرنة تلبي احتياجات السوق.",
+        "توصيات": "المضي قدماً في التطوير مع التركيز على جودة التشطيبات والمرافق لتحقيق أعلى عائد ممكن من الإيجارات."
+    },
+    "ملخص_تنفيذي": "مشروع تطوير مبنى إداري في {r.location} يقدم {r.units} وحدة إدارية عصرية مع توقعات عوائد جذابة من الإيجار والبيع"
+}
+
+
+# Renderers compiled once at import
+_REPORTS = {
+    ProjectType.SHOPPING_MALL: compile_template(_MALL_TEMPLATE, name='_mall_report'),
+    ProjectType.RESIDENTIAL: compile_template(_RESIDENTIAL_TEMPLATE, name='_residential_report'),
+    ProjectType.COMMERCIAL: compile_template(_COMMERCIAL_TEMPLATE, name='_commercial_report'),
+    ProjectType.MIXED_USE: compile_template(_MIXED_USE_TEMPLATE, name='_mixed_use_report'),
+    ProjectType.VILLA: compile_template(_VILLA_COMPOUND_TEMPLATE, name='_villa_compound_report'),
+    ProjectType.SINGLE_VILLA: compile_template(_SINGLE_VILLA_TEMPLATE, name='_single_villa_report'),
+    ProjectType.RESIDENTIAL_COMPOUND: compile_template(_COMPOUND_TEMPLATE, name='_compound_report'),
+    ProjectType.ADMIN_BUILDING: compile_template(_ADMIN_BUILDING_TEMPLATE, name='_admin_building_report'),
+}
+
 
 if __name__ == "__main__":
     calculator = UnifiedCalculator()
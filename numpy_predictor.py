@@ -0,0 +1,109 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+
+from predictor import (UnifiedRealEstatePredictor, ARTIFACT_VERSION, NORMALIZATION_STATS,
+                       SHARED_MODEL)
+from project_types import ProjectType, RatioTable
+
+PRECISIONS = ('float64', 'float16', 'int8')
+
+_INFERENCE_ONLY = ("NumpyPredictor is inference-only; train a UnifiedRealEstatePredictor "
+                   "and export it with export_numpy")
+
+
+def _quantize(kernel: np.ndarray, bias: np.ndarray, precision: str) -> tuple:
+    """Store a Dense layer at the given precision.
+
+    int8 kernels are quantized symmetrically per output channel and carry their
+    float32 scales; the matmul output is rescaled rather than the kernel.
+    """
+    if precision == 'float64':
+        return kernel.astype(np.float64), bias.astype(np.float64)
+    if precision == 'float16':
+        return kernel.astype(np.float16), bias.astype(np.float32)
+    scale = np.abs(kernel).max(axis=0) / 127
+    scale[scale == 0] = 1
+    quantized = np.clip(np.round(kernel / scale), -127, 127).astype(np.int8)
+    return quantized, bias.astype(np.float32), scale.astype(np.float32)
+
+
+class NumpyPredictor(UnifiedRealEstatePredictor):
+    """Inference-only predictor that never imports TensorFlow.
+
+    Serves the .npz written by UnifiedRealEstatePredictor.export_numpy with the
+    same predict, predict_many and report output as the predictor that exported it.
+    With precision "float16" or "int8" the Dense weights are kept in reduced
+    precision and the forward pass runs in float32.
+    """
+
+    def __init__(self, path: str, precision: str = 'float64'):
+        if precision not in PRECISIONS:
+            raise ValueError(f"precision must be one of {', '.join(PRECISIONS)}")
+        super().__init__(fast_inference=True)
+        self.precision = precision
+        stats_dtype = np.float64 if precision == 'float64' else np.float32
+        
+        with np.load(path) as arrays:
+            metadata = json.loads(str(arrays["metadata"]))
+            if metadata.get("format_version") != ARTIFACT_VERSION:
+                raise ValueError(f"Unsupported export version {metadata.get('format_version')} in {path}, "
+                                 f"expected {ARTIFACT_VERSION}")
+            
+            self.location_prices = metadata["location_prices"]
+            self.base_costs = {ProjectType[name]: cost for name, cost in metadata["base_costs"].items()}
+            if "building_ratios" in metadata:
+                self.building_ratios = RatioTable(**metadata["building_ratios"])
+            self.shared_model = metadata["shared_model"]
+            
+            for name, weight_count in metadata["models"].items():
+                key = SHARED_MODEL if name == SHARED_MODEL else ProjectType[name]
+                weights = [arrays[f"{name}/{i}"] for i in range(weight_count)]
+                self._inference_weights[key] = [_quantize(kernel, bias, precision)
+                                                for kernel, bias in zip(weights[::2], weights[1::2])]
+                # Stands in for the Keras model: predict only reads the normalization stats
+                self.models[key] = SimpleNamespace(**{stat: arrays[f"{name}/{stat}"].astype(stats_dtype)
+                                                      for stat in NORMALIZATION_STATS})
+                if key == SHARED_MODEL:
+                    self.shared_trained = True
+                else:
+                    self.is_trained[key] = True
+
+    @classmethod
+    def load(cls, path: str, precision: str = 'float64') -> 'NumpyPredictor':
+        return cls(path, precision)
+
+    def weight_bytes(self) -> int:
+        """Memory held by the inference weights, scales and normalization stats"""
+        total = sum(array.nbytes for layers in self._inference_weights.values()
+                    for layer in layers for array in layer)
+        return total + sum(getattr(model, stat).nbytes for model in self.models.values()
+                           for stat in NORMALIZATION_STATS)
+
+    def _forward(self, project_type, X_norm, type_codes=None):
+        if self.precision != 'float64':
+            X_norm = X_norm.astype(np.float32)
+        return super()._forward(project_type, X_norm, type_codes)
+
+    def train_project_type(self, *args, **kwargs):
+        raise TypeError(_INFERENCE_ONLY)
+
+    def train_shared_model(self, *args, **kwargs):
+        raise TypeError(_INFERENCE_ONLY)
+
+    def train_all(self, *args, **kwargs):
+        raise TypeError(_INFERENCE_ONLY)
+
+    def partial_fit(self, *args, **kwargs):
+        raise TypeError(_INFERENCE_ONLY)
+
+    def train_ensemble(self, *args, **kwargs):
+        # predict_interval trains its ensemble through here on first use
+        raise TypeError(_INFERENCE_ONLY)
+
+    def export_numpy(self, path: str) -> None:
+        raise TypeError("NumpyPredictor is already an export; copy its .npz file instead")
+
+    def save(self, path: str) -> None:
+        raise TypeError("NumpyPredictor cannot write Keras artifacts")
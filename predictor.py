@@ -1,12 +1,176 @@
-import tensorflow as tf
 import numpy as np
+import pandas as pd
 import locale
-from typing import Dict, Any
-from project_types import ProjectType, BuildingParameters, BuildingRatios
+import json
+import os
+import hashlib
+import tempfile
+import multiprocessing
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, Iterable
+from project_types import ProjectType, BuildingParameters, RatioTable, BUILDING_RATIOS
+from estimators import ESTIMATORS, NORMAL_EQUATIONS, LeastSquaresEstimator
+from results import PredictionResult, _market_outlook, _risk_level
+from sweep import SWEEP_AXES, SweepResult
+from telemetry import TrainingReport
 import project_types
 
+MAX_FLOORS = 10
+
+# Bump when the on-disk layout written by UnifiedRealEstatePredictor.save changes
+ARTIFACT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+NORMALIZATION_STATS = ('X_mean', 'X_std', 'y_mean', 'y_std')
+# Normalization stats plus the number of samples they summarize, for streaming updates
+MODEL_STATS = NORMALIZATION_STATS + ('n_seen',)
+
+# Bump when _generate_training_data changes so cached datasets are regenerated
+DATASET_VERSION = 1
+
+VALIDATION_SPLIT = 0.2
+
+# Architecture and training settings used unless tuning.tune stored better ones for a model
+DEFAULT_HYPERPARAMETERS = {'layers': [64, 32, 16], 'learning_rate': 0.001, 'batch_size': 32, 'epochs': 50}
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+# Key of the multi-task model in `models` when one network serves every project type
+SHARED_MODEL = "SHARED"
+PROJECT_TYPE_CODES = {project_type: code for code, project_type in enumerate(ProjectType)}
+
+BATCH_COLUMNS = ('project_type', 'location', 'land_area', 'floors', 'demand', 'competition')
+
+def _to_project_type(value) -> ProjectType:
+    """Accept a ProjectType, its name (e.g. "VILLA") or its Arabic value"""
+    if isinstance(value, ProjectType):
+        return value
+    if value in ProjectType.__members__:
+        return ProjectType[value]
+    return ProjectType(value)
+
+def _tensorflow():
+    """Import TensorFlow on first use so formula-only callers never load it"""
+    import tensorflow as tf
+    return tf
+
+def _dense_layer(X, layer):
+    """X @ kernel + bias, where layer is (kernel, bias) or a quantized (kernel, bias, scale)"""
+    kernel, bias, *scale = layer
+    out = X @ kernel
+    if scale:
+        out = out * scale[0]
+    return out + bias
+
+def _dense_forward(weights, X):
+    """Forward pass of a stack of ReLU Dense layers with a linear output layer"""
+    *hidden, output = weights
+    for layer in hidden:
+        X = np.maximum(_dense_layer(X, layer), 0)
+    return _dense_layer(X, output)
+
+def _init_training_worker(threads: int) -> None:
+    """Limit TensorFlow's thread pools so parallel workers don't oversubscribe cores"""
+    tf = _tensorflow()
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+def _train_in_worker(project_type, seed, rng_seed, location_prices, base_costs, building_ratios, hyperparameters,
+                     train_kwargs, dataset_cache_dir, estimator):
+    """Train one project type in a worker process and return picklable results"""
+    predictor = UnifiedRealEstatePredictor(seed=seed, dataset_cache_dir=dataset_cache_dir, estimator=estimator)
+    predictor.rng = np.random.default_rng(rng_seed)
+    predictor.location_prices = location_prices
+    predictor.base_costs = base_costs
+    predictor.building_ratios = building_ratios
+    predictor.hyperparameters = hyperparameters
+    history = predictor.train_project_type(project_type, **train_kwargs)
+    model = predictor.models[project_type]
+    state = MODEL_STATS + (NORMAL_EQUATIONS if isinstance(model, LeastSquaresEstimator) else ())
+    stats = {key: getattr(model, key) for key in state}
+    return project_type, model.get_weights(), stats, history.history, predictor.training_reports[project_type]
+
+@contextmanager
+def _phase(phase_times: Optional[dict], name: str):
+    """Add the wall time of the block to phase_times[name], if phase_times is given"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if phase_times is not None:
+            phase_times[name] = phase_times.get(name, 0.0) + time.perf_counter() - start
+
+def _combine_moments(n_seen: int, mean: np.ndarray, std: np.ndarray, batch: np.ndarray):
+    """Fold a batch of rows into a running mean and population std (Chan et al. parallel update)"""
+    n_batch = len(batch)
+    total = n_seen + n_batch
+    delta = batch.mean(axis=0) - mean
+    m2 = std ** 2 * n_seen + batch.var(axis=0) * n_batch + delta ** 2 * n_seen * n_batch / total
+    return mean + delta * n_batch / total, np.sqrt(m2 / total)
+
+def _nonzero_std(std: np.ndarray) -> np.ndarray:
+    """Use a unit scale for constant columns so normalizing them yields zeros instead of NaN"""
+    return np.where(std == 0, 1.0, std)
+
+def _one_hot_types(type_codes: np.ndarray) -> np.ndarray:
+    return np.eye(len(ProjectType))[type_codes]
+
+def _derived_metrics(predictions: np.ndarray) -> Dict[str, np.ndarray]:
+    """Costs, revenues, rental yield, ROI and payback from (..., 4) model outputs"""
+    land_cost, construction_cost, sales_revenue, rental_revenue = np.moveaxis(predictions, -1, 0)
+    total_cost = land_cost + construction_cost
+    with np.errstate(divide='ignore', invalid='ignore'):
+        payback_period = np.where(rental_revenue > 0, total_cost / rental_revenue, np.inf)
+    return {
+        'land_cost': land_cost,
+        'construction_cost': construction_cost,
+        'total_cost': total_cost,
+        'sales_revenue': sales_revenue,
+        'rental_revenue': rental_revenue,
+        'rental_yield': rental_revenue / total_cost * 100,
+        'roi': ((sales_revenue / total_cost) - 1) * 100,
+        'payback_period': payback_period
+    }
+
 class UnifiedRealEstatePredictor:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None, fast_inference: bool = True,
+                 shared_model: bool = False, cache_size: int = 1024,
+                 cache_ttl: Optional[float] = None, dataset_cache_dir: Optional[str] = None,
+                 telemetry_log: Optional[str] = None, estimator: str = 'keras'):
+        if estimator not in ESTIMATORS:
+            raise ValueError(f"Unknown estimator {estimator!r}, expected one of {', '.join(ESTIMATORS)}")
+        self.seed = seed
+        # Model backend: Keras networks, or closed-form log-space least squares
+        self.estimator = estimator
+        self.rng = np.random.default_rng(seed)
+        # Seeded training sets are stored here as .npy files and memory-mapped on reuse
+        self.dataset_cache_dir = dataset_cache_dir
+        # Run inference as a NumPy forward pass instead of Keras Model.predict
+        self.fast_inference = fast_inference
+        self._inference_weights = {}
+        # Saved (model, stats) files per project type, deserialized on first use
+        self._artifacts = {}
+        # Serve every project type from one network with a one-hot project type input
+        self.shared_model = shared_model
+        self.shared_trained = False
+        # LRU cache of model outputs for predict, keyed on inputs and model version
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._prediction_cache = OrderedDict()
+        self._model_versions = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Latest TrainingReport per model, also appended to telemetry_log as JSONL when set
+        self.training_reports = {}
+        self.telemetry_log = telemetry_log
+        # Independently trained models per project type for prediction intervals
+        self.ensembles = {}
+        self._ensemble_weights = {}
+        # Saved [(model, stats), ...] files per project type, deserialized on first use
+        self._ensemble_artifacts = {}
+        
         try:
             locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
         except:
@@ -33,206 +197,904 @@ class UnifiedRealEstatePredictor:
             ProjectType.RESIDENTIAL_COMPOUND: 2900,
             ProjectType.ADMIN_BUILDING: 3000
         }
+        # Ground, upper and top floor ratios per (project type, floors), behind the effective ratio feature
+        self.building_ratios = BUILDING_RATIOS
         
+        # Models are built on first use per project type
         self.models = {}
-        self.is_trained = {}
-        for project_type in ProjectType:
-            self.models[project_type] = self._initialize_model()
-            self.is_trained[project_type] = False
-
-    def _initialize_model(self):
-        model = tf.keras.Sequential([
-            tf.keras.layers.Dense(64, activation='relu', input_shape=(6,)),  # Updated input shape
-            tf.keras.layers.Dense(32, activation='relu'),
-            tf.keras.layers.Dense(16, activation='relu'),
-            tf.keras.layers.Dense(4)
-        ])
+        # Tuned overrides of DEFAULT_HYPERPARAMETERS per ProjectType or SHARED_MODEL
+        self.hyperparameters = {}
+        self._built_with = {}
+        self.is_trained = {project_type: False for project_type in ProjectType}
+
+    def _hyperparameters(self, key) -> dict:
+        return {**DEFAULT_HYPERPARAMETERS, **self.hyperparameters.get(key, {})}
+
+    def _get_model(self, key):
+        """Return the model stored under a ProjectType or SHARED_MODEL, building it if needed"""
+        if key not in self.models:
+            input_dim = 6 + len(ProjectType) if key == SHARED_MODEL else 6
+            hyperparameters = self._hyperparameters(key)
+            self.models[key] = self._initialize_model(input_dim, hyperparameters['layers'],
+                                                      hyperparameters['learning_rate'])
+            self._built_with[key] = hyperparameters
+        return self.models[key]
+
+    def _model_for_training(self, key):
+        """Like _get_model, but rebuild the model if its hyperparameters changed since it was built"""
+        if self._built_with.get(key) != self._hyperparameters(key):
+            self.models.pop(key, None)
+        return self._get_model(key)
+
+    def _initialize_model(self, input_dim: int = 6, layers=(64, 32, 16), learning_rate: float = 0.001):
+        if self.estimator == 'least_squares':
+            return LeastSquaresEstimator()
+        tf = _tensorflow()
+        model = tf.keras.Sequential(
+            [tf.keras.Input(shape=(input_dim,))] +
+            [tf.keras.layers.Dense(units, activation='relu') for units in layers] +
+            [tf.keras.layers.Dense(4)]
+        )
         
         model.compile(
-            optimizer='adam',
+            optimizer=tf.keras.optimizers.Adam(learning_rate),
             loss='mse',
             metrics=['mae']
         )
         return model
 
-    def _generate_training_data(self, project_type, n_samples=1000):
-        X = np.zeros((n_samples, 6))  # Updated feature count
-        y = np.zeros((n_samples, 4))
-        
+    def _generate_training_data(self, project_type, n_samples=1000, seed=None):
+        """Generate a synthetic training set, drawing every column as a whole array"""
+        rng = self.rng if seed is None else np.random.default_rng(seed)
         base_cost = self.base_costs[project_type]
         
-        for i in range(n_samples):
-            location_price = np.random.choice(list(self.location_prices.values()))
-            land_area = np.random.uniform(100, 50000)
-            floors = np.random.randint(1, 11)
-            ratios = BuildingRatios.create(floors)
-            effective_ratio = (ratios.ground_floor + 
-                             (ratios.upper_floors * (floors - 2)) + 
-                             ratios.top_floor) / floors
-            demand = np.random.uniform(0.8, 1.2)
-            competition = np.random.uniform(0.8, 1.2)
-            
-            X[i] = [location_price, land_area, floors, effective_ratio, demand, competition]
-            
-            # Calculate target values
-            buildable_area = land_area * effective_ratio * floors
-            land_cost = location_price * land_area * (1 + np.random.normal(0, 0.1))
-            construction_cost = base_cost * buildable_area * (1 + np.random.normal(0, 0.1))
-            
-            total_cost = land_cost + construction_cost
-            sales_multiplier = 1.4 if project_type == ProjectType.SHOPPING_MALL else 1.3
-            rental_multiplier = 0.15 if project_type == ProjectType.SHOPPING_MALL else 0.08
-            
-            sales_revenue = total_cost * sales_multiplier * demand * (2 - competition) * (1 + np.random.normal(0, 0.1))
-            rental_revenue = total_cost * rental_multiplier * demand * (1 + np.random.normal(0, 0.1))
-            
-            y[i] = [land_cost, construction_cost, sales_revenue, rental_revenue]
+        location_price = rng.choice(np.array(list(self.location_prices.values()), dtype=float), size=n_samples)
+        land_area = rng.uniform(100, 50000, size=n_samples)
+        floors = rng.integers(1, MAX_FLOORS + 1, size=n_samples)
+        effective_ratio = self.building_ratios.gather_effective(project_type, floors)
+        demand = rng.uniform(0.8, 1.2, size=n_samples)
+        competition = rng.uniform(0.8, 1.2, size=n_samples)
+        noise = rng.normal(0, 0.1, size=(n_samples, 4))
+        
+        X = np.column_stack([location_price, land_area, floors, effective_ratio, demand, competition])
+        
+        # Calculate target values
+        buildable_area = land_area * effective_ratio * floors
+        land_cost = location_price * land_area * (1 + noise[:, 0])
+        construction_cost = base_cost * buildable_area * (1 + noise[:, 1])
+        
+        total_cost = land_cost + construction_cost
+        sales_multiplier = 1.4 if project_type == ProjectType.SHOPPING_MALL else 1.3
+        rental_multiplier = 0.15 if project_type == ProjectType.SHOPPING_MALL else 0.08
+        
+        sales_revenue = total_cost * sales_multiplier * demand * (2 - competition) * (1 + noise[:, 2])
+        rental_revenue = total_cost * rental_multiplier * demand * (1 + noise[:, 3])
+        
+        y = np.column_stack([land_cost, construction_cost, sales_revenue, rental_revenue])
         
         return X, y
-    def train_project_type(self, project_type: ProjectType, epochs: int = 50):
-        """Train the model for a specific project type"""
-        # Generate training data
-        X, y = self._generate_training_data(project_type)
+
+    def _dataset_paths(self, project_type: ProjectType, n_samples: int, seed: int):
+        key = json.dumps({
+            "version": DATASET_VERSION,
+            "project_type": project_type.name,
+            "n_samples": n_samples,
+            "seed": seed,
+            "base_cost": self.base_costs[project_type],
+            "building_ratios": self.building_ratios.rules.get(project_type.name, self.building_ratios.default),
+            "location_prices": sorted(self.location_prices.items())
+        }, ensure_ascii=False)
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+        stem = os.path.join(self.dataset_cache_dir, f"{project_type.name}_{n_samples}_{seed}_{digest}")
+        return f"{stem}_X.npy", f"{stem}_y.npy"
+
+    def _dataset_seed(self, project_type: ProjectType, member: Optional[int] = None) -> int:
+        """Seed of project_type's training set (or an ensemble member's), derived from the predictor's seed"""
+        entropy = [self.seed, PROJECT_TYPE_CODES[project_type]] + ([] if member is None else [member])
+        return int(np.random.SeedSequence(entropy).generate_state(1)[0])
+
+    def _training_data(self, project_type: ProjectType, n_samples: int = 1000, member: Optional[int] = None):
+        """Training set for project_type, memory-mapped from the dataset cache when enabled.
+
+        Caching needs a reproducible dataset, so it only applies to seeded predictors.
+        Each project type, and each of its ensemble members, draws its set from its
+        own seed derived from the predictor's.
+        """
+        if self.dataset_cache_dir is None or self.seed is None:
+            return self._generate_training_data(project_type, n_samples)
+        
+        seed = self._dataset_seed(project_type, member)
+        X_path, y_path = self._dataset_paths(project_type, n_samples, seed)
+        if not (os.path.exists(X_path) and os.path.exists(y_path)):
+            os.makedirs(self.dataset_cache_dir, exist_ok=True)
+            X, y = self._generate_training_data(project_type, n_samples, seed=seed)
+            # Write under temporary names so concurrent readers never see partial files
+            for path, array in ((y_path, y), (X_path, X)):
+                fd, tmp_path = tempfile.mkstemp(dir=self.dataset_cache_dir, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    np.save(f, array)
+                os.replace(tmp_path, path)
+        return np.load(X_path, mmap_mode='r'), np.load(y_path, mmap_mode='r')
+
+    def _fit(self, model, X, y, epochs, type_codes=None, batch_size=32, patience=5, time_budget=None,
+             phase_times=None):
+        """Store normalization stats on model and fit it on the normalized data.
+
+        Training stops early once validation loss hasn't improved for `patience`
+        epochs (restoring the best weights), or after the epoch that exceeds
+        `time_budget` seconds. The history records wall time and samples/sec per
+        epoch. phase_times, if given, receives the "normalize" and "fit" seconds.
+        """
+        with _phase(phase_times, 'normalize'):
+            # Calculate and store normalization parameters
+            model.X_mean = X.mean(axis=0)
+            model.X_std = _nonzero_std(X.std(axis=0))
+            model.y_mean = y.mean(axis=0)
+            model.y_std = _nonzero_std(y.std(axis=0))
+            model.n_seen = len(X)
+            
+            # Normalize data
+            X_norm = (X - model.X_mean) / model.X_std
+            if type_codes is not None:
+                X_norm = np.hstack([X_norm, _one_hot_types(type_codes)])
+            y_norm = (y - model.y_mean) / model.y_std
+            X_norm = X_norm.astype(np.float32)
+            y_norm = y_norm.astype(np.float32)
+        
+        if isinstance(model, LeastSquaresEstimator):
+            if type_codes is not None:
+                X = np.hstack([X, _one_hot_types(type_codes)])
+            with _phase(phase_times, 'fit'):
+                return model.fit(X, y, VALIDATION_SPLIT)
+        
+        # Hold out the last 20% for validation and feed float32 batches through tf.data
+        tf = _tensorflow()
+        split = int(len(X_norm) * (1 - VALIDATION_SPLIT))
+        train = (tf.data.Dataset.from_tensor_slices((X_norm[:split], y_norm[:split]))
+                 .shuffle(split, seed=int(self.rng.integers(2**31)))
+                 .batch(batch_size)
+                 .prefetch(tf.data.AUTOTUNE))
+        validation = (tf.data.Dataset.from_tensor_slices((X_norm[split:], y_norm[split:]))
+                      .batch(batch_size)
+                      .prefetch(tf.data.AUTOTUNE))
+        
+        return self._run_fit(model, train, validation, split, epochs, patience, time_budget, phase_times)
+
+    def _fit_stream(self, model, source, epochs, batch_size=32, patience=5, time_budget=None,
+                    shuffle_buffer=10_000, phase_times=None):
+        """Like _fit, but over a re-iterable source of (X, y) chunks that is never held in memory.
+
+        A first pass computes the normalization stats with streaming moments. Every
+        fifth row is then held out for validation, and training rows are shuffled
+        within a bounded buffer. The stats pass counts as the "normalize" phase.
+        A least-squares model accumulates its normal equations chunk by chunk instead.
+        """
+        n_seen = 0
+        with _phase(phase_times, 'normalize'):
+            for X, y in source:
+                if len(X) == 0:
+                    continue
+                if n_seen == 0:
+                    X_mean, X_std, y_mean, y_std = X.mean(axis=0), X.std(axis=0), y.mean(axis=0), y.std(axis=0)
+                else:
+                    X_mean, X_std = _combine_moments(n_seen, X_mean, X_std, X)
+                    y_mean, y_std = _combine_moments(n_seen, y_mean, y_std, y)
+                n_seen += len(X)
+        if n_seen == 0:
+            raise ValueError("The transaction source yielded no usable rows")
+        X_std, y_std = _nonzero_std(X_std), _nonzero_std(y_std)
+        
+        model.X_mean, model.X_std = X_mean, X_std
+        model.y_mean, model.y_std = y_mean, y_std
+        model.n_seen = n_seen
+        
+        holdout_every = round(1 / VALIDATION_SPLIT)
+        
+        def rows(validation):
+            offset = 0
+            for X, y in source:
+                holdout = np.arange(offset, offset + len(X)) % holdout_every == holdout_every - 1
+                offset += len(X)
+                keep = holdout if validation else ~holdout
+                yield X[keep], y[keep]
+        
+        def normalized_rows(validation):
+            for X, y in rows(validation):
+                yield ((X - X_mean) / X_std).astype(np.float32), ((y - y_mean) / y_std).astype(np.float32)
+        
+        if isinstance(model, LeastSquaresEstimator):
+            with _phase(phase_times, 'fit'):
+                return model.fit_stream(lambda: rows(False), lambda: rows(True))
+        
+        tf = _tensorflow()
+        n_train = n_seen - n_seen // holdout_every
+        # Declaring the batch counts tells Keras where each generator-backed epoch ends
+        signature = (tf.TensorSpec((None, 6), tf.float32), tf.TensorSpec((None, 4), tf.float32))
+        train = (tf.data.Dataset.from_generator(lambda: normalized_rows(False), output_signature=signature)
+                 .unbatch()
+                 .shuffle(shuffle_buffer, seed=int(self.rng.integers(2**31)))
+                 .batch(batch_size)
+                 .apply(tf.data.experimental.assert_cardinality(-(-n_train // batch_size)))
+                 .prefetch(tf.data.AUTOTUNE))
+        validation = (tf.data.Dataset.from_generator(lambda: normalized_rows(True), output_signature=signature)
+                      .unbatch()
+                      .batch(batch_size)
+                      .apply(tf.data.experimental.assert_cardinality(-(-(n_seen - n_train) // batch_size)))
+                      .prefetch(tf.data.AUTOTUNE))
         
-        # Calculate and store normalization parameters
-        self.models[project_type].X_mean = X.mean(axis=0)
-        self.models[project_type].X_std = X.std(axis=0)
-        self.models[project_type].y_mean = y.mean(axis=0)
-        self.models[project_type].y_std = y.std(axis=0)
+        return self._run_fit(model, train, validation, n_train, epochs, patience, time_budget, phase_times)
+
+    def _run_fit(self, model, train, validation, n_train, epochs, patience, time_budget, phase_times=None):
+        """Fit model on tf.data pipelines with early stopping, a time budget and throughput tracking"""
+        tf = _tensorflow()
+        epoch_times = []
+        started = time.monotonic()
+        
+        def on_epoch_begin(epoch, logs):
+            epoch_times.append(time.monotonic())
+        
+        def on_epoch_end(epoch, logs):
+            now = time.monotonic()
+            epoch_times[-1] = now - epoch_times[-1]
+            if time_budget is not None and now - started >= time_budget:
+                model.stop_training = True
         
-        # Normalize data
-        X_norm = (X - self.models[project_type].X_mean) / self.models[project_type].X_std
-        y_norm = (y - self.models[project_type].y_mean) / self.models[project_type].y_std
+        callbacks = [tf.keras.callbacks.LambdaCallback(on_epoch_begin=on_epoch_begin, on_epoch_end=on_epoch_end)]
+        if patience is not None:
+            callbacks.append(tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=patience,
+                                                              restore_best_weights=True))
         
         # Train the model
-        history = self.models[project_type].fit(
-            X_norm,
-            y_norm,
-            epochs=epochs,
-            batch_size=32,
-            validation_split=0.2,
-            verbose=0
-        )
+        with _phase(phase_times, 'fit'):
+            history = model.fit(
+                train,
+                validation_data=validation,
+                epochs=epochs,
+                callbacks=callbacks,
+                # The dataset already reshuffles every epoch
+                shuffle=False,
+                verbose=0
+            )
+        history.history['epoch_time'] = epoch_times
+        history.history['samples_per_sec'] = [n_train / seconds for seconds in epoch_times]
+        return history
+
+    def _record_training(self, key, history, phase_times, batch_size, epochs):
+        """Keep a TrainingReport for the run that trained the model under key and log it"""
+        report = TrainingReport.from_history(getattr(key, 'name', key), history.history, phase_times,
+                                             int(self._get_model(key).n_seen), batch_size, epochs)
+        self._store_report(key, report)
+
+    def _store_report(self, key, report: TrainingReport):
+        self.training_reports[key] = report
+        if self.telemetry_log:
+            report.append_jsonl(self.telemetry_log)
+        return report
+
+    def train_project_type(self, project_type: ProjectType, epochs: Optional[int] = None,
+                           n_samples: int = 1000, batch_size: Optional[int] = None,
+                           patience: Optional[int] = 5, time_budget: Optional[float] = None, data=None):
+        """Train the model for a specific project type.
+
+        epochs and batch_size default to the type's tuned hyperparameters.
+        data, if given, is a re-iterable source of (X, y) chunks such as a
+        transactions.TransactionSource, streamed instead of synthetic data.
+        A shared-model predictor never uses per-type models, so it rejects this call.
+        """
+        if self.shared_model:
+            raise ValueError("Per-type models are not used with shared_model=True; train the shared model with "
+                             "train_shared_model and add observed deals with partial_fit")
+        hyperparameters = self._hyperparameters(project_type)
+        epochs = epochs or hyperparameters['epochs']
+        batch_size = batch_size or hyperparameters['batch_size']
+        self._artifacts.pop(project_type, None)
+        model = self._model_for_training(project_type)
+        phase_times = {}
+        
+        if data is not None:
+            history = self._fit_stream(model, data, epochs, batch_size=batch_size,
+                                       patience=patience, time_budget=time_budget, phase_times=phase_times)
+        else:
+            # Generate training data
+            with _phase(phase_times, 'data'):
+                X, y = self._training_data(project_type, n_samples)
+            history = self._fit(model, X, y, epochs, batch_size=batch_size,
+                                patience=patience, time_budget=time_budget, phase_times=phase_times)
         
         self.is_trained[project_type] = True
+        self._model_updated(project_type)
+        self._record_training(project_type, history, phase_times, batch_size, epochs)
         return history
 
-    def predict(self, project_type: ProjectType, location: str, land_area: float, floors: int, market_conditions: dict) -> dict:
-        if not self.is_trained[project_type]:
-            self.train_project_type(project_type)
+    def partial_fit(self, project_type: ProjectType, X, y, epochs: int = 5, batch_size: int = 32):
+        """Fine-tune the existing model for project_type on newly observed deals.
+
+        X holds rows in the six-feature layout (location price, land area, floors,
+        effective ratio, demand, competition) and y the four targets (land cost,
+        construction cost, sales revenue, rental revenue). The normalization
+        statistics absorb the new rows with streaming moment updates. The first
+        and last layers are rescaled so the model's predictions stay the same
+        until the fine-tuning epochs run. A least-squares model instead adds the
+        rows to its normal equations and re-solves; epochs and batch_size are
+        ignored then, and features and targets must be positive. Invalid rows
+        raise ValueError before the model changes.
+        """
+        X = np.asarray(X, dtype=float).reshape(-1, 6)
+        y = np.asarray(y, dtype=float).reshape(-1, 4)
+        if len(X) != len(y):
+            raise ValueError(f"X has {len(X)} rows but y has {len(y)}")
+        if len(X) == 0:
+            raise ValueError("No rows to fit")
+        if not (np.isfinite(X).all() and np.isfinite(y).all()):
+            raise ValueError("X and y must be finite")
         
-        ratios = BuildingRatios.create(floors)
-        effective_ratio = (ratios.ground_floor + 
-                         (ratios.upper_floors * (floors - 2)) + 
-                         ratios.top_floor) / floors
+        model = self._trained_model(project_type)
+        # Models saved before n_seen was recorded were trained on the default 1000 samples
+        n_seen = int(getattr(model, 'n_seen', 1000))
+        X_mean, X_std = _combine_moments(n_seen, model.X_mean, model.X_std, X)
+        y_mean, y_std = _combine_moments(n_seen, model.y_mean, model.y_std, y)
+        X_std, y_std = _nonzero_std(X_std), _nonzero_std(y_std)
+        one_hot = (_one_hot_types(np.full(len(X), PROJECT_TYPE_CODES[project_type]))
+                   if self.shared_model else np.empty((len(X), 0)))
+        least_squares = isinstance(model, LeastSquaresEstimator)
+        
+        if least_squares:
+            # Solves before the stats change, so a rejected update leaves the model as it was
+            history = model.partial_fit(np.hstack([X, one_hot]), y)
+        else:
+            weights = model.get_weights()
+            kernel, bias = weights[0], weights[1]
+            # Only the six numeric inputs are normalized; the shared model's one-hot inputs are not
+            bias += ((X_mean - model.X_mean) / model.X_std) @ kernel[:6]
+            kernel[:6] *= (X_std / model.X_std)[:, None]
+            weights[-2] *= model.y_std / y_std
+            weights[-1] = (weights[-1] * model.y_std + model.y_mean - y_mean) / y_std
+            model.set_weights(weights)
+        
+        model.X_mean, model.X_std = X_mean, X_std
+        model.y_mean, model.y_std = y_mean, y_std
+        model.n_seen = n_seen + len(X)
+        
+        if not least_squares:
+            history = model.fit(
+                np.hstack([(X - X_mean) / X_std, one_hot]).astype(np.float32),
+                ((y - y_mean) / y_std).astype(np.float32),
+                epochs=epochs,
+                batch_size=batch_size,
+                verbose=0
+            )
+        
+        self._model_updated(SHARED_MODEL if self.shared_model else project_type)
+        return history
+
+    def train_shared_model(self, epochs: Optional[int] = None, n_samples: int = 1000,
+                           batch_size: Optional[int] = None, patience: Optional[int] = 5,
+                           time_budget: Optional[float] = None):
+        """Train the multi-task model on pooled data from every project type"""
+        hyperparameters = self._hyperparameters(SHARED_MODEL)
+        epochs = epochs or hyperparameters['epochs']
+        batch_size = batch_size or hyperparameters['batch_size']
+        self._artifacts.pop(SHARED_MODEL, None)
+        phase_times = {}
+        
+        with _phase(phase_times, 'data'):
+            parts = [self._training_data(project_type, n_samples) for project_type in ProjectType]
+            X = np.vstack([X for X, _ in parts])
+            y = np.vstack([y for _, y in parts])
+            type_codes = np.repeat(np.arange(len(ProjectType)), n_samples)
+            
+            # Shuffle so the validation split covers every project type
+            order = self.rng.permutation(len(X))
+            X, y, type_codes = X[order], y[order], type_codes[order]
+        history = self._fit(self._model_for_training(SHARED_MODEL), X, y, epochs,
+                            type_codes=type_codes, batch_size=batch_size,
+                            patience=patience, time_budget=time_budget, phase_times=phase_times)
+        
+        self.shared_trained = True
+        self._model_updated(SHARED_MODEL)
+        self._record_training(SHARED_MODEL, history, phase_times, batch_size, epochs)
+        return history
+
+    def train_ensemble(self, project_type: ProjectType, members: int = 5, epochs: Optional[int] = None,
+                       n_samples: int = 1000, batch_size: Optional[int] = None, patience: Optional[int] = 5):
+        """Train `members` independently initialized models, each on its own synthetic sample.
+
+        Members use the type's tuned hyperparameters and, for seeded predictors,
+        the dataset cache. Ensembles are per project type, so a shared-model
+        predictor cannot train them.
+        """
+        if self.shared_model:
+            raise ValueError("Ensembles are trained per project type and are not available with shared_model=True")
+        hyperparameters = self._hyperparameters(project_type)
+        epochs = epochs or hyperparameters['epochs']
+        batch_size = batch_size or hyperparameters['batch_size']
+        models = []
+        for member in range(members):
+            X, y = self._training_data(project_type, n_samples, member=member)
+            model = self._initialize_model(6, hyperparameters['layers'], hyperparameters['learning_rate'])
+            self._fit(model, X, y, epochs, batch_size=batch_size, patience=patience)
+            models.append(model)
+        
+        self.ensembles[project_type] = models
+        self._ensemble_artifacts.pop(project_type, None)
+        self._ensemble_weights.pop(project_type, None)
+        return models
+
+    def _trained_ensemble(self, project_type: ProjectType) -> list:
+        """Return project_type's ensemble, loading or training a default one first if needed"""
+        if project_type in self._ensemble_artifacts:
+            self.ensembles[project_type] = [self._read_model(*files)
+                                            for files in self._ensemble_artifacts.pop(project_type)]
+            self._ensemble_weights.pop(project_type, None)
+        elif project_type not in self.ensembles:
+            self.train_ensemble(project_type)
+        return self.ensembles[project_type]
+
+    def _ensemble_forward(self, project_type: ProjectType, X: np.ndarray) -> np.ndarray:
+        """Predictions of every ensemble member as one (members, rows, 4) batched pass"""
+        if self.estimator == 'least_squares':
+            return np.stack([model.predict(X) for model in self.ensembles[project_type]])
+        stacked = self._ensemble_weights.get(project_type)
+        if stacked is None:
+            models = self.ensembles[project_type]
+            member_weights = [[w.astype(np.float64) for w in model.get_weights()] for model in models]
+            layers = [(np.stack([weights[i] for weights in member_weights]),
+                       np.stack([weights[i + 1] for weights in member_weights])[:, None, :])
+                      for i in range(0, len(member_weights[0]), 2)]
+            stats = {stat: np.stack([getattr(model, stat) for model in models])[:, None, :]
+                     for stat in NORMALIZATION_STATS}
+            stacked = self._ensemble_weights[project_type] = (layers, stats)
+        
+        layers, stats = stacked
+        X_norm = (X[None] - stats['X_mean']) / stats['X_std']
+        return _dense_forward(layers, X_norm) * stats['y_std'] + stats['y_mean']
+
+    def predict_interval(self, project_type: ProjectType, location: str, land_area: float, floors: int,
+                         market_conditions: dict, percentiles=(10, 50, 90)) -> Dict[str, Dict[str, float]]:
+        """Percentile bands (e.g. P10/P50/P90) of the ensemble's predictions for one parcel.
+
+        Trains a default ensemble for project_type on first use. ROI, rental
+        yield and payback are derived per ensemble member before taking percentiles.
+        """
+        self._trained_ensemble(project_type)
         
         X = np.array([[
             self.location_prices[location],
             land_area,
             floors,
-            effective_ratio,
+            self.building_ratios.effective_ratio(project_type, floors),
             market_conditions['demand_level'],
             market_conditions['competition_level']
         ]])
+        draws = _derived_metrics(self._ensemble_forward(project_type, X)[:, 0, :])
+        with np.errstate(invalid='ignore'):
+            # Interpolating towards an infinite payback period yields nan; report it as infinite
+            bands = {name: np.nan_to_num(np.percentile(values, percentiles), nan=np.inf, posinf=np.inf)
+                     for name, values in draws.items()}
+        return {f"P{percentile:g}": {name: float(values[i]) for name, values in bands.items()}
+                for i, percentile in enumerate(percentiles)}
+
+    def _model_updated(self, key) -> None:
+        """Drop everything derived from the previous weights of the model under key"""
+        self._inference_weights.pop(key, None)
+        self._model_versions[key] = self._model_versions.get(key, 0) + 1
+        for cache_key in [cache_key for cache_key in self._prediction_cache if cache_key[0] == key]:
+            del self._prediction_cache[cache_key]
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self._cache_hits, self._cache_misses, self.cache_size, len(self._prediction_cache))
+
+    def cache_clear(self) -> None:
+        self._prediction_cache.clear()
+        self._cache_hits = self._cache_misses = 0
+
+    def _cached_predictions(self, cache_key):
+        entry = self._prediction_cache.get(cache_key)
+        if entry is not None:
+            stored_at, predictions = entry
+            if self.cache_ttl is None or time.monotonic() - stored_at <= self.cache_ttl:
+                self._prediction_cache.move_to_end(cache_key)
+                self._cache_hits += 1
+                return predictions
+            del self._prediction_cache[cache_key]
+        self._cache_misses += 1
+        return None
+
+    def _store_predictions(self, cache_key, predictions) -> None:
+        if self.cache_size <= 0:
+            return
+        self._prediction_cache[cache_key] = (time.monotonic(), predictions)
+        if len(self._prediction_cache) > self.cache_size:
+            self._prediction_cache.popitem(last=False)
+
+    def _trained_model(self, project_type: ProjectType):
+        """Return the model for project_type, loading or training it first if needed"""
+        if self.shared_model:
+            if SHARED_MODEL in self._artifacts:
+                self._load_model(SHARED_MODEL)
+            elif not self.shared_trained:
+                self.train_shared_model()
+            return self.models[SHARED_MODEL]
         
-        X_norm = (X - self.models[project_type].X_mean) / self.models[project_type].X_std
-        y_norm = self.models[project_type].predict(X_norm)
-        predictions = y_norm * self.models[project_type].y_std + self.models[project_type].y_mean
+        if project_type in self._artifacts:
+            self._load_model(project_type)
+        elif not self.is_trained[project_type]:
+            self.train_project_type(project_type)
+        return self.models[project_type]
+
+    def save(self, path: str) -> None:
+        """Save every project type's model and normalization stats to an artifact directory.
+
+        Untrained project types are trained first so the artifact is always complete.
+        Ensembles trained so far are saved alongside.
+        """
+        os.makedirs(path, exist_ok=True)
         
-        land_cost, construction_cost, sales_revenue, rental_revenue = predictions[0]
+        def write(model, name):
+            model_file = f"{name}_coef.npz" if self.estimator == 'least_squares' else f"{name}.keras"
+            stats_file = f"{name}_stats.npz"
+            model.save(os.path.join(path, model_file))
+            np.savez(os.path.join(path, stats_file),
+                     **{stat: getattr(model, stat) for stat in MODEL_STATS if hasattr(model, stat)})
+            return {"model": model_file, "stats": stats_file}
         
-        return self._format_results(
-            project_type, location, land_area, floors,
-            land_cost, construction_cost, sales_revenue, rental_revenue,
-            market_conditions, effective_ratio
-        )
+        manifest = {
+            "format_version": ARTIFACT_VERSION,
+            "estimator": self.estimator,
+            "location_prices": self.location_prices,
+            "base_costs": {project_type.name: cost for project_type, cost in self.base_costs.items()},
+            "building_ratios": self.building_ratios.to_dict(),
+            "hyperparameters": {getattr(key, 'name', key): hyperparameters
+                                for key, hyperparameters in self.hyperparameters.items()},
+            "project_types": {}
+        }
+        if self.shared_model:
+            manifest["shared_model"] = write(self._trained_model(SHARED_MODEL), SHARED_MODEL)
+        else:
+            for project_type in ProjectType:
+                manifest["project_types"][project_type.name] = write(self._trained_model(project_type),
+                                                                     project_type.name)
+        ensembles = list(self.ensembles) + [key for key in self._ensemble_artifacts if key not in self.ensembles]
+        if ensembles:
+            manifest["ensembles"] = {
+                project_type.name: [write(model, f"{project_type.name}_member{i}")
+                                    for i, model in enumerate(self._trained_ensemble(project_type))]
+                for project_type in ensembles
+            }
+        with open(os.path.join(path, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
 
-    # [Rest of the methods remain the same...]
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'UnifiedRealEstatePredictor':
+        """Create a predictor from an artifact directory written by save.
 
-    def _format_results(self, project_type, location, land_area, floors,
-                   land_cost, construction_cost, sales_revenue, rental_revenue,
-                   market_conditions, effective_ratio):
-        """Format the prediction results"""
-        total_cost = land_cost + construction_cost
-        design_cost = total_cost * 0.03
-        licensing_cost = total_cost * 0.02
-        management_cost = total_cost * 0.05
-        
-        def format_currency(amount: float) -> str:
-            return f"{amount:,.0f} ريال"
-        
-        def format_percentage(value: float) -> str:
-            return f"{value:.1f}%"
-
-        # Calculate ROI and payback period
-        roi = ((sales_revenue / total_cost) - 1) * 100
-        payback_period = total_cost / rental_revenue if rental_revenue > 0 else float('inf')
-        result = {
-            "تقرير_تحليل_الاستثمار": {
-                "تفاصيل_المشروع": {
-                    "نوع_المشروع": project_type.value,
-                    "الموقع": location,
-                    "مساحة_الأرض": f"{land_area:,.0f} متر مربع",
-                    "عدد_الطوابق": floors,
-                    "نسبة_البناء_الفعالة": f"{effective_ratio:.2f}"
-                },
-                "توقعات_التمويل": {
-                    "تكاليف_المشروع": {
-                        "تكلفة_الأرض": format_currency(land_cost),
-                        "تكلفة_البناء": format_currency(construction_cost),
-                        "تكاليف_إضافية": {
-                            "التصميم": format_currency(design_cost),
-                            "التراخيص": format_currency(licensing_cost),
-                            "الإدارة": format_currency(management_cost)
-                        },
-                        "التكاليف_الإجمالية": format_currency(total_cost)
-                    },
-                    "الإيرادات_المتوقعة": {
-                        "إيرادات_البيع": format_currency(sales_revenue),
-                        "إيرادات_التأجير_السنوية": format_currency(rental_revenue),
-                        "العائد_السنوي_المتوقع": format_percentage(rental_revenue / total_cost * 100)
-                    }
-                },
-                "تحليل_السوق": {
-                    "مستوى_الطلب": "مرتفع" if market_conditions['demand_level'] > 1 else "متوسط",
-                    "مستوى_المنافسة": "منخفض" if market_conditions['competition_level'] < 1 else "متوسط",
-                    "نمو_السوق": "مستقر",
-                    "توقعات_مستقبلية": self._get_market_outlook(market_conditions['demand_level'], 
-                                                               market_conditions['competition_level'])
-                },
-                "مؤشرات_الأداء": {
-                    "العائد_على_الاستثمار": format_percentage(roi),
-                    "فترة_الاسترداد": f"{payback_period:.1f} سنة",
-                    "معدل_النمو_السنوي": "8-12%",
-                    "مستوى_المخاطرة": self._calculate_risk_level(roi, payback_period)
-                }
-            }
-        }
+        Models are only deserialized when their project type is first used.
+        """
+        with open(os.path.join(path, MANIFEST_FILE), encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("format_version") != ARTIFACT_VERSION:
+            raise ValueError(f"Unsupported artifact version {manifest.get('format_version')} in {path}, "
+                             f"expected {ARTIFACT_VERSION}")
         
-    # Add project-specific details
-        if project_type == ProjectType.SHOPPING_MALL:  # Changed project_types to project_type
-            result["تقرير_تحليل_الاستثمار"]["تفاصيل_إضافية"] = {
-                "عدد_المحلات": int(land_area * floors * 0.7 / 100),
-            "مساحة_التأجير": f"{land_area * floors * 0.7:,.0f} متر مربع",
-            "مواقف_السيارات": f"{int(land_area * 0.4):,d} موقف",
-            "المرافق": ["مصاعد", "سلالم كهربائية", "نظام تكييف مركزي", "نظام أمن ومراقبة"]
+        if "shared_model" in manifest:
+            kwargs.setdefault("shared_model", True)
+        kwargs.setdefault("estimator", manifest.get("estimator", "keras"))
+        predictor = cls(**kwargs)
+        predictor.location_prices = manifest["location_prices"]
+        predictor.base_costs = {ProjectType[name]: cost for name, cost in manifest["base_costs"].items()}
+        if "building_ratios" in manifest:
+            predictor.building_ratios = RatioTable(**manifest["building_ratios"])
+        predictor.hyperparameters = {name if name == SHARED_MODEL else ProjectType[name]: hyperparameters
+                                     for name, hyperparameters in manifest.get("hyperparameters", {}).items()}
+        for name, entry in manifest["project_types"].items():
+            project_type = ProjectType[name]
+            predictor._artifacts[project_type] = (os.path.join(path, entry["model"]),
+                                                  os.path.join(path, entry["stats"]))
+            predictor.is_trained[project_type] = True
+        if "shared_model" in manifest:
+            entry = manifest["shared_model"]
+            predictor._artifacts[SHARED_MODEL] = (os.path.join(path, entry["model"]),
+                                                  os.path.join(path, entry["stats"]))
+            predictor.shared_trained = True
+        for name, entries in manifest.get("ensembles", {}).items():
+            predictor._ensemble_artifacts[ProjectType[name]] = [
+                (os.path.join(path, entry["model"]), os.path.join(path, entry["stats"])) for entry in entries]
+        return predictor
+
+    def export_numpy(self, path: str) -> None:
+        """Write every model's weights and normalization stats to one .npz for NumpyPredictor.
+
+        Untrained project types are trained first so the export is always complete.
+        """
+        if self.estimator != 'keras':
+            raise ValueError("NumpyPredictor serves Keras models; least-squares artifacts "
+                                      "saved with save() already load without TensorFlow")
+        keys = [SHARED_MODEL] if self.shared_model else list(ProjectType)
+        arrays = {}
+        weight_counts = {}
+        for key in keys:
+            model = self._trained_model(key)
+            name = getattr(key, 'name', key)
+            weights = model.get_weights()
+            for i, weight in enumerate(weights):
+                arrays[f"{name}/{i}"] = weight
+            for stat in NORMALIZATION_STATS:
+                arrays[f"{name}/{stat}"] = getattr(model, stat)
+            weight_counts[name] = len(weights)
+        
+        metadata = {
+            "format_version": ARTIFACT_VERSION,
+            "location_prices": self.location_prices,
+            "base_costs": {project_type.name: cost for project_type, cost in self.base_costs.items()},
+            "building_ratios": self.building_ratios.to_dict(),
+            "shared_model": self.shared_model,
+            "models": weight_counts
         }
-    
-        return result  # Moved outside the if statement to return for all project types
+        arrays["metadata"] = np.array(json.dumps(metadata, ensure_ascii=False))
+        np.savez_compressed(path, **arrays)
 
-    def _get_market_outlook(self, demand, competition):
-        score = demand * (2 - competition)
-        if score > 1.2:
-            return "ممتاز"
-        elif score > 1:
-            return "جيد"
+    def _read_model(self, model_file: str, stats_file: str):
+        if self.estimator == 'least_squares':
+            model = LeastSquaresEstimator.load(model_file)
         else:
-            return "متوسط"
+            model = _tensorflow().keras.models.load_model(model_file)
+        with np.load(stats_file) as stats:
+            for stat in stats.files:
+                setattr(model, stat, stats[stat])
+        return model
 
-    def _calculate_risk_level(self, roi, payback_period):
-        if roi > 25 and payback_period < 5:
-            return "منخفض"
-        elif roi > 15 and payback_period < 8:
-            return "متوسط"
+    def _load_model(self, key) -> None:
+        self.models[key] = self._read_model(*self._artifacts.pop(key))
+        self._model_updated(key)
+
+    def train_all(self, epochs: Optional[int] = None, parallel: int = 1,
+                  project_types: Optional[Iterable[ProjectType]] = None,
+                  n_samples: int = 1000, batch_size: Optional[int] = None, patience: Optional[int] = 5,
+                  time_budget: Optional[float] = None) -> Dict[ProjectType, dict]:
+        """Train several project types, optionally in a pool of `parallel` processes.
+
+        Workers train independently and their weights and normalization stats are
+        copied back into this predictor. Returns the per-epoch history of each type.
+        """
+        project_types = list(project_types or ProjectType)
+        train_kwargs = {'epochs': epochs, 'n_samples': n_samples, 'batch_size': batch_size,
+                        'patience': patience, 'time_budget': time_budget}
+        
+        if self.shared_model:
+            history = self.train_shared_model(**train_kwargs).history
+            return {project_type: history for project_type in project_types}
+        
+        if parallel <= 1:
+            return {project_type: self.train_project_type(project_type, **train_kwargs).history
+                    for project_type in project_types}
+        
+        workers = min(parallel, len(project_types))
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        # Workers keep the predictor's seed so they share its cached datasets, but each
+        # draws its shuffling (and unseeded data) from its own generator
+        rng_seeds = self.rng.integers(0, 2**32, size=len(project_types))
+        histories = {}
+        # Least-squares workers never import TensorFlow, so they skip its thread setup
+        initializer = None if self.estimator == 'least_squares' else _init_training_worker
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=initializer,
+                                 initargs=(threads,) if initializer else ()) as pool:
+            futures = [pool.submit(_train_in_worker, project_type, self.seed, int(rng_seed),
+                                   self.location_prices, self.base_costs, self.building_ratios,
+                                   self.hyperparameters, train_kwargs, self.dataset_cache_dir, self.estimator)
+                       for project_type, rng_seed in zip(project_types, rng_seeds)]
+            for future in futures:
+                project_type, weights, stats, history, report = future.result()
+                self._artifacts.pop(project_type, None)
+                model = self._model_for_training(project_type)
+                model.set_weights(weights)
+                for key, value in stats.items():
+                    setattr(model, key, value)
+                self.is_trained[project_type] = True
+                self._model_updated(project_type)
+                self._store_report(project_type, report)
+                histories[project_type] = history
+        return histories
+
+    def _forward(self, project_type: ProjectType, X_norm: np.ndarray,
+                 type_codes: Optional[np.ndarray] = None) -> np.ndarray:
+        """Run the model for project_type on already normalized features.
+
+        With the shared model, type_codes gives each row's project type code
+        and defaults to project_type for every row.
+        """
+        key = project_type
+        if self.shared_model:
+            key = SHARED_MODEL
+            if type_codes is None:
+                type_codes = np.full(len(X_norm), PROJECT_TYPE_CODES[project_type])
+            X_norm = np.hstack([X_norm, _one_hot_types(type_codes)])
+        
+        model = self.models[key]
+        if isinstance(model, LeastSquaresEstimator):
+            return model.forward(X_norm)
+        if not self.fast_inference:
+            return model.predict(X_norm, batch_size=len(X_norm), verbose=0)
+        
+        weights = self._inference_weights.get(key)
+        if weights is None:
+            flat = [w.astype(np.float64) for w in model.get_weights()]
+            weights = list(zip(flat[::2], flat[1::2]))
+            self._inference_weights[key] = weights
+        return _dense_forward(weights, X_norm)
+
+    def predict(self, project_type: ProjectType, location: str, land_area: float, floors: int,
+                market_conditions: dict, report: bool = True):
+        """Predict one parcel and return its Arabic report.
+
+        With report=False a numeric PredictionResult is returned instead; its
+        report() renders the same report on demand.
+        """
+        model = self._trained_model(project_type)
+        
+        effective_ratio = self.building_ratios.effective_ratio(project_type, floors)
+        
+        model_key = SHARED_MODEL if self.shared_model else project_type
+        # Prices and ratios are part of the key so editing location_prices or building_ratios never serves stale outputs
+        cache_key = (model_key, self._model_versions.get(model_key, 0), project_type, location,
+                     float(self.location_prices[location]), float(effective_ratio),
+                     float(land_area), int(floors), float(market_conditions['demand_level']),
+                     float(market_conditions['competition_level']))
+        predictions = self._cached_predictions(cache_key)
+        
+        if predictions is None:
+            X = np.array([[
+                self.location_prices[location],
+                land_area,
+                floors,
+                effective_ratio,
+                market_conditions['demand_level'],
+                market_conditions['competition_level']
+            ]])
+            
+            X_norm = (X - model.X_mean) / model.X_std
+            y_norm = self._forward(project_type, X_norm)
+            predictions = tuple((y_norm * model.y_std + model.y_mean)[0])
+            self._store_predictions(cache_key, predictions)
+        
+        land_cost, construction_cost, sales_revenue, rental_revenue = predictions
+        
+        result = PredictionResult.from_predictions(
+            project_type, location, land_area, floors, effective_ratio,
+            market_conditions['demand_level'], market_conditions['competition_level'],
+            land_cost, construction_cost, sales_revenue, rental_revenue
+        )
+        return result.report() if report else result
+
+    def predict_many(self, data=None, **columns) -> pd.DataFrame:
+        """Score many parcels at once.
+
+        Accepts a DataFrame (or dict of columns) with project_type, location,
+        land_area, floors, demand and competition, or the same columns as
+        keyword arrays. Scalars are broadcast. Rows are grouped by project
+        type and each group is scored with a single forward pass, or all rows
+        in one pass with the shared model.
+        """
+        frame = pd.DataFrame(data if data is not None else columns).reset_index(drop=True)
+        missing = [column for column in BATCH_COLUMNS if column not in frame]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+        if frame.empty:
+            raise ValueError("No rows to predict")
+
+        project_types = frame['project_type'].map(_to_project_type)
+        type_codes = project_types.map(PROJECT_TYPE_CODES).to_numpy()
+        # Validate floors before the integer cast, which would silently truncate e.g. 2.5
+        floors = frame['floors'].to_numpy(dtype=float)
+        if floors.min() < 1 or floors.max() > MAX_FLOORS or (floors != np.round(floors)).any():
+            raise ValueError(f"floors must be whole numbers between 1 and {MAX_FLOORS}")
+        floors = floors.astype(int)
+
+        location_price = frame['location'].map(self.location_prices)
+        if location_price.isna().any():
+            unknown = frame['location'][location_price.isna()].unique()
+            raise KeyError(f"Unknown locations: {', '.join(map(str, unknown))}")
+
+        X = np.column_stack([
+            location_price.to_numpy(dtype=float),
+            frame['land_area'].to_numpy(dtype=float),
+            floors,
+            self.building_ratios.gather_effective(type_codes, floors),
+            frame['demand'].to_numpy(dtype=float),
+            frame['competition'].to_numpy(dtype=float)
+        ])
+        predictions = np.empty((len(frame), 4))
+
+        if self.shared_model:
+            # One forward pass scores every project type
+            model = self._trained_model(project_types[0])
+            X_norm = (X - model.X_mean) / model.X_std
+            y_norm = self._forward(None, X_norm, type_codes)
+            predictions[:] = y_norm * model.y_std + model.y_mean
         else:
-            return "مرتفع"
+            for project_type, rows in project_types.groupby(project_types, sort=False).indices.items():
+                predictions[rows] = self._predict_targets(project_type, X[rows])
+
+        metrics = _derived_metrics(predictions)
+        return pd.DataFrame({
+            'project_type': project_types,
+            'location': frame['location'],
+            'land_area': X[:, 1],
+            'floors': floors,
+            'effective_ratio': X[:, 3],
+            'demand': X[:, 4],
+            'competition': X[:, 5],
+            **metrics,
+            'risk_level': self._calculate_risk_levels(metrics['roi'], metrics['payback_period']),
+            'market_outlook': self._get_market_outlooks(X[:, 4], X[:, 5])
+        })
+
+    def _predict_targets(self, project_type: ProjectType, X: np.ndarray) -> np.ndarray:
+        """Denormalized (rows, 4) model outputs for raw six-feature rows of one project type"""
+        model = self._trained_model(project_type)
+        X_norm = (X - model.X_mean) / model.X_std
+        return self._forward(project_type, X_norm) * model.y_std + model.y_mean
+
+    def sweep(self, project_type: ProjectType, location: str, land_area, floors,
+              demand=1.0, competition=1.0) -> SweepResult:
+        """Score the Cartesian grid of the given inputs in one batched pass.
+
+        Each of land_area, floors, demand and competition is a single value or a
+        sequence of values; every sequence becomes an axis of the result, e.g.
+        `sweep(ProjectType.VILLA, "الرياض", land_area=np.linspace(500, 5000, 50),
+        floors=range(1, 11), demand=[0.8, 1.0, 1.2])` gives 50 x 10 x 3 arrays of
+        costs, revenues, ROI and payback.
+        """
+        project_type = _to_project_type(project_type)
+        if location not in self.location_prices:
+            raise KeyError(f"Unknown location: {location}")
+        values = {'land_area': land_area, 'floors': floors, 'demand': demand, 'competition': competition}
+        dims = tuple(axis for axis in SWEEP_AXES if np.ndim(values[axis]) > 0)
+        # Validate floors before the integer cast, which would silently truncate e.g. 2.5
+        floor_values = np.atleast_1d(np.asarray(floors, dtype=float))
+        if floor_values.min() < 1 or floor_values.max() > MAX_FLOORS or (floor_values != np.round(floor_values)).any():
+            raise ValueError(f"floors must be whole numbers between 1 and {MAX_FLOORS}")
+        coords = {axis: np.asarray(values[axis], dtype=int if axis == 'floors' else float) for axis in dims}
+        fixed = {axis: values[axis] for axis in SWEEP_AXES if axis not in dims}
+        
+        # Broadcast every input over the grid and flatten it into one batch
+        grids = np.meshgrid(*(coords[axis] for axis in dims), indexing='ij')
+        columns = dict(zip(dims, (grid.ravel() for grid in grids)))
+        n_cells = int(np.prod([len(coords[axis]) for axis in dims]))
+        columns.update({axis: np.full(n_cells, value) for axis, value in fixed.items()})
+        floors_column = columns['floors'].astype(int)
+        X = np.column_stack([
+            np.full(n_cells, float(self.location_prices[location])),
+            columns['land_area'],
+            floors_column,
+            self.building_ratios.gather_effective(project_type, floors_column),
+            columns['demand'],
+            columns['competition']
+        ]).astype(float)
+        
+        shape = tuple(len(coords[axis]) for axis in dims)
+        predictions = self._predict_targets(project_type, X).reshape(shape + (4,))
+        return SweepResult(project_type, location, dims, coords, fixed, _derived_metrics(predictions))
+
+    def _get_market_outlook(self, demand, competition):
+        return _market_outlook(demand, competition)
+
+    def _get_market_outlooks(self, demand, competition):
+        """Vectorized _get_market_outlook"""
+        score = np.asarray(demand) * (2 - np.asarray(competition))
+        return np.select([score > 1.2, score > 1], ["ممتاز", "جيد"], default="متوسط")
+
+    def _calculate_risk_level(self, roi, payback_period):
+        return _risk_level(roi, payback_period)
+
+
+    def _calculate_risk_levels(self, roi, payback_period):
+        """Vectorized _calculate_risk_level"""
+        roi = np.asarray(roi)
+        payback_period = np.asarray(payback_period)
+        return np.select(
+            [(roi > 25) & (payback_period < 5), (roi > 15) & (payback_period < 8)],
+            ["منخفض", "متوسط"],
+            default="مرتفع"
+        )
@@ -1,6 +1,8 @@
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
 
 class ProjectType(Enum):
     SHOPPING_MALL = "مول تجاري"
@@ -12,6 +14,75 @@ class ProjectType(Enum):
     RESIDENTIAL_COMPOUND = "مجمع سكني"
     ADMIN_BUILDING = "مبنى إداري"
 
+# Building regulation: (lowest floor count it applies to, ground floor, upper floors, top floor ratio).
+# Taller buildings use the last rule whose floor count they reach.
+DEFAULT_RATIO_RULES = [(1, 0.65, 0.75, 0.70), (5, 0.35, 0.45, 0.70)]
+RATIO_RULES = {project_type.name: DEFAULT_RATIO_RULES for project_type in ProjectType}
+
+
+class RatioTable:
+    """Ground, upper and top floor ratios precomputed per (project type, floors).
+
+    ground, upper and top are (project types + 1, max_floors + 1) arrays. Row i
+    is the i-th ProjectType, the last row applies `default` to parcels of no
+    known type, and column f holds the ratios of an f-floor building. Floor
+    counts above max_floors read the last column, which rules must keep
+    constant (their last threshold is at most max_floors).
+
+    Project types are given as members of any enum with ProjectType's names,
+    as names, as None for the default row or, in gather, as arrays of row codes.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, list]] = None, default: Optional[list] = None,
+                 max_floors: int = 50):
+        self.rules = {name: [tuple(rule) for rule in type_rules]
+                      for name, type_rules in (rules or RATIO_RULES).items()}
+        self.default = [tuple(rule) for rule in (default or DEFAULT_RATIO_RULES)]
+        self.max_floors = max_floors
+        names = [project_type.name for project_type in ProjectType]
+        self._rows = {name: row for row, name in enumerate(names)}
+        table = np.full((len(names) + 1, max_floors + 1, 3), np.nan)
+        for row, type_rules in enumerate([self.rules.get(name, self.default) for name in names] + [self.default]):
+            for min_floors, ground, upper, top in sorted(type_rules):
+                if min_floors > max_floors:
+                    raise ValueError(f"Ratio rules must start at or below max_floors={max_floors}")
+                table[row, min_floors:] = (ground, upper, top)
+        self.ground, self.upper, self.top = table[..., 0], table[..., 1], table[..., 2]
+        # Python floats for scalar lookups, which NumPy indexing would only slow down
+        self._scalar = [[tuple(ratios) for ratios in row] for row in table.tolist()]
+
+    def to_dict(self) -> dict:
+        """JSON-serializable arguments that rebuild this table"""
+        return {'rules': self.rules, 'default': self.default, 'max_floors': self.max_floors}
+
+    def row(self, project_type) -> int:
+        if project_type is None:
+            return len(self._rows)
+        return self._rows[project_type if isinstance(project_type, str) else project_type.name]
+
+    def ratios(self, project_type, floors: int) -> Tuple[float, float, float]:
+        """Ground, upper and top floor ratios of one building"""
+        return self._scalar[self.row(project_type)][min(floors, self.max_floors)]
+
+    def effective_ratio(self, project_type, floors: int) -> float:
+        """Built area per floor over all floors, relative to the land area"""
+        ground, upper, top = self.ratios(project_type, floors)
+        return (ground + (upper * (floors - 2)) + top) / floors
+
+    def gather(self, project_type, floors) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized ratios for an array of floor counts"""
+        rows = project_type if isinstance(project_type, np.ndarray) else self.row(project_type)
+        columns = np.minimum(floors, self.max_floors)
+        return self.ground[rows, columns], self.upper[rows, columns], self.top[rows, columns]
+
+    def gather_effective(self, project_type, floors) -> np.ndarray:
+        ground, upper, top = self.gather(project_type, floors)
+        return (ground + (upper * (floors - 2)) + top) / floors
+
+
+BUILDING_RATIOS = RatioTable()
+
+
 @dataclass
 class BuildingRatios:
     ground_floor: float
@@ -19,10 +90,8 @@ class BuildingRatios:
     top_floor: float
 
     @classmethod
-    def create(cls, floors: int):
-        if floors > 4:
-            return cls(ground_floor=0.35, upper_floors=0.45, top_floor=0.70)
-        return cls(ground_floor=0.65, upper_floors=0.75, top_floor=0.70)
+    def create(cls, floors: int, project_type: Optional[ProjectType] = None):
+        return cls(*BUILDING_RATIOS.ratios(project_type, floors))
 
 @dataclass
 class BuildingParameters:
@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+
+from project_types import ProjectType
+
+
+def _format_currency(amount: float) -> str:
+    return f"{amount:,.0f} ريال"
+
+
+def _format_percentage(value: float) -> str:
+    return f"{value:.1f}%"
+
+
+def _market_outlook(demand: float, competition: float) -> str:
+    score = demand * (2 - competition)
+    if score > 1.2:
+        return "ممتاز"
+    elif score > 1:
+        return "جيد"
+    else:
+        return "متوسط"
+
+
+def _risk_level(roi: float, payback_period: float) -> str:
+    if roi > 25 and payback_period < 5:
+        return "منخفض"
+    elif roi > 15 and payback_period < 8:
+        return "متوسط"
+    else:
+        return "مرتفع"
+
+
+@dataclass(frozen=True, slots=True)
+class PredictionResult:
+    """Numeric outcome of UnifiedRealEstatePredictor.predict for one parcel.
+
+    Amounts are in riyals, roi and rental_yield in percent and payback_period
+    in years. The Arabic report is only built when report() is called.
+    """
+    project_type: ProjectType
+    location: str
+    land_area: float
+    floors: int
+    effective_ratio: float
+    demand: float
+    competition: float
+    land_cost: float
+    construction_cost: float
+    total_cost: float
+    sales_revenue: float
+    rental_revenue: float
+    rental_yield: float
+    roi: float
+    payback_period: float
+
+    @classmethod
+    def from_predictions(cls, project_type: ProjectType, location: str, land_area: float, floors: int,
+                         effective_ratio: float, demand: float, competition: float,
+                         land_cost: float, construction_cost: float,
+                         sales_revenue: float, rental_revenue: float) -> 'PredictionResult':
+        total_cost = land_cost + construction_cost
+        roi = ((sales_revenue / total_cost) - 1) * 100
+        payback_period = total_cost / rental_revenue if rental_revenue > 0 else float('inf')
+        return cls(project_type, location, land_area, floors, effective_ratio, demand, competition,
+                   land_cost, construction_cost, total_cost, sales_revenue, rental_revenue,
+                   rental_revenue / total_cost * 100, roi, payback_period)
+
+    @property
+    def risk_level(self) -> str:
+        return _risk_level(self.roi, self.payback_period)
+
+    @property
+    def market_outlook(self) -> str:
+        return _market_outlook(self.demand, self.competition)
+
+    def report(self) -> dict:
+        """The Arabic investment report predict returns by default"""
+        total_cost = self.total_cost
+        result = {
+            "تقرير_تحليل_الاستثمار": {
+                "تفاصيل_المشروع": {
+                    "نوع_المشروع": self.project_type.value,
+                    "الموقع": self.location,
+                    "مساحة_الأرض": f"{self.land_area:,.0f} متر مربع",
+                    "عدد_الطوابق": self.floors,
+                    "نسبة_البناء_الفعالة": f"{self.effective_ratio:.2f}"
+                },
+                "توقعات_التمويل": {
+                    "تكاليف_المشروع": {
+                        "تكلفة_الأرض": _format_currency(self.land_cost),
+                        "تكلفة_البناء": _format_currency(self.construction_cost),
+                        "تكاليف_إضافية": {
+                            "التصميم": _format_currency(total_cost * 0.03),
+                            "التراخيص": _format_currency(total_cost * 0.02),
+                            "الإدارة": _format_currency(total_cost * 0.05)
+                        },
+                        "التكاليف_الإجمالية": _format_currency(total_cost)
+                    },
+                    "الإيرادات_المتوقعة": {
+                        "إيرادات_البيع": _format_currency(self.sales_revenue),
+                        "إيرادات_التأجير_السنوية": _format_currency(self.rental_revenue),
+                        "العائد_السنوي_المتوقع": _format_percentage(self.rental_yield)
+                    }
+                },
+                "تحليل_السوق": {
+                    "مستوى_الطلب": "مرتفع" if self.demand > 1 else "متوسط",
+                    "مستوى_المنافسة": "منخفض" if self.competition < 1 else "متوسط",
+                    "نمو_السوق": "مستقر",
+                    "توقعات_مستقبلية": self.market_outlook
+                },
+                "مؤشرات_الأداء": {
+                    "العائد_على_الاستثمار": _format_percentage(self.roi),
+                    "فترة_الاسترداد": f"{self.payback_period:.1f} سنة",
+                    "معدل_النمو_السنوي": "8-12%",
+                    "مستوى_المخاطرة": self.risk_level
+                }
+            }
+        }
+
+        # Add project-specific details
+        if self.project_type == ProjectType.SHOPPING_MALL:
+            result["تقرير_تحليل_الاستثمار"]["تفاصيل_إضافية"] = {
+                "عدد_المحلات": int(self.land_area * self.floors * 0.7 / 100),
+                "مساحة_التأجير": f"{self.land_area * self.floors * 0.7:,.0f} متر مربع",
+                "مواقف_السيارات": f"{int(self.land_area * 0.4):,d} موقف",
+                "المرافق": ["مصاعد", "سلالم كهربائية", "نظام تكييف مركزي", "نظام أمن ومراقبة"]
+            }
+
+        return result
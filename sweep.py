@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from project_types import ProjectType
+
+# Grid axes of UnifiedRealEstatePredictor.sweep, in array order
+SWEEP_AXES = ('land_area', 'floors', 'demand', 'competition')
+SWEEP_METRICS = ('land_cost', 'construction_cost', 'total_cost', 'sales_revenue', 'rental_revenue',
+                 'rental_yield', 'roi', 'payback_period')
+
+
+@dataclass
+class SweepResult:
+    """Predictions over a Cartesian grid of scenarios for one project type and location.
+
+    Every metric is an array with one axis per swept input, in the order of
+    `dims`, labeled by `coords`. Inputs given as a single value are in `fixed`
+    and add no axis. E.g. for a land_area x floors heatmap of ROI:
+    `plotly.express.imshow(result['roi'], x=result.coords['floors'], y=result.coords['land_area'])`.
+    """
+    project_type: ProjectType
+    location: str
+    dims: Tuple[str, ...]
+    coords: Dict[str, np.ndarray]
+    fixed: Dict[str, float]
+    data: Dict[str, np.ndarray]
+
+    def __getitem__(self, metric: str) -> np.ndarray:
+        return self.data[metric]
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(len(self.coords[dim]) for dim in self.dims)
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per grid cell, indexed by the swept inputs (a single unindexed row if none were swept)"""
+        columns = {metric: values.ravel() for metric, values in self.data.items()}
+        if not self.dims:
+            return pd.DataFrame(columns)
+        index = pd.MultiIndex.from_product([self.coords[dim] for dim in self.dims], names=list(self.dims))
+        return pd.DataFrame(columns, index=index)
+
+    def to_xarray(self):
+        """The grid as an xarray.Dataset, with the fixed inputs as attributes"""
+        try:
+            import xarray as xr
+        except ImportError:
+            raise ImportError("SweepResult.to_xarray requires xarray") from None
+        return xr.Dataset({metric: (self.dims, values) for metric, values in self.data.items()},
+                          coords=self.coords,
+                          attrs={'project_type': self.project_type.name, 'location': self.location,
+                                 **self.fixed})
@@ -0,0 +1,60 @@
+import json
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from typing import Dict, List
+
+
+@dataclass
+class EpochMetrics:
+    epoch: int
+    wall_time: float
+    samples_per_sec: float
+    loss: float
+    val_loss: float
+    mae: float
+    val_mae: float
+
+
+@dataclass
+class TrainingReport:
+    """Timing and loss curves of one training run of one model"""
+    model: str
+    n_samples: int
+    batch_size: int
+    epochs_requested: int
+    # Seconds spent per phase: "data" (generation or loading), "normalize" and "fit"
+    phase_times: Dict[str, float]
+    epochs: List[EpochMetrics] = field(default_factory=list)
+    finished_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    @classmethod
+    def from_history(cls, model: str, history: Dict[str, list], phase_times: Dict[str, float],
+                     n_samples: int, batch_size: int, epochs_requested: int) -> 'TrainingReport':
+        epochs = [
+            EpochMetrics(
+                epoch=i + 1,
+                wall_time=history['epoch_time'][i],
+                samples_per_sec=history['samples_per_sec'][i],
+                loss=history['loss'][i],
+                val_loss=history['val_loss'][i],
+                mae=history['mae'][i],
+                val_mae=history['val_mae'][i]
+            )
+            for i in range(len(history['loss']))
+        ]
+        return cls(model, n_samples, batch_size, epochs_requested, dict(phase_times), epochs)
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.phase_times.values())
+
+    @property
+    def stopped_early(self) -> bool:
+        return len(self.epochs) < self.epochs_requested
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "total_time": self.total_time, "stopped_early": self.stopped_early}
+
+    def append_jsonl(self, path: str) -> None:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(self.to_dict(), ensure_ascii=False) + "\n")
@@ -0,0 +1,66 @@
+from string import Formatter
+
+
+class Slot:
+    """A template leaf replaced by the value of `expression` itself instead of its text"""
+    __slots__ = ('expression',)
+
+    def __init__(self, expression: str):
+        self.expression = expression
+
+
+def compile_template(template, arg: str = 'r', name: str = 'render'):
+    """Compile a nested dict of template strings into a function of `arg` that renders it.
+
+    Strings use f-string syntax without the prefix, e.g. "{r.land_area:,.0f} متر مربع",
+    and render exactly as the equivalent f-string would. Slot leaves keep their
+    value's type. Each distinct placeholder is formatted once per call however
+    often it appears. Every call returns freshly built dicts and lists, so
+    callers may modify a rendered report.
+    """
+    values = {}
+    constants = []
+
+    def value(expression, conversion, spec):
+        if conversion:
+            raise ValueError(f"Conversions are not supported in templates: {{{expression}!{conversion}}}")
+        key = (expression, spec)
+        if key not in values:
+            values[key] = f"_v{len(values)}"
+        return values[key]
+
+    def emit(node):
+        if isinstance(node, Slot):
+            return f"({node.expression})"
+        if isinstance(node, str):
+            parts, literal_text = [], ''
+            for literal, field, spec, conversion in Formatter().parse(node):
+                literal_text += literal
+                if field is not None:
+                    if literal_text:
+                        parts.append(repr(literal_text))
+                        literal_text = ''
+                    parts.append(value(field, conversion, spec))
+            if literal_text or not parts:
+                parts.append(repr(literal_text))
+            return " + ".join(parts)
+        if isinstance(node, dict):
+            return "{" + ", ".join(f"{key!r}: {emit(item)}" for key, item in node.items()) + "}"
+        if isinstance(node, (list, tuple)):
+            items = ", ".join(emit(item) for item in node)
+            if isinstance(node, list):
+                return f"[{items}]"
+            return f"({items},)" if items else "()"
+        if node is None or isinstance(node, (bool, int, float)):
+            return repr(node)
+        # Other leaves are passed through by reference
+        constants.append(node)
+        return f"_c{len(constants) - 1}"
+
+    body = emit(template)
+    lines = [f"def {name}({arg}):"]
+    lines += [f"    {var} = format({expression}, {spec!r})" for (expression, spec), var in values.items()]
+    lines.append(f"    return {body}")
+    namespace = {f"_c{i}": node for i, node in enumerate(constants)}
+    exec(compile("\n".join(lines), f"<template {name}>", "exec"), namespace)
+    return namespace[name]
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from formulas import PORTFOLIO_COLUMNS, PORTFOLIO_TYPES, UnifiedCalculator
+
+
+@pytest.fixture(scope='module')
+def calculator():
+    return UnifiedCalculator()
+
+
+# The scalar method behind each portfolio type, and whether it takes a floor count
+SCALAR_METHODS = {
+    'SHOPPING_MALL': ('calculate_mall_context', True),
+    'RESIDENTIAL': ('calculate_residential_context', True),
+    'COMMERCIAL': ('calculate_commercial_context', True),
+    'MIXED_USE': ('calculate_mixed_use_context', True),
+    'VILLA': ('calculate_villa_context', False),
+    'SINGLE_VILLA': ('calculate_villa_analysis', False),
+    'RESIDENTIAL_COMPOUND': ('calculate_compound_analysis', False),
+    'ADMIN_BUILDING': ('calculate_admin_building_analysis', False),
+}
+
+
+@pytest.mark.parametrize('project_type', list(PORTFOLIO_TYPES))
+def test_portfolio_matches_scalar_methods_exactly(calculator, project_type):
+    rng = np.random.default_rng(0)
+    land_area = rng.uniform(100, 30000, 200)
+    locations = rng.choice(list(calculator.location_prices), 200)
+    floors = rng.integers(2, 11, 200)
+
+    portfolio = calculator.calculate_portfolio(project_type, land_area, locations, floors)
+
+    method, takes_floors = SCALAR_METHODS[project_type]
+    for i in range(len(land_area)):
+        args = (float(land_area[i]), str(locations[i])) + ((int(floors[i]),) if takes_floors else ())
+        result = getattr(calculator, method)(*args, report=False)
+        for column in PORTFOLIO_COLUMNS[2:]:
+            assert portfolio[column].iat[i] == getattr(result, column), (i, column)
+
+
+@pytest.mark.parametrize('floors', [[2.5], [0, 1], []])
+def test_optimize_parcel_rejects_invalid_floors(calculator, floors):
+    location = next(iter(calculator.location_prices))
+    with pytest.raises(ValueError, match="floors"):
+        calculator.optimize_parcel(1000, location, floors=floors)
+
+
+@pytest.mark.parametrize('objective', ['gross_margin', 'payback'])
+def test_optimize_parcel_ranks_candidates_by_objective(calculator, objective):
+    location = next(iter(calculator.location_prices))
+    ranking = calculator.optimize_parcel(2500, location, objective=objective, floors=range(1, 6))
+
+    # Brute force over the same candidates with calculate_portfolio
+    candidates = []
+    for project_type, spec in PORTFOLIO_TYPES.items():
+        for floors in ([spec['floors']] if spec['floors'] else range(1, 6)):
+            row = calculator.calculate_portfolio(project_type, [2500], location, floors).iloc[0]
+            if row['repeated_floors_area'] >= 0:
+                payback = row['total_investment'] / row['net_annual_rent']
+                candidates.append((row['gross_margin'] if objective == 'gross_margin' else -payback,
+                                   project_type, floors))
+    best_score, best_type, best_floors = max(candidates)
+
+    assert len(ranking) == len(candidates)
+    assert list(ranking['rank']) == list(range(1, len(candidates) + 1))
+    scores = ranking['gross_margin'] if objective == 'gross_margin' else -ranking['payback_years']
+    assert scores.is_monotonic_decreasing
+    assert (ranking['project_type'].iat[0], ranking['floors'].iat[0]) == (best_type, best_floors)
+
+
+def test_optimize_parcel_ranks_each_parcel_separately(calculator):
+    locations = list(calculator.location_prices)[:2]
+    both = calculator.optimize_parcel([1200, 8000], locations, top=3, max_investment=80_000_000)
+
+    assert (both['total_investment'] <= 80_000_000).all()
+    for parcel, (land_area, location) in enumerate(zip([1200, 8000], locations)):
+        alone = calculator.optimize_parcel(land_area, location, top=3, max_investment=80_000_000)
+        rows = both[both['parcel'] == parcel].reset_index(drop=True)
+        assert list(rows['rank']) == [1, 2, 3]
+        np.testing.assert_array_equal(rows['gross_margin'], alone['gross_margin'])
+        assert list(rows['project_type']) == list(alone['project_type'])
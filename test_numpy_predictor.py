@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from numpy_predictor import NumpyPredictor
+from predictor import UnifiedRealEstatePredictor
+from project_types import ProjectType
+
+
+@pytest.fixture(scope='module')
+def export_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('export') / 'weights.npz')
+    predictor = UnifiedRealEstatePredictor(seed=0, shared_model=True)
+    predictor.train_shared_model(epochs=1, n_samples=100, patience=None)
+    predictor.export_numpy(path)
+    return path, predictor
+
+
+@pytest.fixture(scope='module')
+def exported(export_path):
+    path, predictor = export_path
+    return predictor, NumpyPredictor.load(path)
+
+
+def test_matches_exporting_predictor(exported):
+    predictor, numpy_predictor = exported
+    location = next(iter(predictor.location_prices))
+    market = {'demand_level': 1.0, 'competition_level': 1.0}
+    expected = predictor.predict(ProjectType.RESIDENTIAL, location, 1000, 3, market, report=False)
+    result = numpy_predictor.predict(ProjectType.RESIDENTIAL, location, 1000, 3, market, report=False)
+    assert result.total_cost == pytest.approx(expected.total_cost, rel=1e-5)
+
+
+@pytest.mark.parametrize('method', ['train_project_type', 'train_shared_model', 'train_all', 'partial_fit',
+                                    'train_ensemble', 'save', 'export_numpy'])
+def test_training_and_saving_raise_type_error(exported, method):
+    _, numpy_predictor = exported
+    with pytest.raises(TypeError, match="NumpyPredictor"):
+        getattr(numpy_predictor, method)(ProjectType.RESIDENTIAL)
+
+
+def test_predict_interval_does_not_train_an_ensemble(exported):
+    _, numpy_predictor = exported
+    location = next(iter(numpy_predictor.location_prices))
+    with pytest.raises(TypeError, match="NumpyPredictor"):
+        numpy_predictor.predict_interval(ProjectType.RESIDENTIAL, location, 1000, 3,
+                                         {'demand_level': 1.0, 'competition_level': 1.0})
+    assert not numpy_predictor.ensembles
+
+
+@pytest.mark.parametrize('precision, tolerance', [('float16', 0.005), ('int8', 0.03)])
+def test_reduced_precision_stays_close_to_float64(export_path, precision, tolerance):
+    path, predictor = export_path
+    rng = np.random.default_rng(0)
+    portfolio = {
+        'project_type': rng.choice(list(ProjectType), 500),
+        'location': rng.choice(list(predictor.location_prices), 500),
+        'land_area': rng.uniform(500, 20000, 500),
+        'floors': rng.integers(1, 11, 500),
+        'demand': rng.uniform(0.8, 1.2, 500),
+        'competition': rng.uniform(0.8, 1.2, 500),
+    }
+    full = NumpyPredictor.load(path).predict_many(portfolio)
+    reduced = NumpyPredictor.load(path, precision=precision).predict_many(portfolio)
+
+    for column in ('land_cost', 'construction_cost', 'sales_revenue', 'rental_revenue'):
+        # Errors are measured relative to each output's mean, as in the quantization benchmark
+        error = np.abs(reduced[column] - full[column]) / full[column].abs().mean()
+        assert error.max() < tolerance, column
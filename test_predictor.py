@@ -0,0 +1,228 @@
+import numpy as np
+import pytest
+
+from estimators import LeastSquaresEstimator
+from predictor import UnifiedRealEstatePredictor, _combine_moments
+from project_types import ProjectType
+
+
+def _chunks(X, y, size):
+    return [(X[start:start + size], y[start:start + size]) for start in range(0, len(X), size)]
+
+
+def test_stream_holdout_split_with_partial_period():
+    predictor = UnifiedRealEstatePredictor(seed=0)
+    # 164 rows is not a multiple of the five-row holdout period
+    X, y = predictor._generate_training_data(ProjectType.RESIDENTIAL, 164, seed=1)
+
+    history = predictor.train_project_type(ProjectType.RESIDENTIAL, epochs=1, batch_size=1, patience=None,
+                                           data=_chunks(X, y, 50))
+
+    seconds = history.history['epoch_time'][0]
+    assert history.history['samples_per_sec'][0] * seconds == pytest.approx(132)
+    assert predictor.models[ProjectType.RESIDENTIAL].n_seen == 164
+
+
+@pytest.mark.parametrize('estimator', ['keras', 'least_squares'])
+def test_stream_without_market_columns_predicts_finite_values(tmp_path, estimator):
+    pd = pytest.importorskip('pandas')
+    from transactions import TransactionSource
+
+    predictor = UnifiedRealEstatePredictor(seed=0, estimator=estimator)
+    X, y = predictor._generate_training_data(ProjectType.RESIDENTIAL, 200, seed=1)
+    locations = {price: location for location, price in predictor.location_prices.items()}
+    path = tmp_path / 'deals.csv'
+    pd.DataFrame({
+        'location': [locations[price] for price in X[:, 0]],
+        'land_area': X[:, 1],
+        'floors': X[:, 2].astype(int),
+        'land_cost': y[:, 0],
+        'construction_cost': y[:, 1],
+        'sales_revenue': y[:, 2],
+        'rental_revenue': y[:, 3],
+    }).to_csv(path, index=False)
+    source = TransactionSource(str(path), predictor.location_prices, ProjectType.RESIDENTIAL)
+
+    predictor.train_project_type(ProjectType.RESIDENTIAL, epochs=1, patience=None, data=source)
+    # The export has no demand or competition columns, so both are constant
+    assert (predictor.models[ProjectType.RESIDENTIAL].X_std[4:] == 1.0).all()
+    predictor.partial_fit(ProjectType.RESIDENTIAL, X[:10], y[:10], epochs=1)
+
+    location = next(iter(predictor.location_prices))
+    prediction = predictor.predict(ProjectType.RESIDENTIAL, location, 1000, 3,
+                                   {'demand_level': 1.0, 'competition_level': 1.0}, report=False)
+    assert np.isfinite([prediction.land_cost, prediction.construction_cost,
+                        prediction.sales_revenue, prediction.rental_revenue]).all()
+
+
+def test_cached_training_sets_differ_per_project_type(tmp_path):
+    predictor = UnifiedRealEstatePredictor(seed=0, dataset_cache_dir=str(tmp_path))
+    X_mall, _ = predictor._training_data(ProjectType.SHOPPING_MALL, 100)
+    X_residential, _ = predictor._training_data(ProjectType.RESIDENTIAL, 100)
+    # Location price and land area don't depend on the project type, so a shared seed would repeat them
+    assert not np.array_equal(X_mall[:, :2], X_residential[:, :2])
+
+    reloaded = UnifiedRealEstatePredictor(seed=0, dataset_cache_dir=str(tmp_path))
+    np.testing.assert_array_equal(reloaded._training_data(ProjectType.SHOPPING_MALL, 100)[0], X_mall)
+
+
+def test_combine_moments_matches_pooled_stats():
+    rng = np.random.default_rng(0)
+    first, second = rng.normal(5, 2, size=(70, 6)), rng.normal(-1, 3, size=(30, 6))
+    mean, std = _combine_moments(len(first), first.mean(axis=0), first.std(axis=0), second)
+    pooled = np.vstack([first, second])
+    np.testing.assert_allclose(mean, pooled.mean(axis=0))
+    np.testing.assert_allclose(std, pooled.std(axis=0))
+
+
+@pytest.mark.parametrize('estimator', ['keras', 'least_squares'])
+def test_partial_fit_merges_normalization_stats(tmp_path, estimator):
+    predictor = UnifiedRealEstatePredictor(seed=0, dataset_cache_dir=str(tmp_path), estimator=estimator)
+    predictor.train_project_type(ProjectType.RESIDENTIAL, epochs=1, n_samples=200, patience=None)
+    X, y = predictor._training_data(ProjectType.RESIDENTIAL, 200)
+    X_new, y_new = predictor._generate_training_data(ProjectType.RESIDENTIAL, 50, seed=1)
+
+    predictor.partial_fit(ProjectType.RESIDENTIAL, X_new, y_new, epochs=1)
+
+    model = predictor.models[ProjectType.RESIDENTIAL]
+    assert model.n_seen == 250
+    np.testing.assert_allclose(model.X_mean, np.vstack([X, X_new]).mean(axis=0))
+    np.testing.assert_allclose(model.X_std, np.vstack([X, X_new]).std(axis=0))
+    np.testing.assert_allclose(model.y_std, np.vstack([y, y_new]).std(axis=0))
+
+
+def test_least_squares_partial_fit_solves_pooled_normal_equations(tmp_path):
+    predictor = UnifiedRealEstatePredictor(seed=0, dataset_cache_dir=str(tmp_path), estimator='least_squares')
+    predictor.train_project_type(ProjectType.RESIDENTIAL, n_samples=200)
+    predictor.save(str(tmp_path / 'model'))
+    X, y = predictor._training_data(ProjectType.RESIDENTIAL, 200)
+    X_new, y_new = predictor._generate_training_data(ProjectType.RESIDENTIAL, 50, seed=1)
+
+    reloaded = UnifiedRealEstatePredictor.load(str(tmp_path / 'model'))
+    reloaded.partial_fit(ProjectType.RESIDENTIAL, X_new, y_new)
+
+    # The fit holds out the last 20% for validation
+    X_fit, y_fit = np.vstack([X[:160], X_new]), np.vstack([y[:160], y_new])
+    reference = LeastSquaresEstimator()
+    expected = np.linalg.lstsq(reference._design(X_fit), np.log(y_fit), rcond=None)[0]
+    model = reloaded.models[ProjectType.RESIDENTIAL]
+    assert model.n_fit == 210
+    np.testing.assert_allclose(model.coef, expected, rtol=1e-6, atol=1e-6)
+
+
+def test_least_squares_streaming_matches_in_memory_fit():
+    predictor = UnifiedRealEstatePredictor(seed=0, estimator='least_squares')
+    X, y = predictor._generate_training_data(ProjectType.RESIDENTIAL, 164, seed=1)
+
+    history = predictor.train_project_type(ProjectType.RESIDENTIAL, data=_chunks(X, y, 50))
+
+    holdout = np.arange(len(X)) % 5 == 4
+    model = predictor.models[ProjectType.RESIDENTIAL]
+    design = model._design(X[~holdout])
+    coef = np.linalg.lstsq(design, np.log(y[~holdout]), rcond=None)[0]
+    assert model.n_fit == 132
+    # The normal equations lose some precision against a direct solve, but predictions agree closely
+    np.testing.assert_allclose(design @ model.coef, design @ coef, rtol=1e-6)
+    np.testing.assert_allclose(model.smearing, np.exp(np.log(y[~holdout]) - design @ model.coef).mean(axis=0))
+    error = (model.predict(X[holdout]) - y[holdout]) / model.y_std
+    assert history.history['val_loss'][0] == pytest.approx(np.mean(error ** 2))
+
+
+def test_export_numpy_rejects_least_squares(tmp_path):
+    predictor = UnifiedRealEstatePredictor(seed=0, estimator='least_squares')
+    with pytest.raises(ValueError, match="NumpyPredictor serves Keras models"):
+        predictor.export_numpy(str(tmp_path / 'weights.npz'))
+
+
+@pytest.mark.parametrize('estimator', ['keras', 'least_squares'])
+def test_ensemble_intervals_survive_save_and_load(tmp_path, estimator):
+    predictor = UnifiedRealEstatePredictor(seed=0, dataset_cache_dir=str(tmp_path / 'datasets'),
+                                           estimator=estimator)
+    predictor.train_all(epochs=1, n_samples=100, patience=None)
+    predictor.train_ensemble(ProjectType.RESIDENTIAL, members=2, epochs=1, n_samples=100, patience=None)
+    location = next(iter(predictor.location_prices))
+    market = {'demand_level': 1.0, 'competition_level': 1.0}
+    bands = predictor.predict_interval(ProjectType.RESIDENTIAL, location, 1000, 3, market)
+
+    # Each member trains on its own cached sample
+    first, _ = predictor._training_data(ProjectType.RESIDENTIAL, 100, member=0)
+    second, _ = predictor._training_data(ProjectType.RESIDENTIAL, 100, member=1)
+    assert not np.array_equal(first, second)
+
+    predictor.save(str(tmp_path / 'model'))
+    reloaded = UnifiedRealEstatePredictor.load(str(tmp_path / 'model'))
+    reloaded_bands = reloaded.predict_interval(ProjectType.RESIDENTIAL, location, 1000, 3, market)
+    for band, metrics in bands.items():
+        assert reloaded_bands[band] == pytest.approx(metrics)
+    assert len(reloaded.ensembles[ProjectType.RESIDENTIAL]) == 2
+
+
+def test_shared_model_rejects_ensembles():
+    predictor = UnifiedRealEstatePredictor(seed=0, shared_model=True)
+    with pytest.raises(ValueError, match="shared_model"):
+        predictor.train_ensemble(ProjectType.RESIDENTIAL)
+
+
+def test_prediction_cache_tracks_location_prices():
+    predictor = UnifiedRealEstatePredictor(seed=0, estimator='least_squares')
+    location = next(iter(predictor.location_prices))
+    market = {'demand_level': 1.0, 'competition_level': 1.0}
+    before = predictor.predict(ProjectType.RESIDENTIAL, location, 1000, 3, market, report=False)
+
+    predictor.location_prices[location] *= 2
+    after = predictor.predict(ProjectType.RESIDENTIAL, location, 1000, 3, market, report=False)
+
+    assert after.land_cost != before.land_cost
+
+
+@pytest.mark.parametrize('floors', [[2.5], 2.5, [1, 11], 0])
+def test_sweep_rejects_invalid_floors(floors):
+    predictor = UnifiedRealEstatePredictor(seed=0, estimator='least_squares')
+    location = next(iter(predictor.location_prices))
+    with pytest.raises(ValueError, match="floors"):
+        predictor.sweep(ProjectType.RESIDENTIAL, location, land_area=1000, floors=floors)
+
+
+def test_least_squares_partial_fit_rejects_zero_targets_without_changing_the_model():
+    predictor = UnifiedRealEstatePredictor(seed=0, estimator='least_squares')
+    predictor.train_project_type(ProjectType.RESIDENTIAL, n_samples=200)
+    model = predictor.models[ProjectType.RESIDENTIAL]
+    before = {key: np.copy(getattr(model, key)) for key in ('coef', 'smearing', 'gram', 'moment', 'X_mean', 'X_std')}
+    X, y = predictor._generate_training_data(ProjectType.RESIDENTIAL, 20, seed=1)
+    y[0, 3] = 0
+
+    with pytest.raises(ValueError, match="positive"):
+        predictor.partial_fit(ProjectType.RESIDENTIAL, X, y)
+
+    for key, value in before.items():
+        np.testing.assert_array_equal(getattr(model, key), value)
+    assert model.n_seen == 200 and model.n_fit == 160
+    predictor.partial_fit(ProjectType.RESIDENTIAL, X[1:], y[1:])
+    assert np.isfinite(model.coef).all()
+
+
+def test_shared_model_rejects_per_type_training():
+    predictor = UnifiedRealEstatePredictor(seed=0, shared_model=True)
+    X, y = predictor._generate_training_data(ProjectType.VILLA, 50, seed=1)
+    with pytest.raises(ValueError, match="shared_model"):
+        predictor.train_project_type(ProjectType.VILLA, data=_chunks(X, y, 25))
+    assert not predictor.models
+
+
+@pytest.mark.parametrize('floors', [2.5, 0, 11])
+def test_predict_many_rejects_invalid_floors(floors):
+    predictor = UnifiedRealEstatePredictor(seed=0, estimator='least_squares')
+    location = next(iter(predictor.location_prices))
+    with pytest.raises(ValueError, match="floors"):
+        predictor.predict_many(project_type=[ProjectType.RESIDENTIAL], location=location, land_area=1000,
+                               floors=[floors], demand=1.0, competition=1.0)
+
+
+def test_sweep_of_single_values_is_one_row():
+    predictor = UnifiedRealEstatePredictor(seed=0, estimator='least_squares')
+    location = next(iter(predictor.location_prices))
+    result = predictor.sweep(ProjectType.RESIDENTIAL, location, land_area=1000, floors=3)
+
+    frame = result.to_frame()
+    assert result.dims == () and len(frame) == 1
+    assert frame['roi'].iat[0] == pytest.approx(float(result['roi']))
@@ -0,0 +1,23 @@
+import json
+
+from predictor import UnifiedRealEstatePredictor
+from project_types import ProjectType
+
+
+def test_training_report_round_trips_through_jsonl(tmp_path):
+    log = tmp_path / 'training.jsonl'
+    predictor = UnifiedRealEstatePredictor(seed=0, telemetry_log=str(log))
+    predictor.train_project_type(ProjectType.RESIDENTIAL, epochs=2, n_samples=100, patience=None)
+    predictor.train_project_type(ProjectType.VILLA, epochs=3, n_samples=100, patience=None)
+
+    lines = log.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 2
+    record = json.loads(lines[0])
+    report = predictor.training_reports[ProjectType.RESIDENTIAL]
+    assert record == json.loads(json.dumps(report.to_dict()))
+    assert record['model'] == 'RESIDENTIAL' and record['n_samples'] == 100
+    assert set(record['phase_times']) == {'data', 'normalize', 'fit'}
+    assert [epoch['epoch'] for epoch in record['epochs']] == [1, 2]
+    assert not record['stopped_early']
+    assert record['total_time'] == sum(record['phase_times'].values())
+    assert len(json.loads(lines[1])['epochs']) == 3
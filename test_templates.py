@@ -0,0 +1,22 @@
+from types import SimpleNamespace
+
+from templates import Slot, compile_template
+
+
+def test_renders_like_f_strings():
+    render = compile_template({'area': "{r.area:,.0f} m2", 'ratio': "{r.ratio:.1%} of {r.area:,.0f}",
+                               'braces': "{{fixed}}", 'floors': Slot("r.floors")})
+    r = SimpleNamespace(area=12345.6, ratio=0.456, floors=3)
+    assert render(r) == {'area': f"{r.area:,.0f} m2", 'ratio': f"{r.ratio:.1%} of {r.area:,.0f}",
+                         'braces': "{fixed}", 'floors': 3}
+
+
+def test_static_subtrees_are_fresh_per_call():
+    render = compile_template({'risks': ['market', 'regulation'], 'costs': {'design': "5%"},
+                               'area': "{r.area}"})
+    first = render(SimpleNamespace(area=1))
+    first['risks'].append('changed')
+    first['costs']['design'] = "changed"
+
+    second = render(SimpleNamespace(area=2))
+    assert second == {'risks': ['market', 'regulation'], 'costs': {'design': "5%"}, 'area': "2"}
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from predictor import UnifiedRealEstatePredictor
+from project_types import ProjectType
+from transactions import TransactionSource
+
+
+def _write_export(path, predictor, n_rows, **overrides):
+    X, y = predictor._generate_training_data(ProjectType.RESIDENTIAL, n_rows, seed=1)
+    locations = {price: location for location, price in predictor.location_prices.items()}
+    frame = pd.DataFrame({
+        'location': [locations[price] for price in X[:, 0]],
+        'land_area': X[:, 1],
+        'floors': X[:, 2].astype(int),
+        'demand': X[:, 4],
+        'competition': X[:, 5],
+        'land_cost': y[:, 0],
+        'construction_cost': y[:, 1],
+        'sales_revenue': y[:, 2],
+        'rental_revenue': y[:, 3],
+    })
+    for column, values in overrides.items():
+        frame[column] = values
+    frame.to_csv(path, index=False)
+
+
+def test_drops_non_positive_market_levels(tmp_path):
+    predictor = UnifiedRealEstatePredictor(seed=0, estimator='least_squares')
+    path = tmp_path / 'deals.csv'
+    demand = np.ones(100)
+    demand[0] = 0
+    competition = np.ones(100)
+    competition[1] = -0.5
+    _write_export(path, predictor, 100, demand=demand, competition=competition)
+    source = TransactionSource(str(path), predictor.location_prices, ProjectType.RESIDENTIAL)
+
+    predictor.train_project_type(ProjectType.RESIDENTIAL, data=source)
+
+    assert source.rows_kept == 98
+    assert np.isfinite(predictor.models[ProjectType.RESIDENTIAL].coef).all()
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from predictor import VALIDATION_SPLIT, UnifiedRealEstatePredictor
+from project_types import ProjectType
+from tuning import _run_trial, tune
+
+
+def test_trial_returns_the_weights_of_its_best_epoch(tmp_path):
+    predictor = UnifiedRealEstatePredictor(seed=0)
+    X, y = predictor._generate_training_data(ProjectType.RESIDENTIAL, 200, seed=1)
+    np.save(tmp_path / 'X.npy', X)
+    np.save(tmp_path / 'y.npy', y)
+    # A high learning rate makes the validation loss bounce, so the last epoch is rarely the best
+    config = {'layers': [16], 'learning_rate': 0.1, 'batch_size': 16}
+
+    weights, val_loss, _, _ = _run_trial(str(tmp_path / 'X.npy'), str(tmp_path / 'y.npy'), config, None, 10,
+                                         seed=0, patience=None)
+
+    model = predictor._initialize_model(6, config['layers'], config['learning_rate'])
+    model.set_weights(weights)
+    split = int(len(X) * (1 - VALIDATION_SPLIT))
+    X_norm = (X[split:] - X.mean(axis=0)) / X.std(axis=0)
+    y_norm = (y[split:] - y.mean(axis=0)) / y.std(axis=0)
+    assert model.evaluate(X_norm, y_norm, verbose=0)[0] == pytest.approx(val_loss, rel=1e-4)
+
+
+def test_tune_rejects_least_squares():
+    with pytest.raises(ValueError, match="least_squares"):
+        tune(UnifiedRealEstatePredictor(seed=0, estimator='least_squares'))
+
+
+def test_tune_stores_the_winner_and_save_keeps_it(tmp_path):
+    predictor = UnifiedRealEstatePredictor(seed=0)
+    tables = tune(predictor, [ProjectType.RESIDENTIAL], n_trials=2, min_epochs=1, max_epochs=3, n_samples=100)
+
+    table = tables[ProjectType.RESIDENTIAL]
+    assert len(table) == 2 and table['val_loss'].is_monotonic_increasing
+    best = table.iloc[0]
+    expected = {'layers': list(best['layers']), 'learning_rate': float(best['learning_rate']),
+                'batch_size': int(best['batch_size']), 'epochs': int(best['epochs'])}
+    assert predictor.hyperparameters[ProjectType.RESIDENTIAL] == expected
+    assert 1 <= expected['epochs'] <= 3
+
+    predictor.train_all(epochs=1, n_samples=100, patience=None)
+    predictor.save(str(tmp_path / 'model'))
+    reloaded = UnifiedRealEstatePredictor.load(str(tmp_path / 'model'))
+    assert reloaded.hyperparameters == {ProjectType.RESIDENTIAL: expected}
@@ -0,0 +1,102 @@
+import os
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from predictor import MAX_FLOORS, PROJECT_TYPE_CODES, _to_project_type
+from project_types import ProjectType, RatioTable, BUILDING_RATIOS
+
+# Canonical column names; `columns` maps raw export names onto these.
+# demand, competition and project_type are optional.
+TARGET_COLUMNS = ('land_cost', 'construction_cost', 'sales_revenue', 'rental_revenue')
+REQUIRED_COLUMNS = ('location', 'land_area', 'floors') + TARGET_COLUMNS
+
+
+class TransactionSource:
+    """Re-iterable stream of (X, y) chunks read from a CSV or Parquet transaction export.
+
+    Each iteration reads the file again chunk by chunk, so memory stays bounded by
+    `chunksize` whatever the file size. Rows are mapped onto the predictor's
+    six-feature layout and four targets. Rows of other project types,
+    unknown locations, non-positive demand or competition and outliers are
+    dropped per chunk. Missing demand or competition columns default to a
+    neutral 1.0. The effective ratio feature is
+    looked up in building_ratios (the shared BUILDING_RATIOS unless given) for
+    project_type, or per row from the project_type column.
+
+    Pass an instance as `data` to UnifiedRealEstatePredictor.train_project_type.
+    """
+
+    def __init__(self, path: str, location_prices: Dict[str, float],
+                 project_type: Optional[ProjectType] = None,
+                 columns: Optional[Dict[str, str]] = None,
+                 chunksize: int = 100_000,
+                 max_price_deviation: float = 3.0,
+                 building_ratios: Optional[RatioTable] = None):
+        self.path = path
+        self.location_prices = location_prices
+        self.project_type = project_type
+        self.columns = columns or {}
+        self.chunksize = chunksize
+        # Land cost per sqm may differ from the location's reference price by at most this factor
+        self.max_price_deviation = max_price_deviation
+        self.building_ratios = building_ratios or BUILDING_RATIOS
+        self.rows_read = 0
+        self.rows_kept = 0
+
+    def _raw_chunks(self) -> Iterator[pd.DataFrame]:
+        if os.path.splitext(self.path)[1].lower() in ('.parquet', '.pq'):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("Reading Parquet transaction exports requires pyarrow") from None
+            for batch in pq.ParquetFile(self.path).iter_batches(batch_size=self.chunksize):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(self.path, chunksize=self.chunksize)
+
+    def _to_arrays(self, chunk: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        chunk = chunk.rename(columns=self.columns)
+        missing = [column for column in REQUIRED_COLUMNS if column not in chunk]
+        if missing:
+            raise ValueError(f"{self.path} is missing columns: {', '.join(missing)}")
+        if self.project_type is not None and 'project_type' in chunk:
+            chunk = chunk[chunk['project_type'].map(_to_project_type) == self.project_type]
+
+        n_rows = len(chunk)
+        location_price = chunk['location'].map(self.location_prices).to_numpy(dtype=float)
+        land_area = pd.to_numeric(chunk['land_area'], errors='coerce').to_numpy(dtype=float)
+        floors = pd.to_numeric(chunk['floors'], errors='coerce').to_numpy(dtype=float)
+        demand = (pd.to_numeric(chunk['demand'], errors='coerce').to_numpy(dtype=float)
+                  if 'demand' in chunk else np.ones(n_rows))
+        competition = (pd.to_numeric(chunk['competition'], errors='coerce').to_numpy(dtype=float)
+                       if 'competition' in chunk else np.ones(n_rows))
+        y = np.column_stack([pd.to_numeric(chunk[column], errors='coerce').to_numpy(dtype=float)
+                             for column in TARGET_COLUMNS]) if n_rows else np.empty((0, 4))
+
+        # Vectorized validity and outlier filter
+        valid = np.isfinite(location_price) & np.isfinite(land_area) & np.isfinite(demand) & np.isfinite(competition)
+        valid &= (demand > 0) & (competition > 0)
+        valid &= np.isfinite(y).all(axis=1) & (y > 0).all(axis=1)
+        valid &= (land_area > 0) & (floors >= 1) & (floors <= MAX_FLOORS) & (floors == np.round(floors))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_ratio = y[:, 0] / (location_price * land_area)
+        valid &= (price_ratio >= 1 / self.max_price_deviation) & (price_ratio <= self.max_price_deviation)
+
+        floors = np.where(valid, floors, 1).astype(int)
+        if self.project_type is None and 'project_type' in chunk:
+            project_type = chunk['project_type'].map(_to_project_type).map(PROJECT_TYPE_CODES).to_numpy()
+        else:
+            project_type = self.project_type
+        effective_ratio = self.building_ratios.gather_effective(project_type, floors)
+        X = np.column_stack([location_price, land_area, floors, effective_ratio, demand, competition])
+        return X[valid], y[valid]
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        self.rows_read = self.rows_kept = 0
+        for chunk in self._raw_chunks():
+            X, y = self._to_arrays(chunk)
+            self.rows_read += len(chunk)
+            self.rows_kept += len(X)
+            yield X, y
@@ -0,0 +1,155 @@
+import math
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from predictor import UnifiedRealEstatePredictor, _init_training_worker
+from project_types import ProjectType
+
+# Candidate values per hyperparameter; trials draw random combinations.
+# The epoch count is not drawn: it is the budget that successive halving hands out.
+SEARCH_SPACE = {
+    'layers': [[32, 16], [64, 32], [64, 32, 16], [128, 64, 32], [128, 64, 32, 16]],
+    'learning_rate': [0.0003, 0.001, 0.003, 0.01],
+    'batch_size': [16, 32, 64, 128],
+}
+
+
+def _sample_configs(rng: np.random.Generator, n_trials: int, space: dict) -> list:
+    """Draw up to n_trials distinct configurations from space"""
+    n_combinations = math.prod(len(values) for values in space.values())
+    configs = []
+    while len(configs) < min(n_trials, n_combinations):
+        config = {name: values[rng.integers(len(values))] for name, values in space.items()}
+        if config not in configs:
+            configs.append(config)
+    return configs
+
+
+def _run_trial(X_path, y_path, config, weights, epochs, seed, patience):
+    """Train one trial for `epochs` more epochs, starting from weights if given.
+
+    Returns the best weights, their validation loss, the epoch they came from
+    and whether early stopping ended the run.
+    """
+    X = np.load(X_path, mmap_mode='r')
+    y = np.load(y_path, mmap_mode='r')
+    predictor = UnifiedRealEstatePredictor(seed=seed)
+    model = predictor._initialize_model(X.shape[1], config['layers'], config['learning_rate'])
+    if weights is not None:
+        model.set_weights(weights)
+    # EarlyStopping restores the best epoch's weights when training ends. Without patience it gets
+    # one that never fires, so the returned weights always match the val_loss the trial is ranked by
+    val_loss = predictor._fit(model, X, y, epochs, batch_size=config['batch_size'],
+                              patience=epochs if patience is None else patience).history['val_loss']
+    best = int(np.argmin(val_loss))
+    return model.get_weights(), float(val_loss[best]), best + 1, len(val_loss) < epochs
+
+
+def tune(predictor: UnifiedRealEstatePredictor,
+         project_types: Optional[Iterable[ProjectType]] = None,
+         n_trials: int = 12, min_epochs: int = 10, max_epochs: int = 90, eta: int = 3,
+         parallel: int = 1, n_samples: int = 1000, patience: Optional[int] = 5,
+         space: Optional[dict] = None, seed: Optional[int] = None) -> Dict[ProjectType, pd.DataFrame]:
+    """Search layer widths, learning rate, batch size and epochs for each project type.
+
+    Trials run by successive halving: every trial trains for `min_epochs`, then
+    only the best 1/eta by validation loss continue, for eta times as many
+    epochs, until `max_epochs`. Survivors resume from their weights. Trials of
+    all project types share one pool of `parallel` processes and read the same
+    memory-mapped training set of their type.
+
+    The best configuration per type is stored in predictor.hyperparameters, so
+    later training builds and fits models with it. Returns every trial per
+    type, sorted by validation loss. Only Keras predictors have these
+    hyperparameters to tune.
+    """
+    if predictor.estimator != 'keras':
+        raise ValueError(f"tune searches Keras hyperparameters; the {predictor.estimator!r} estimator has none")
+    project_types = list(project_types or ProjectType)
+    space = space or SEARCH_SPACE
+    rng = np.random.default_rng(seed if seed is not None else predictor.seed)
+
+    budgets = [min_epochs]
+    while budgets[-1] < max_epochs:
+        budgets.append(min(budgets[-1] * eta, max_epochs))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trials = []
+        for project_type in project_types:
+            X, y = predictor._training_data(project_type, n_samples)
+            if isinstance(X, np.memmap):
+                X_path, y_path = X.filename, y.filename
+            else:
+                X_path = os.path.join(tmp_dir, f"{project_type.name}_X.npy")
+                y_path = os.path.join(tmp_dir, f"{project_type.name}_y.npy")
+                np.save(X_path, X)
+                np.save(y_path, y)
+            for config in _sample_configs(rng, n_trials, space):
+                trials.append({'project_type': project_type, 'config': config, 'paths': (X_path, y_path),
+                               'seed': int(rng.integers(2**31)), 'weights': None, 'val_loss': np.inf,
+                               'epochs': 0, 'trained': 0, 'rung': 0, 'converged': False})
+
+        pool = None
+        if parallel > 1:
+            threads = max(1, (os.cpu_count() or 1) // parallel)
+            pool = ProcessPoolExecutor(max_workers=parallel,
+                                       mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=_init_training_worker,
+                                       initargs=(threads,))
+        try:
+            alive = trials
+            for rung, budget in enumerate(budgets):
+                running = [trial for trial in alive if not trial['converged']]
+                jobs = [(trial['paths'][0], trial['paths'][1], trial['config'], trial['weights'],
+                         budget - trial['trained'], trial['seed'], patience) for trial in running]
+                if pool is None:
+                    results = [_run_trial(*job) for job in jobs]
+                else:
+                    results = [future.result() for future in [pool.submit(_run_trial, *job) for job in jobs]]
+                for trial, (weights, val_loss, best_epoch, stopped) in zip(running, results):
+                    if val_loss < trial['val_loss']:
+                        trial['val_loss'] = val_loss
+                        trial['epochs'] = trial['trained'] + best_epoch
+                        trial['weights'] = weights
+                    trial['trained'] = budget
+                    trial['rung'] = rung
+                    trial['converged'] = stopped
+
+                if rung == len(budgets) - 1:
+                    break
+                # Prune: keep the best 1/eta of each project type's trials
+                survivors = []
+                for project_type in project_types:
+                    group = sorted((trial for trial in alive if trial['project_type'] == project_type),
+                                   key=lambda trial: trial['val_loss'])
+                    survivors.extend(group[:max(1, len(group) // eta)])
+                kept = {id(trial) for trial in survivors}
+                for trial in alive:
+                    if id(trial) not in kept:
+                        trial['weights'] = None
+                alive = survivors
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    results = {}
+    for project_type in project_types:
+        rows = [{**trial['config'], 'epochs': trial['epochs'], 'val_loss': trial['val_loss'],
+                 'rung': trial['rung']}
+                for trial in trials if trial['project_type'] == project_type]
+        table = pd.DataFrame(rows).sort_values('val_loss', ignore_index=True)
+        best = table.iloc[0]
+        predictor.hyperparameters[project_type] = {
+            'layers': list(best['layers']),
+            'learning_rate': float(best['learning_rate']),
+            'batch_size': int(best['batch_size']),
+            'epochs': int(best['epochs'])
+        }
+        results[project_type] = table
+    return results